@@ -0,0 +1,543 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+from time import perf_counter_ns
+
+from aoc import (
+    batch,
+    bench,
+    cache,
+    generators,
+    inputs,
+    profiling,
+    registry,
+    runner,
+    scaling,
+    server,
+)
+
+
+def read_input(
+    path: str | None, day: int, as_buffer: bool = False
+) -> str | inputs.Buffer:
+    """the input text, or its bytes mapped in memory if `as_buffer`"""
+    if path == "-":
+        return sys.stdin.buffer.read() if as_buffer else sys.stdin.read()
+
+    input_path = Path(path) if path is not None else registry.default_input_path(day)
+    if as_buffer:
+        # left mapped until the process exits
+        return inputs.MappedInput(input_path).data
+
+    with open(input_path, mode="r", encoding="utf-8") as file:
+        return file.read()
+
+
+def cmd_list(args: argparse.Namespace) -> int:
+    for solution in registry.discover():
+        print(solution.name)
+        for engine in solution.engines:
+            print(solution.with_engine(engine).name)
+
+    return 0
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    if args.both and args.part is not None:
+        raise SystemExit("--both answers every part, it can't be given a part")
+
+    solutions = registry.select(args.day, args.part, both=args.both)
+
+    if args.engine is not None:
+        solutions = [
+            solution.with_engine(args.engine)
+            for solution in solutions
+            if args.engine in solution.engines
+        ]
+        if not solutions:
+            raise SystemExit(f"no selected solution has a {args.engine} engine")
+
+    if args.input is not None and len({s.day for s in solutions}) > 1:
+        raise SystemExit("--input can only be used when running a single day")
+
+    if args.mmap and args.jobs != 1:
+        raise SystemExit("--mmap can't be used with worker processes")
+
+    days_inputs: dict[int, str | inputs.Buffer] = {}
+    for solution in solutions:
+        if solution.day not in days_inputs:
+            days_inputs[solution.day] = read_input(
+                args.input, solution.day, args.mmap and solution.accepts_buffer
+            )
+
+    jobs = [(solution, days_inputs[solution.day]) for solution in solutions]
+
+    start = perf_counter_ns()
+
+    if args.jobs == 1:
+        results = []
+        for solution, input in jobs:
+            results.append(
+                runner.run(
+                    solution,
+                    input,
+                    args.warmup,
+                    args.repeat,
+                    args.phases,
+                    args.memory,
+                    get_cache(args),
+                    get_profile_options(args),
+                )
+            )
+            print_result(results[-1], args.json)
+    else:
+        # results are only reported once everything completed, in days order
+        results = list(
+            runner.run_parallel(
+                jobs,
+                args.warmup,
+                args.repeat,
+                args.phases,
+                args.memory,
+                get_cache(args),
+                get_profile_options(args),
+                max_workers=args.jobs or None,
+                timings=runner.load_timings(),
+            )
+        )
+        results.sort(key=lambda result: result.solution)
+        for result in results:
+            print_result(result, args.json)
+
+    wall_time = perf_counter_ns() - start
+    runner.save_timings(results)
+
+    if not args.json and len(results) > 1:
+        total = sum(result.median_ns for result in results)
+        print(
+            f"total: wall time {runner.format_ns(wall_time)}"
+            f" | sum of medians {runner.format_ns(total)}"
+        )
+
+    return 0
+
+
+def get_cache(args: argparse.Namespace) -> cache.Cache | None:
+    if args.cache is None:
+        return None
+
+    return cache.Cache(Path(args.cache), args.cache_max_mb * 1024 * 1024)
+
+
+def get_profile_options(args: argparse.Namespace) -> profiling.ProfileOptions | None:
+    if args.profile is None:
+        return None
+
+    return profiling.ProfileOptions(
+        args.profile,
+        Path(args.profile_dir),
+        args.profile_format,
+        args.profile_interval_ms / 1000,
+    )
+
+
+def print_result(result: runner.RunResult, as_json: bool) -> None:
+    if as_json:
+        print(json.dumps(result.to_dict()), flush=True)
+    else:
+        print(runner.format_result(result), flush=True)
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    solution = registry.Solution(args.day, args.part)
+    if solution not in registry.discover():
+        raise SystemExit(f"no solution {solution.name}")
+
+    paths = batch.find_inputs(args.inputs)
+    if not paths:
+        raise SystemExit(f"no input found for {args.inputs}")
+
+    errors = 0
+    for result in batch.run_batch(
+        solution,
+        paths,
+        max_workers=args.jobs or None,
+        cache=get_cache(args),
+        mapped=args.mmap,
+    ):
+        errors += result.error is not None
+        print(json.dumps(result.to_dict()), flush=True)
+
+    return 1 if errors else 0
+
+
+def cmd_stream(args: argparse.Namespace) -> int:
+    solution = registry.Solution(args.day, args.part)
+    if not solution.accepts_stream:
+        raise SystemExit(f"{solution.name} can't solve a stream of lines")
+
+    solver = solution.get_solver(stream=True)
+
+    # files and stdin are read one buffered line at a time, never as a whole
+    if args.input in (None, "-"):
+        answer = solver(inputs.strip_newlines(sys.stdin.buffer))
+    else:
+        with open(args.input, mode="rb") as file:
+            answer = solver(inputs.strip_newlines(file))
+
+    print(json.dumps(answer) if args.json else f"{solution.name}: {answer = }")
+
+    return 0
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    server.serve(args.host, args.port, max_workers=args.jobs or None)
+
+    return 0
+
+
+def cmd_client(args: argparse.Namespace) -> int:
+    solutions = registry.select(args.day, args.part)
+
+    if args.input in (None, "-"):
+        data = sys.stdin.buffer.read()
+    else:
+        with open(args.input, mode="rb") as file:
+            data = file.read()
+
+    with server.Client(args.host, args.port) as client:
+        for solution in solutions:
+            start = perf_counter_ns()
+            result = client.solve(solution, data)
+            round_trip_ns = perf_counter_ns() - start
+
+            print(
+                f"{solution.name}: answer = {result.answer}"
+                f" | solve {runner.format_ns(result.time_ns)}"
+                f" | round trip {runner.format_ns(round_trip_ns)}",
+                flush=True,
+            )
+
+    return 0
+
+
+def cmd_generate(args: argparse.Namespace) -> int:
+    days = [args.day] if args.day is not None else list(generators.DAYS)
+
+    if args.output is None and len(days) > 1:
+        raise SystemExit("--output directory is needed to generate every day")
+
+    for day in days:
+        input = generators.generate(day, scale=args.scale, seed=args.seed)
+
+        if args.output is None:
+            sys.stdout.write(input)
+            continue
+
+        output = Path(args.output)
+        if len(days) > 1:
+            output.mkdir(parents=True, exist_ok=True)
+            output = output / f"day{day:02d}.txt"
+
+        with open(output, mode="w", encoding="utf-8") as file:
+            file.write(input)
+
+    return 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    baseline_path = Path(args.baseline)
+    baseline = bench.load_baseline(baseline_path)
+
+    results = []
+    regressions = 0
+
+    for solution in registry.select(args.day, args.part):
+        for scale in args.scales:
+            result = bench.bench(
+                solution,
+                scale,
+                seed=args.seed,
+                warmup=args.warmup,
+                repeat=args.repeat,
+                trace_memory=args.memory,
+            )
+            results.append(result)
+
+            comparison = bench.Comparison(result, baseline.get(result.key), args.margin)
+            regressions += comparison.is_regression
+
+            print(bench.format_comparison(comparison), flush=True)
+
+    if args.save:
+        bench.save_baseline(baseline_path, results)
+        return 0
+
+    if regressions:
+        print(f"{regressions} regression(s) against {baseline_path}")
+        return 1
+
+    return 0
+
+
+def cmd_scaling(args: argparse.Namespace) -> int:
+    failures = 0
+
+    for solution in registry.select(args.day, args.part):
+        reason = scaling.unscaled_reason(solution)
+        if reason is not None:
+            print(f"{solution.name}: skipped, {reason}", flush=True)
+            continue
+
+        try:
+            result = scaling.measure(
+                solution, args.scales, seed=args.seed, repeat=args.repeat
+            )
+        except Exception as e:
+            # some solutions only handle inputs shaped like the official ones
+            failures += 1
+            print(f"{solution.name}: failed, {type(e).__name__}: {e}", flush=True)
+            continue
+
+        if args.json:
+            print(json.dumps(result.to_dict()), flush=True)
+        else:
+            print(scaling.format_scaling(result), flush=True)
+
+    return 1 if failures else 0
+
+
+def parse_scales(value: str) -> list[float]:
+    return [float(scale) for scale in value.split(",")]
+
+
+def add_mmap_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="hand the days supporting it their input file mapped in memory, as bytes",
+    )
+
+
+def add_address_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--host", default=server.DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=server.DEFAULT_PORT)
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=str(cache.DEFAULT_CACHE_DIR),
+        metavar="DIR",
+        help="answer from (and fill) an on-disk cache (default: %(const)s)",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=cache.DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="size beyond which the least recently used entries are evicted",
+    )
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aoc", description="AoC 2023 runner")
+    subparsers = parser.add_subparsers(required=True)
+
+    list_parser = subparsers.add_parser("list", help="list the available solutions")
+    list_parser.set_defaults(func=cmd_list)
+
+    run_parser = subparsers.add_parser("run", help="run and time solutions")
+    run_parser.add_argument("day", type=int, nargs="?", help="all days if omitted")
+    run_parser.add_argument("part", type=int, nargs="?", help="all parts if omitted")
+    run_parser.add_argument(
+        "-i",
+        "--input",
+        help="input file, `-` for stdin (default: ./inputs/dayNN.txt)",
+    )
+    run_parser.add_argument(
+        "--both",
+        action="store_true",
+        help="answer both parts of each day at once, parsing the input once",
+    )
+    run_parser.add_argument(
+        "--engine",
+        help="run the alternative solver of that name (numpy...) of the solutions"
+        " having one, see `aoc list`",
+    )
+    run_parser.add_argument("--warmup", type=int, default=0, help="unmeasured runs")
+    run_parser.add_argument("--repeat", type=int, default=1, help="measured runs")
+    run_parser.add_argument("--json", action="store_true", help="JSON lines output")
+    run_parser.add_argument(
+        "--phases",
+        action="store_true",
+        help="report the time spent in the phases (parsing...) solutions mark",
+    )
+    run_parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="report the peak traced memory and top allocation sites (extra runs)",
+    )
+    run_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="worker processes, slowest solutions first, 0 for one per core",
+    )
+    run_parser.add_argument(
+        "--profile",
+        choices=profiling.MODES,
+        help="add an untimed profiled run: sampled stacks for flame graphs, or"
+        " the top functions by cumulative time under cProfile",
+    )
+    run_parser.add_argument(
+        "--profile-dir",
+        default=str(profiling.DEFAULT_PROFILES_DIR),
+        help="where sampled profiles are written (default: %(default)s)",
+    )
+    run_parser.add_argument(
+        "--profile-format",
+        choices=list(profiling.FORMATS),
+        default="speedscope",
+        help="format of sampled profiles (default: %(default)s)",
+    )
+    run_parser.add_argument(
+        "--profile-interval-ms",
+        type=float,
+        default=1.0,
+        help="sampling interval (default: %(default)s)",
+    )
+    add_mmap_argument(run_parser)
+    add_cache_arguments(run_parser)
+    run_parser.set_defaults(func=cmd_run)
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="solve many inputs of a solution in one process, as JSON lines"
+    )
+    batch_parser.add_argument("day", type=int)
+    batch_parser.add_argument("part", type=int)
+    batch_parser.add_argument("inputs", help="directory or glob pattern of inputs")
+    batch_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="worker processes, 0 for one per core",
+    )
+    add_mmap_argument(batch_parser)
+    add_cache_arguments(batch_parser)
+    batch_parser.set_defaults(func=cmd_batch)
+
+    stream_parser = subparsers.add_parser(
+        "stream", help="solve an input read line by line, of any size"
+    )
+    stream_parser.add_argument("day", type=int)
+    stream_parser.add_argument("part", type=int)
+    stream_parser.add_argument(
+        "-i", "--input", help="input file, `-` for stdin (default: stdin)"
+    )
+    stream_parser.add_argument("--json", action="store_true", help="JSON output")
+    stream_parser.set_defaults(func=cmd_stream)
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="solve inputs sent over HTTP with every solution imported"
+    )
+    add_address_arguments(serve_parser)
+    serve_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="worker processes, 0 for one per core (default: %(default)s)",
+    )
+    serve_parser.set_defaults(func=cmd_serve)
+
+    client_parser = subparsers.add_parser(
+        "client", help="solve an input with a running `aoc serve`"
+    )
+    client_parser.add_argument("day", type=int)
+    client_parser.add_argument("part", type=int, nargs="?", help="all parts if omitted")
+    client_parser.add_argument(
+        "-i", "--input", help="input file, `-` for stdin (default: stdin)"
+    )
+    add_address_arguments(client_parser)
+    client_parser.set_defaults(func=cmd_client)
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="generate synthetic puzzle inputs"
+    )
+    generate_parser.add_argument("day", type=int, nargs="?", help="all days if omitted")
+    generate_parser.add_argument(
+        "--scale", type=float, default=1.0, help="size relative to an official input"
+    )
+    generate_parser.add_argument("--seed", type=int, default=0)
+    generate_parser.add_argument(
+        "-o",
+        "--output",
+        help="output file, or directory when generating every day (default: stdout)",
+    )
+    generate_parser.set_defaults(func=cmd_generate)
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="benchmark solutions on generated inputs against a baseline"
+    )
+    bench_parser.add_argument("day", type=int, nargs="?", help="all days if omitted")
+    bench_parser.add_argument("part", type=int, nargs="?", help="all parts if omitted")
+    bench_parser.add_argument(
+        "--scales",
+        type=parse_scales,
+        default=list(bench.DEFAULT_SCALES),
+        help="comma separated input scales (default: %(default)s)",
+    )
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument("--warmup", type=int, default=1)
+    bench_parser.add_argument("--repeat", type=int, default=5)
+    bench_parser.add_argument(
+        "--baseline", default=str(bench.DEFAULT_BASELINE_PATH), help="baseline JSON"
+    )
+    bench_parser.add_argument(
+        "--margin",
+        type=float,
+        default=bench.DEFAULT_MARGIN,
+        help="tolerated slowdown or memory growth before failing (default: %(default)s)",
+    )
+    bench_parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="also measure the peak traced memory and gate its growth",
+    )
+    bench_parser.add_argument(
+        "--save", action="store_true", help="record the results as the new baseline"
+    )
+    bench_parser.set_defaults(func=cmd_bench)
+
+    scaling_parser = subparsers.add_parser(
+        "scaling", help="fit the growth exponent of solutions on generated inputs"
+    )
+    scaling_parser.add_argument("day", type=int, nargs="?", help="all days if omitted")
+    scaling_parser.add_argument(
+        "part", type=int, nargs="?", help="all parts if omitted"
+    )
+    scaling_parser.add_argument(
+        "--scales",
+        type=parse_scales,
+        default=list(scaling.DEFAULT_SCALES),
+        help="comma separated input scales, a geometric series (default: %(default)s)",
+    )
+    scaling_parser.add_argument("--seed", type=int, default=0)
+    scaling_parser.add_argument("--repeat", type=int, default=3)
+    scaling_parser.add_argument("--json", action="store_true", help="JSON lines output")
+    scaling_parser.set_defaults(func=cmd_scaling)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = make_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
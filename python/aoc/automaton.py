@@ -0,0 +1,84 @@
+"""Aho-Corasick automata matching many byte patterns in a single pass
+
+the trie of the patterns gets its failure links folded into a complete
+transition table, one row of 256 next states per state, so that scanning is a
+single table lookup per byte whatever the patterns. A state matches the
+patterns ending there, its own first, then the shorter ones its failure links
+lead to. Scans take any iterable of byte values, `reversed(line)` included, so
+that an automaton of the reversed patterns finds the last match of a line
+without copying it
+"""
+
+from __future__ import annotations
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+
+
+class Automaton:
+    def __init__(self, patterns: Sequence[bytes]):
+        if not all(patterns):
+            raise ValueError("patterns can't be empty")
+
+        self.patterns = list(patterns)
+
+        # the trie
+        children: list[dict[int, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+        for k, pattern in enumerate(self.patterns):
+            state = 0
+            for c in pattern:
+                if c not in children[state]:
+                    children[state][c] = len(children)
+                    children.append({})
+                    outputs.append([])
+                state = children[state][c]
+            outputs[state].append(k)
+
+        # the row of a state is the row of its failure state, with its own
+        # children, states being completed by depth so that failure rows are
+        # complete first
+        transitions = [[0] * 256 for _ in children]
+        for c, v in children[0].items():
+            transitions[0][c] = v
+
+        q = deque((v, 0) for v in children[0].values())
+        while q:
+            u, failure = q.popleft()
+            outputs[u] += outputs[failure]
+
+            failure_row = transitions[failure]
+            row = transitions[u] = failure_row.copy()
+            for c, v in children[u].items():
+                row[c] = v
+                q.append((v, failure_row[c]))
+
+        self.transitions = transitions
+        self.outputs = outputs
+
+    def reversed(self) -> Automaton:
+        """automaton of the reversed patterns, with the same indices"""
+        return Automaton([pattern[::-1] for pattern in self.patterns])
+
+    def finditer(self, values: Iterable[int]) -> Iterator[tuple[int, int]]:
+        """`(end, pattern index)` of every match, overlapping ones included, in
+        order of their end"""
+        transitions, outputs = self.transitions, self.outputs
+
+        state = 0
+        for i, c in enumerate(values):
+            state = transitions[state][c]
+            for k in outputs[state]:
+                yield i + 1, k
+
+    def first(self, values: Iterable[int]) -> int | None:
+        """index of the pattern ending first (the longest one on ties), stopping
+        there"""
+        transitions, outputs = self.transitions, self.outputs
+
+        state = 0
+        for c in values:
+            state = transitions[state][c]
+            if outputs[state]:
+                return outputs[state][0]
+
+        return None
@@ -0,0 +1,126 @@
+"""solving many inputs of the same solution in one process
+
+the solution module (and whatever it precompiles at import) is loaded once per
+process instead of once per input, which is most of the cost for the fast days
+"""
+
+from __future__ import annotations
+import glob
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any
+
+from aoc.cache import Cache, cached_solver
+from aoc.inputs import Buffer, MappedInput
+from aoc.registry import Solution, Solver
+
+# inputs sent at once to a worker, small inputs are solved faster than they're sent
+CHUNK_SIZE = 16
+
+
+@dataclass
+class BatchResult:
+    solution: Solution
+    path: Path
+    answer: Any = None
+    time_ns: int = 0
+    # the exception raised when the input couldn't be solved
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "solution": self.solution.name,
+            "input": str(self.path),
+            "answer": self.answer,
+            "time_ns": self.time_ns,
+            "error": self.error,
+        }
+
+
+def find_inputs(pattern: str) -> list[Path]:
+    """every file of a directory, or the files matching a glob pattern"""
+    if Path(pattern).is_dir():
+        paths = [path for path in Path(pattern).iterdir() if path.is_file()]
+    else:
+        paths = [Path(path) for path in glob.glob(pattern, recursive=True)]
+
+    return sorted(paths)
+
+
+def time_solve(solver: Solver, input: str | Buffer) -> tuple[Any, int]:
+    start = perf_counter_ns()
+    answer = solver(input)
+
+    return answer, perf_counter_ns() - start
+
+
+def solve_file(
+    solution: Solution, solver: Solver, path: Path, mapped: bool = False
+) -> BatchResult:
+    """`mapped` hands solutions accepting buffers the file mapped in memory"""
+    try:
+        if mapped and solution.accepts_buffer:
+            with MappedInput(path) as input:
+                answer, time_ns = time_solve(solver, input.data)
+        else:
+            with open(path, mode="r", encoding="utf-8") as file:
+                text = solution.prepare(file.read())
+
+            answer, time_ns = time_solve(solver, text)
+    except Exception as e:
+        return BatchResult(solution, path, error=f"{type(e).__name__}: {e}")
+
+    return BatchResult(solution, path, answer, time_ns)
+
+
+# state of the pool workers, set up once by `init_worker`
+_worker_solution: Solution | None = None
+_worker_solver: Solver | None = None
+_worker_mapped = False
+
+
+def get_solver(solution: Solution, cache: Cache | None) -> Solver:
+    solver = solution.get_solver()
+    return solver if cache is None else cached_solver(solution, solver, cache)
+
+
+def init_worker(solution: Solution, cache: Cache | None, mapped: bool) -> None:
+    global _worker_solution, _worker_solver, _worker_mapped
+
+    _worker_solution = solution
+    _worker_solver = get_solver(solution, cache)
+    _worker_mapped = mapped
+
+
+def solve_file_in_worker(path: Path) -> BatchResult:
+    assert _worker_solution is not None and _worker_solver is not None
+    return solve_file(_worker_solution, _worker_solver, path, _worker_mapped)
+
+
+def run_batch(
+    solution: Solution,
+    paths: Iterable[Path],
+    max_workers: int | None = 1,
+    cache: Cache | None = None,
+    mapped: bool = False,
+) -> Iterator[BatchResult]:
+    """solves every input file, yielding results in the order of `paths`
+
+    `max_workers` other than 1 spreads the inputs over a process pool, None
+    meaning one worker per core
+    """
+    if max_workers == 1:
+        solver = get_solver(solution, cache)
+        for path in paths:
+            yield solve_file(solution, solver, path, mapped)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=init_worker,
+        initargs=(solution, cache, mapped),
+    ) as executor:
+        yield from executor.map(solve_file_in_worker, paths, chunksize=CHUNK_SIZE)
@@ -0,0 +1,179 @@
+from __future__ import annotations
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from aoc import generators, memory, runner
+from aoc.generators.common import count_cells
+from aoc.registry import Solution
+
+DEFAULT_BASELINE_PATH = Path("./benchmarks/baseline.json")
+DEFAULT_SCALES = (0.25, 1.0)
+DEFAULT_MARGIN = 0.25
+
+# days whose inputs are grids, their throughput is also reported in cells/s
+GRID_DAYS = frozenset({3, 10, 11, 13, 14, 16, 17, 21, 23})
+
+
+@dataclass
+class BenchResult:
+    run: runner.RunResult
+    scale: float
+    seed: int
+    input_bytes: int
+    cells: int | None
+    peak_bytes: int | None = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.run.solution.name}@{self.scale:g}"
+
+    @property
+    def bytes_per_s(self) -> float:
+        return self.input_bytes / self.run.median_ns * 1e9
+
+    @property
+    def cells_per_s(self) -> float | None:
+        return None if self.cells is None else self.cells / self.run.median_ns * 1e9
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "solution": self.run.solution.name,
+            "scale": self.scale,
+            "seed": self.seed,
+            "answer": str(self.run.answer),
+            "input_bytes": self.input_bytes,
+            "cells": self.cells,
+            "min_ns": self.run.min_ns,
+            "median_ns": self.run.median_ns,
+            "p95_ns": self.run.p95_ns,
+            "bytes_per_s": self.bytes_per_s,
+            "cells_per_s": self.cells_per_s,
+            "peak_bytes": self.peak_bytes,
+        }
+
+
+@dataclass
+class Comparison:
+    result: BenchResult
+    baseline: dict[str, Any] | None
+    margin: float
+
+    @property
+    def slowdown(self) -> float | None:
+        """relative loss of throughput against the baseline, 0.1 meaning 10% slower"""
+        if self.baseline is None:
+            return None
+
+        return self.baseline["bytes_per_s"] / self.result.bytes_per_s - 1
+
+    @property
+    def memory_growth(self) -> float | None:
+        """relative growth of the peak memory against the baseline"""
+        if self.baseline is None or self.result.peak_bytes is None:
+            return None
+
+        baseline_peak = self.baseline.get("peak_bytes")
+        if not baseline_peak:
+            return None
+
+        return self.result.peak_bytes / baseline_peak - 1
+
+    @property
+    def answer_changed(self) -> bool:
+        return (
+            self.baseline is not None
+            and self.baseline["seed"] == self.result.seed
+            and self.baseline["answer"] != str(self.result.run.answer)
+        )
+
+    @property
+    def is_regression(self) -> bool:
+        slowdown = self.slowdown
+        memory_growth = self.memory_growth
+        return (
+            self.answer_changed
+            or (slowdown is not None and slowdown > self.margin)
+            or (memory_growth is not None and memory_growth > self.margin)
+        )
+
+
+def bench(
+    solution: Solution,
+    scale: float,
+    seed: int = 0,
+    warmup: int = 1,
+    repeat: int = 5,
+    trace_memory: bool = False,
+) -> BenchResult:
+    input = generators.generate(solution.day, scale=scale, seed=seed)
+    result = runner.run(solution, input, warmup=warmup, repeat=repeat)
+
+    peak_bytes = None
+    if trace_memory:
+        _, peak_bytes = memory.measure_peak(
+            solution.get_solver(), solution.prepare(input)
+        )
+
+    return BenchResult(
+        run=result,
+        scale=scale,
+        seed=seed,
+        input_bytes=len(input.encode()),
+        cells=count_cells(input) if solution.day in GRID_DAYS else None,
+        peak_bytes=peak_bytes,
+    )
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, Any]]:
+    if not path.exists():
+        return {}
+
+    with open(path, mode="r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_baseline(path: Path, results: list[BenchResult]) -> None:
+    baseline = load_baseline(path)
+    baseline.update({result.key: result.to_dict() for result in results})
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, mode="w", encoding="utf-8") as file:
+        json.dump(dict(sorted(baseline.items())), file, indent=2)
+        file.write("\n")
+
+
+def format_rate(rate: float, unit: str) -> str:
+    for prefix, factor in (("G", 1e9), ("M", 1e6), ("k", 1e3)):
+        if rate >= factor:
+            return f"{rate / factor:.2f}{prefix}{unit}/s"
+
+    return f"{rate:.2f}{unit}/s"
+
+
+def format_comparison(comparison: Comparison) -> str:
+    result = comparison.result
+
+    line = (
+        f"{result.key}: median {runner.format_ns(result.run.median_ns)}"
+        f" | {format_rate(result.bytes_per_s, 'B')}"
+    )
+
+    if result.cells_per_s is not None:
+        line += f" | {format_rate(result.cells_per_s, 'cells')}"
+
+    if comparison.slowdown is not None:
+        line += f" | {comparison.slowdown:+.1%} vs baseline"
+
+    if result.peak_bytes is not None:
+        line += f" | peak {memory.format_bytes(result.peak_bytes)}"
+        if comparison.memory_growth is not None:
+            line += f" ({comparison.memory_growth:+.1%})"
+
+    if comparison.answer_changed:
+        line += " | ANSWER CHANGED"
+    elif comparison.is_regression:
+        line += " | REGRESSION"
+
+    return line
@@ -0,0 +1,204 @@
+"""on-disk content-addressed cache of answers and parsed structures
+
+entries are keyed by a hash of what produced them: the solution (or function),
+the code version (hash of the sources it depends on) and the input, so editing
+a solution or its input never serves a stale entry
+
+solutions opt into caching an expensive intermediate structure with `memoize`,
+which does nothing unless caching was enabled, e.g. with `aoc run --cache`
+"""
+
+from __future__ import annotations
+import functools
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from aoc.inputs import Buffer, to_bytes
+from aoc.registry import ROOT, Solution, Solver
+
+DEFAULT_CACHE_DIR = Path("./.aoc/cache")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# bump when the layout of the entries changes
+FORMAT_VERSION = 1
+
+_MISSING = object()
+
+
+class Cache:
+    """pickled values in a directory, least recently used ones being evicted
+    once the directory grows beyond `max_bytes`"""
+
+    def __init__(
+        self, directory: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        path = self._path(key)
+
+        try:
+            with open(path, mode="rb") as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return default
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # written by an incompatible version of a class, treated as a miss
+            path.unlink(missing_ok=True)
+            return default
+
+        # the modification time tracks the last use, for the LRU eviction
+        os.utime(path)
+
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # written aside then renamed, so that concurrent readers never see a
+        # partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, mode="wb") as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for path in self.directory.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # evicted by another process meanwhile
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.pickle"):
+            path.unlink(missing_ok=True)
+
+
+def hash_bytes(*parts: Buffer) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(len(part).to_bytes(8, "little"))
+        h.update(part)
+
+    return h.hexdigest()
+
+
+@functools.cache
+def file_version(path: Path) -> str:
+    return hash_bytes(path.read_bytes())
+
+
+@functools.cache
+def shared_code_version() -> str:
+    """version of the `aoc` package sources solutions may rely on"""
+    paths = sorted(
+        path
+        for path in (ROOT / "aoc").rglob("*.py")
+        if "generators" not in path.relative_to(ROOT / "aoc").parts
+    )
+
+    return hash_bytes(*(file_version(path).encode() for path in paths))
+
+
+def code_version(*paths: Path) -> str:
+    return hash_bytes(
+        *(file_version(path).encode() for path in paths),
+        shared_code_version().encode(),
+    )
+
+
+def answer_key(solution: Solution, input: str | Buffer) -> str:
+    return hash_bytes(
+        f"answer/{FORMAT_VERSION}/{solution.name}".encode(),
+        code_version(*solution.source_paths).encode(),
+        to_bytes(input),
+    )
+
+
+def cached_solver(solution: Solution, solver: Solver, cache: Cache) -> Solver:
+    """`solver` answering from the cache when it already solved that input, and
+    memoizing the structures solutions mark while it solves new ones"""
+
+    @functools.wraps(solver)
+    def solve(input: str | Buffer) -> Any:
+        key = answer_key(solution, input)
+
+        answer = cache.get(key, _MISSING)
+        if answer is not _MISSING:
+            return answer
+
+        with enabled(cache):
+            answer = solver(input)
+
+        cache.set(key, answer)
+        return answer
+
+    return solve
+
+
+_cache: Cache | None = None
+
+
+@contextmanager
+def enabled(cache: Cache) -> Iterator[Cache]:
+    global _cache
+
+    previous, _cache = _cache, cache
+    try:
+        yield cache
+    finally:
+        _cache = previous
+
+
+def memoize[**P, R](func: Callable[P, R]) -> Callable[P, R]:
+    """caches the (picklable) results of `func` on disk, keyed by its pickled
+    arguments, while caching is enabled"""
+    path = Path(sys.modules[func.__module__].__file__ or "")
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if _cache is None:
+            return func(*args, **kwargs)
+
+        key = hash_bytes(
+            f"memo/{FORMAT_VERSION}/{func.__module__}.{func.__qualname__}".encode(),
+            code_version(path).encode(),
+            pickle.dumps((args, kwargs), protocol=pickle.HIGHEST_PROTOCOL),
+        )
+
+        result = _cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = func(*args, **kwargs)
+            _cache.set(key, result)
+
+        return result
+
+    return wrapper
@@ -0,0 +1,20 @@
+import importlib
+from random import Random
+from types import ModuleType
+
+DAYS = range(1, 26)
+
+
+def get_generator(day: int) -> ModuleType:
+    if day not in DAYS:
+        raise LookupError(f"no generator for day {day}")
+
+    return importlib.import_module(f"aoc.generators.day{day:02d}")
+
+
+def generate(day: int, scale: float = 1.0, seed: int = 0) -> str:
+    """generates a puzzle input about `scale` times the size of the official one"""
+    if scale <= 0:
+        raise ValueError("scale must be positive")
+
+    return get_generator(day).generate(Random(seed), scale)
@@ -0,0 +1,33 @@
+from math import sqrt
+from random import Random
+from string import ascii_lowercase
+
+
+def scaled_count(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+
+def scaled_side(base: int, scale: float) -> int:
+    """side of a square grid having about `scale` times the cells of a `base` sided one"""
+    return max(1, round(base * sqrt(scale)))
+
+
+def random_names(
+    rng: Random, count: int, length: int, alphabet: str = ascii_lowercase
+) -> list[str]:
+    if count > len(alphabet) ** length:
+        raise ValueError(f"can't make {count} distinct names of length {length}")
+
+    names: set[str] = set()
+    while len(names) < count:
+        names.add("".join(rng.choice(alphabet) for _ in range(length)))
+
+    return rng.sample(sorted(names), count)
+
+
+def count_lines(input: str) -> int:
+    return len(input.splitlines())
+
+
+def count_cells(input: str) -> int:
+    return sum(len(line) for line in input.splitlines())
@@ -0,0 +1,35 @@
+from random import Random
+
+from aoc.generators.common import count_lines, scaled_count
+
+# what `size` counts, the n of the complexity reports
+UNIT = "lines"
+
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def generate_line(rng: Random) -> str:
+    chunks = [rng.choice("123456789")]  # guarantees a digit for part 1
+
+    for _ in range(rng.randint(1, 8)):
+        match rng.randrange(3):
+            case 0:
+                chunks.append(rng.choice("123456789"))
+            case 1:
+                chunks.append(rng.choice(WORDS))
+            case _:
+                chunks.append("".join(rng.choices(LETTERS, k=rng.randint(1, 6))))
+
+    rng.shuffle(chunks)
+
+    return "".join(chunks)
+
+
+def generate(rng: Random, scale: float) -> str:
+    lines = [generate_line(rng) for _ in range(scaled_count(1000, scale))]
+    return "\n".join(lines) + "\n"
+
+
+def size(input: str) -> int:
+    return count_lines(input)
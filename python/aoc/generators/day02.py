@@ -0,0 +1,26 @@
+from random import Random
+
+from aoc.generators.common import count_lines, scaled_count
+
+UNIT = "games"
+
+COLORS = ["red", "green", "blue"]
+
+
+def generate_draw(rng: Random) -> str:
+    colors = rng.sample(COLORS, rng.randint(1, 3))
+    return ", ".join(f"{rng.randint(1, 20)} {color}" for color in colors)
+
+
+def generate(rng: Random, scale: float) -> str:
+    lines = []
+
+    for game_id in range(1, scaled_count(100, scale) + 1):
+        draws = "; ".join(generate_draw(rng) for _ in range(rng.randint(1, 6)))
+        lines.append(f"Game {game_id}: {draws}")
+
+    return "\n".join(lines) + "\n"
+
+
+def size(input: str) -> int:
+    return count_lines(input)
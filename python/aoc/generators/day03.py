@@ -0,0 +1,37 @@
+from random import Random
+
+from aoc.generators.common import count_cells, scaled_side
+
+UNIT = "cells"
+
+SYMBOLS = "*#+$/=%@&-"
+
+
+def generate_row(rng: Random, width: int) -> list[str]:
+    row = ["."] * width
+
+    j = rng.randint(0, 3)
+    while j < width:
+        if rng.random() < 0.5:
+            digits = str(rng.randint(1, 999))
+            if j + len(digits) > width:
+                break
+            row[j : j + len(digits)] = digits
+            j += len(digits)
+        elif rng.random() < 0.25:
+            row[j] = rng.choice(SYMBOLS)
+            j += 1
+
+        j += rng.randint(1, 4)
+
+    return row
+
+
+def generate(rng: Random, scale: float) -> str:
+    side = scaled_side(140, scale)
+    rows = ["".join(generate_row(rng, side)) for _ in range(side)]
+    return "\n".join(rows) + "\n"
+
+
+def size(input: str) -> int:
+    return count_cells(input)
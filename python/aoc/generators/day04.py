@@ -0,0 +1,38 @@
+from random import Random
+
+from aoc.generators.common import count_lines, scaled_count
+
+UNIT = "cards"
+
+WINNING_COUNT = 10
+OBTAINED_COUNT = 25
+
+
+def format_numbers(numbers: list[int]) -> str:
+    return " ".join(f"{number:>2}" for number in numbers)
+
+
+def generate(rng: Random, scale: float) -> str:
+    cards_count = scaled_count(220, scale)
+    lines = []
+
+    for i in range(cards_count):
+        # mostly losing cards, or the copies counts grow exponentially
+        matches = rng.randint(1, 5) if rng.random() < 0.3 else 0
+        # a card can't win copies of cards past the end of the table
+        matches = min(matches, cards_count - 1 - i)
+
+        numbers = rng.sample(range(1, 100), WINNING_COUNT + OBTAINED_COUNT - matches)
+        winning = numbers[:WINNING_COUNT]
+        obtained = rng.sample(winning, matches) + numbers[WINNING_COUNT:]
+        rng.shuffle(obtained)
+
+        lines.append(
+            f"Card {i + 1:>3}: {format_numbers(winning)} | {format_numbers(obtained)}"
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def size(input: str) -> int:
+    return count_lines(input)
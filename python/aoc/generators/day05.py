@@ -0,0 +1,53 @@
+from random import Random
+
+from aoc.generators.common import scaled_count
+
+UNIT = "map ranges"
+
+TABLE_NAMES = [
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+]
+MAX_VALUE = 2**32
+
+
+def generate_table(rng: Random, entries_count: int) -> list[tuple[int, int, int]]:
+    # source ranges must not overlap, they're cut out of a partition of [0, MAX_VALUE)
+    cuts = sorted(rng.sample(range(1, MAX_VALUE), 2 * entries_count))
+    table = []
+
+    for s_start, s_end in zip(cuts[::2], cuts[1::2]):
+        length = s_end - s_start
+        d_start = rng.randrange(MAX_VALUE - length)
+        table.append((d_start, s_start, length))
+
+    rng.shuffle(table)
+
+    return table
+
+
+def generate(rng: Random, scale: float) -> str:
+    seeds = []
+    for _ in range(scaled_count(10, scale)):
+        seeds.append(rng.randrange(MAX_VALUE // 2))
+        seeds.append(rng.randint(1, MAX_VALUE // 20))
+
+    chunks = ["seeds: " + " ".join(str(seed) for seed in seeds) + "\n"]
+
+    for table_name in TABLE_NAMES:
+        table = generate_table(rng, rng.randint(1, scaled_count(40, scale)))
+        lines = "".join(f"{d} {s} {length}\n" for d, s, length in table)
+        chunks.append(f"{table_name} map:\n{lines}")
+
+    # day 5 relies on each table ending with a newline
+    return "\n".join(chunks)
+
+
+def size(input: str) -> int:
+    # every line of the maps made of numbers, the seeds line excluded
+    return sum(1 for line in input.splitlines()[1:] if line[:1].isdigit())
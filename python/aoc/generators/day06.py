@@ -0,0 +1,51 @@
+from random import Random
+
+from aoc.generators.common import scaled_count
+
+UNIT = "race time"
+# part 1 loops over each race time, which the digits of the scaled part 2 time
+# are cut into at random: their sum doesn't grow with the scale
+UNSCALED_PARTS = {1: "its race times are random cuts of the scaled part 2 time"}
+
+RACES_COUNT = 3
+
+
+def split_time(rng: Random, time: int) -> list[int] | None:
+    digits = str(time)
+
+    # cut the number so that no race time starts with a zero
+    cut_positions = [i for i in range(1, len(digits)) if digits[i] != "0"]
+    if len(cut_positions) < RACES_COUNT - 1:
+        return None
+
+    cuts = sorted(rng.sample(cut_positions, RACES_COUNT - 1))
+
+    return [int(digits[i:j]) for i, j in zip([0, *cuts], [*cuts, len(digits)])]
+
+
+def record_distance(rng: Random, time: int) -> int:
+    charge_time = rng.randint(0, time)
+    return max(0, charge_time * (time - charge_time) - 1)
+
+
+def generate(rng: Random, scale: float) -> str:
+    # part 2 loops over the concatenated time, that's the quantity being scaled
+    target = max(10 ** (RACES_COUNT - 1), scaled_count(200_000, scale))
+
+    times = None
+    while times is None:
+        times = split_time(rng, rng.randint(target, 2 * target))
+
+    distances = [record_distance(rng, time) for time in times]
+
+    width = max(len(str(value)) for value in times + distances) + 2
+    times_line = "Time:    " + "".join(f"{time:>{width}}" for time in times)
+    distances_line = "Distance:" + "".join(f"{d:>{width}}" for d in distances)
+
+    return f"{times_line}\n{distances_line}\n"
+
+
+def size(input: str) -> int:
+    # part 2 reads the times as one number and loops over it
+    times = input.splitlines()[0].split(":")[1]
+    return int(times.replace(" ", ""))
@@ -0,0 +1,21 @@
+from random import Random
+
+from aoc.generators.common import count_lines, scaled_count
+
+UNIT = "hands"
+
+CARDS = "AKQJT98765432"
+
+
+def generate(rng: Random, scale: float) -> str:
+    lines = []
+
+    for _ in range(scaled_count(1000, scale)):
+        hand = "".join(rng.choices(CARDS, k=5))
+        lines.append(f"{hand} {rng.randint(1, 1000)}")
+
+    return "\n".join(lines) + "\n"
+
+
+def size(input: str) -> int:
+    return count_lines(input)
@@ -0,0 +1,81 @@
+from random import Random
+from string import ascii_uppercase, digits
+
+from aoc.generators.common import count_lines, scaled_count
+
+UNIT = "nodes"
+
+GHOSTS_COUNT = 6
+
+
+def make_names(rng: Random, count: int) -> list[str]:
+    """names of 3 `\\w` characters, none of them ending with `A` or `Z`"""
+    alphabet = ascii_uppercase
+    if count > len(alphabet) ** 2 * (len(alphabet) - 2):
+        alphabet += digits
+
+    last_chars = [c for c in alphabet if c not in "AZ"]
+    capacity = len(alphabet) ** 2 * len(last_chars)
+    if count > capacity:
+        raise ValueError(f"day 8 inputs can't have more than {capacity} plain nodes")
+
+    names = []
+    for index in rng.sample(range(capacity), count):
+        index, last = divmod(index, len(last_chars))
+        first, second = divmod(index, len(alphabet))
+        names.append(alphabet[first] + alphabet[second] + last_chars[last])
+
+    return names
+
+
+def generate(rng: Random, scale: float) -> str:
+    instructions = "".join(rng.choices("LR", k=rng.randint(263, 307)))
+
+    # each ghost walks a loop of `length` positions ending on its `Z` node
+    # every position but the last holds two twin nodes, which one is visited
+    # depends on the instructions but the position itself doesn't
+    loop_lengths = [
+        max(
+            2,
+            round(
+                scaled_count(750, scale) / (2 * GHOSTS_COUNT) * rng.uniform(0.8, 1.2)
+            ),
+        )
+        for _ in range(GHOSTS_COUNT)
+    ]
+
+    plain_names = iter(
+        make_names(rng, sum(2 * (length - 1) for length in loop_lengths))
+    )
+    prefixes = rng.sample(
+        [
+            a + b
+            for a in ascii_uppercase
+            for b in ascii_uppercase
+            if a + b not in ("AA", "ZZ")
+        ],
+        GHOSTS_COUNT - 1,
+    )
+    ghosts = [("AAA", "ZZZ"), *((prefix + "A", prefix + "Z") for prefix in prefixes)]
+
+    neighbors: dict[str, tuple[str, str]] = {}
+
+    for (start, end), length in zip(ghosts, loop_lengths):
+        twins = [(next(plain_names), next(plain_names)) for _ in range(length - 1)]
+        positions = [[start], *twins, [end, end]]
+
+        for nodes, (left, right) in zip(positions, positions[1:]):
+            for node in nodes:
+                neighbors[node] = (left, right) if rng.random() < 0.5 else (right, left)
+
+        # from the end node, the ghost walks the loop again
+        neighbors[end] = neighbors[start]
+
+    lines = [f"{node} = ({left}, {right})" for node, (left, right) in neighbors.items()]
+    rng.shuffle(lines)
+
+    return instructions + "\n\n" + "\n".join(lines) + "\n"
+
+
+def size(input: str) -> int:
+    return count_lines(input) - 2
@@ -0,0 +1,32 @@
+from math import comb
+from random import Random
+
+from aoc.generators.common import count_lines, scaled_count
+
+UNIT = "histories"
+
+VALUES_COUNT = 21
+
+
+def generate_sequence(rng: Random) -> list[int]:
+    # integer combinations of binomials are integer valued polynomials
+    degree = rng.randint(0, 10)
+    coefficients = [rng.randint(-9, 9) for _ in range(degree + 1)]
+
+    return [
+        sum(c * comb(x, k) for k, c in enumerate(coefficients))
+        for x in range(VALUES_COUNT)
+    ]
+
+
+def generate(rng: Random, scale: float) -> str:
+    lines = [
+        " ".join(str(value) for value in generate_sequence(rng))
+        for _ in range(scaled_count(200, scale))
+    ]
+
+    return "\n".join(lines) + "\n"
+
+
+def size(input: str) -> int:
+    return count_lines(input)
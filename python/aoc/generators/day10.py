@@ -0,0 +1,88 @@
+from itertools import product
+from random import Random
+
+from aoc.generators.common import count_cells, scaled_side
+
+UNIT = "cells"
+
+SPACING = 4
+NORTH, SOUTH, WEST, EAST = (-1, 0), (1, 0), (0, -1), (0, 1)
+PIPES = {
+    frozenset({NORTH, SOUTH}): "|",
+    frozenset({EAST, WEST}): "-",
+    frozenset({NORTH, EAST}): "L",
+    frozenset({NORTH, WEST}): "J",
+    frozenset({SOUTH, WEST}): "7",
+    frozenset({SOUTH, EAST}): "F",
+}
+JUNK = "|-LJ7F......"
+
+Position = tuple[int, int]
+
+
+def random_tree_cells(rng: Random, rows: int, cols: int) -> set[Position]:
+    """cells of a random spanning tree of a lattice, nodes being SPACING cells apart"""
+    cells = {(0, 0)}
+    visited = {(0, 0)}
+    stack = [(0, 0)]
+
+    while stack:
+        r, c = stack[-1]
+        candidates = [
+            (r + dr, c + dc)
+            for dr, dc in (NORTH, SOUTH, WEST, EAST)
+            if 0 <= r + dr < rows
+            and 0 <= c + dc < cols
+            and (r + dr, c + dc) not in visited
+        ]
+
+        if not candidates:
+            stack.pop()
+            continue
+
+        next_r, next_c = rng.choice(candidates)
+        for k in range(SPACING + 1):
+            cells.add((r * SPACING + k * (next_r - r), c * SPACING + k * (next_c - c)))
+
+        visited.add((next_r, next_c))
+        stack.append((next_r, next_c))
+
+    return cells
+
+
+def contour(cells: set[Position]) -> set[Position]:
+    """cells at distance exactly 1 from `cells`: it loops once around a tree"""
+    return {
+        (i + di, j + dj)
+        for (i, j), di, dj in product(cells, (-1, 0, 1), (-1, 0, 1))
+        if (i + di, j + dj) not in cells
+    }
+
+
+def generate(rng: Random, scale: float) -> str:
+    side = scaled_side(140, scale)
+    coarse_side = (side - 5) // SPACING + 1
+    margin = (side - 1 - (coarse_side - 1) * SPACING) // 2
+
+    tree = random_tree_cells(rng, coarse_side, coarse_side)
+    loop = {(i + margin, j + margin) for i, j in contour(tree)}
+
+    grid = [[rng.choice(JUNK) for _ in range(side)] for _ in range(side)]
+
+    for i, j in loop:
+        directions = frozenset(
+            (di, dj)
+            for di, dj in (NORTH, SOUTH, WEST, EAST)
+            if (i + di, j + dj) in loop
+        )
+        grid[i][j] = PIPES[directions]
+
+    # day 10 assumes the starting tile is a vertical pipe
+    i, j = rng.choice(sorted((i, j) for i, j in loop if grid[i][j] == "|"))
+    grid[i][j] = "S"
+
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def size(input: str) -> int:
+    return count_cells(input)
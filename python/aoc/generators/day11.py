@@ -0,0 +1,33 @@
+from random import Random
+
+from aoc.generators.common import scaled_side
+
+UNIT = "galaxies"
+
+
+def generate(rng: Random, scale: float) -> str:
+    side = scaled_side(140, scale)
+
+    # about one line and one column out of ten must stay empty to get expanded
+    empty_lines = set(rng.sample(range(side), side // 10))
+    empty_columns = set(rng.sample(range(side), side // 10))
+
+    rows = []
+    for i in range(side):
+        row = [
+            (
+                "#"
+                if i not in empty_lines
+                and j not in empty_columns
+                and rng.random() < 0.025
+                else "."
+            )
+            for j in range(side)
+        ]
+        rows.append("".join(row))
+
+    return "\n".join(rows) + "\n"
+
+
+def size(input: str) -> int:
+    return input.count("#")
@@ -0,0 +1,46 @@
+from random import Random
+
+from aoc.generators.common import count_lines, scaled_count
+
+UNIT = "records"
+
+# part 1 enumerates every completion of a row, keep it tractable
+MAX_UNKNOWNS = 12
+
+
+def generate_row(rng: Random) -> tuple[str, list[int]]:
+    length = rng.randint(5, 20)
+
+    groups = [rng.randint(1, 5)]
+    while sum(groups) + len(groups) < length - 1 and rng.random() < 0.7:
+        groups.append(rng.randint(1, min(5, length - sum(groups) - len(groups))))
+
+    springs = "#" * groups[0]
+    for group in groups[1:]:
+        springs += "." * rng.randint(1, 2) + "#" * group
+    padding = max(0, length - len(springs))
+    left_padding = rng.randint(0, padding)
+    springs = "." * left_padding + springs + "." * (padding - left_padding)
+
+    unknown_positions = [i for i in range(len(springs)) if rng.random() < 0.6]
+    rng.shuffle(unknown_positions)
+
+    row = list(springs)
+    for i in unknown_positions[:MAX_UNKNOWNS]:
+        row[i] = "?"
+
+    return "".join(row), groups
+
+
+def generate(rng: Random, scale: float) -> str:
+    lines = []
+
+    for _ in range(scaled_count(1000, scale)):
+        row, groups = generate_row(rng)
+        lines.append(f"{row} {','.join(str(group) for group in groups)}")
+
+    return "\n".join(lines) + "\n"
+
+
+def size(input: str) -> int:
+    return count_lines(input)
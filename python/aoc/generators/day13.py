@@ -0,0 +1,76 @@
+from random import Random
+
+from aoc.generators.common import count_cells, scaled_count
+
+UNIT = "cells"
+
+Pattern = list[list[str]]
+
+
+def transpose(pattern: Pattern) -> Pattern:
+    return [list(column) for column in zip(*pattern)]
+
+
+def horizontal_axes(pattern: Pattern, misses: int) -> list[int]:
+    """axes (between line `i` and `i + 1`) with exactly `misses` mismatching cells"""
+    axes = []
+
+    for i in range(len(pattern) - 1):
+        pairs = zip(reversed(range(i + 1)), range(i + 1, len(pattern)))
+        count = sum(a != b for t, u in pairs for a, b in zip(pattern[t], pattern[u]))
+        if count == misses:
+            axes.append(i)
+
+    return axes
+
+
+def mirror_lines(pattern: Pattern, axis: int) -> None:
+    for t in range(min(axis + 1, len(pattern) - axis - 1)):
+        pattern[axis + 1 + t] = pattern[axis - t].copy()
+
+
+def covered_range(axis: int, size: int) -> range:
+    reach = min(axis + 1, size - axis - 1)
+    return range(axis + 1 - reach, axis + 1 + reach)
+
+
+def generate_pattern(rng: Random) -> Pattern:
+    # a perfect vertical axis for part 1, a smudged horizontal one for part 2:
+    # the smudge lies in columns the vertical axis doesn't reflect
+    while True:
+        lines_count, cols_count = rng.randint(5, 17), rng.randint(5, 17)
+        pattern = [rng.choices("#.", k=cols_count) for _ in range(lines_count)]
+
+        vertical_axis = rng.randrange(cols_count - 1)
+        horizontal_axis = rng.randrange(lines_count - 1)
+
+        mirror_lines(pattern, horizontal_axis)
+        pattern = transpose(pattern)
+        mirror_lines(pattern, vertical_axis)
+        pattern = transpose(pattern)
+
+        columns = covered_range(vertical_axis, cols_count)
+        free_columns = [j for j in range(cols_count) if j not in columns]
+        if not free_columns:
+            continue
+
+        i = rng.choice(covered_range(horizontal_axis, lines_count))
+        j = rng.choice(free_columns)
+        pattern[i][j] = "." if pattern[i][j] == "#" else "#"
+
+        if (
+            horizontal_axes(pattern, 0) == []
+            and horizontal_axes(transpose(pattern), 0) == [vertical_axis]
+            and horizontal_axes(pattern, 1) == [horizontal_axis]
+            and horizontal_axes(transpose(pattern), 1) == []
+        ):
+            return pattern if rng.random() < 0.5 else transpose(pattern)
+
+
+def generate(rng: Random, scale: float) -> str:
+    patterns = [generate_pattern(rng) for _ in range(scaled_count(100, scale))]
+    return "\n\n".join("\n".join("".join(line) for line in p) for p in patterns) + "\n"
+
+
+def size(input: str) -> int:
+    return count_cells(input)
@@ -0,0 +1,17 @@
+from random import Random
+
+from aoc.generators.common import count_cells, scaled_side
+
+UNIT = "cells"
+
+
+def generate(rng: Random, scale: float) -> str:
+    side = scaled_side(100, scale)
+    rows = [
+        "".join(rng.choices("O#.", weights=(20, 8, 72), k=side)) for _ in range(side)
+    ]
+    return "\n".join(rows) + "\n"
+
+
+def size(input: str) -> int:
+    return count_cells(input)
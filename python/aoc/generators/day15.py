@@ -0,0 +1,27 @@
+from random import Random
+from string import ascii_lowercase
+
+from aoc.generators.common import scaled_count
+
+UNIT = "steps"
+
+
+def generate(rng: Random, scale: float) -> str:
+    # a limited set of labels, so that steps actually replace and remove lenses
+    labels = sorted(
+        {"".join(rng.choices(ascii_lowercase, k=rng.randint(2, 6))) for _ in range(500)}
+    )
+
+    steps = []
+    for _ in range(scaled_count(4000, scale)):
+        label = rng.choice(labels)
+        if rng.random() < 0.6:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+        else:
+            steps.append(f"{label}-")
+
+    return ",".join(steps) + "\n"
+
+
+def size(input: str) -> int:
+    return input.strip().count(",") + 1
@@ -0,0 +1,18 @@
+from random import Random
+
+from aoc.generators.common import count_cells, scaled_side
+
+UNIT = "cells"
+
+
+def generate(rng: Random, scale: float) -> str:
+    side = scaled_side(110, scale)
+    rows = [
+        "".join(rng.choices(".|-/\\", weights=(90, 3, 3, 2, 2), k=side))
+        for _ in range(side)
+    ]
+    return "\n".join(rows) + "\n"
+
+
+def size(input: str) -> int:
+    return count_cells(input)
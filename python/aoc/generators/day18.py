@@ -0,0 +1,79 @@
+from random import Random
+
+from aoc.generators.common import count_lines, scaled_count
+
+UNIT = "instructions"
+
+DIRECTION_DIGITS = {"R": 0, "D": 1, "L": 2, "U": 3}
+
+
+def random_walk(rng: Random, count: int, step: int, high: int) -> list[int]:
+    values = [rng.randint(1, high)]
+
+    while len(values) < count:
+        delta = rng.randint(1, step) * rng.choice((-1, 1))
+        value = (
+            values[-1] + delta
+            if 1 <= values[-1] + delta <= high
+            else values[-1] - delta
+        )
+        values.append(value)
+
+    return values
+
+
+def random_partition(rng: Random, total: int, count: int) -> list[int]:
+    cuts = sorted(rng.sample(range(1, total), count - 1))
+    return [b - a for a, b in zip([0, *cuts], [*cuts, total])]
+
+
+def generate_polygon(
+    rng: Random, sides_count: int, step: int, high: int
+) -> list[tuple[str, int]]:
+    """a simple rectilinear polygon: a stairway on top of an upside down one
+
+    it starts at its top left corner and is `4 * sides_count` instructions long
+    """
+    heights = random_walk(rng, sides_count, step, high)
+    depths = random_walk(rng, sides_count, step, high)
+    top_widths = [rng.randint(1, step) for _ in range(sides_count)]
+    bottom_widths = random_partition(rng, sum(top_widths), sides_count)
+
+    instructions = []
+
+    for i, width in enumerate(top_widths):
+        instructions.append(("R", width))
+        if i + 1 < sides_count:
+            delta = heights[i + 1] - heights[i]
+            instructions.append(("U" if delta > 0 else "D", abs(delta)))
+
+    instructions.append(("D", heights[-1] + depths[0]))
+
+    for i, width in enumerate(bottom_widths):
+        instructions.append(("L", width))
+        if i + 1 < sides_count:
+            delta = depths[i + 1] - depths[i]
+            instructions.append(("D" if delta > 0 else "U", abs(delta)))
+
+    instructions.append(("U", depths[-1] + heights[0]))
+
+    return instructions
+
+
+def generate(rng: Random, scale: float) -> str:
+    sides_count = max(2, scaled_count(700, scale) // 4)
+
+    # part 1 reads the plain instructions, part 2 another polygon from the colors
+    small = generate_polygon(rng, sides_count, step=12, high=200)
+    large = generate_polygon(rng, sides_count, step=0xFFFF, high=0x7FFFF)
+
+    lines = [
+        f"{dir} {count} (#{color_count:05x}{DIRECTION_DIGITS[color_dir]})"
+        for (dir, count), (color_dir, color_count) in zip(small, large)
+    ]
+
+    return "\n".join(lines) + "\n"
+
+
+def size(input: str) -> int:
+    return count_lines(input)
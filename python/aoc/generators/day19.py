@@ -0,0 +1,58 @@
+from collections import deque
+from random import Random
+
+from aoc.generators.common import random_names, scaled_count
+
+UNIT = "workflows and parts"
+
+
+def generate_workflows(rng: Random, workflows_count: int) -> list[str]:
+    """workflows forming a tree rooted at `in`, so that no part ever loops"""
+    length = 2
+    while 26**length < 2 * workflows_count:
+        length += 1
+
+    names = iter(
+        name for name in random_names(rng, workflows_count, length) if name != "in"
+    )
+
+    lines = []
+    created = 1
+    queue = deque(["in"])
+
+    while queue:
+        name = queue.popleft()
+
+        destinations = []
+        for _ in range(rng.randint(2, 4)):
+            if created < workflows_count and rng.random() < 0.6:
+                destinations.append(next(names))
+                queue.append(destinations[-1])
+                created += 1
+            else:
+                destinations.append(rng.choice("AR"))
+
+        *conditions_destinations, default = destinations
+        conditions = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{dest}"
+            for dest in conditions_destinations
+        ]
+        lines.append(f"{name}{{{','.join([*conditions, default])}}}")
+
+    rng.shuffle(lines)
+
+    return lines
+
+
+def generate(rng: Random, scale: float) -> str:
+    workflows = generate_workflows(rng, scaled_count(550, scale))
+    parts = [
+        "{" + ",".join(f"{cat}={rng.randint(1, 4000)}" for cat in "xmas") + "}"
+        for _ in range(scaled_count(200, scale))
+    ]
+
+    return "\n".join(workflows) + "\n\n" + "\n".join(parts) + "\n"
+
+
+def size(input: str) -> int:
+    return sum(1 for line in input.splitlines() if line)
@@ -0,0 +1,97 @@
+from random import Random
+
+from aoc.generators.common import random_names
+
+UNIT = "button presses"
+
+# day 20 part 2 hardcodes the first module of each counter and the final conjunction
+COUNTERS_INPUTS = ["gb", "zz", "ht", "vk"]
+FINAL_CONJUNCTION = "mg"
+RESERVED = {*COUNTERS_INPUTS, FINAL_CONJUNCTION, "rx"}
+
+
+def is_prime(n: int) -> bool:
+    return n >= 2 and all(n % d != 0 for d in range(2, int(n**0.5) + 1))
+
+
+def random_prime(rng: Random, bits: int, excluded: list[int]) -> int:
+    while True:
+        n = rng.randrange(2 ** (bits - 1) + 1, 2**bits, 2)
+        if is_prime(n) and n not in excluded:
+            return n
+
+
+def generate(rng: Random, scale: float) -> str:
+    # each counter counts button presses up to a prime, which is what part 2 iterates over
+    bits = max(3, round(3800 * scale).bit_length())
+    periods: list[int] = []
+    for _ in COUNTERS_INPUTS:
+        periods.append(random_prime(rng, bits, periods))
+
+    names = iter(
+        name
+        for name in random_names(rng, len(RESERVED) + 4 * (bits + 2), 2)
+        if name not in RESERVED
+    )
+
+    lines = [f"broadcaster -> {', '.join(rng.sample(COUNTERS_INPUTS, 4))}"]
+
+    for counter_input, period in zip(COUNTERS_INPUTS, periods):
+        flip_flops = [counter_input, *(next(names) for _ in range(bits - 1))]
+        hub, inverter = next(names), next(names)
+
+        # a binary counter: bits set in `period` feed the hub, which resets the
+        # counter by flipping the bits that are unset in `period`
+        for k, flip_flop in enumerate(flip_flops):
+            destinations = flip_flops[k + 1 : k + 2]
+            if period >> k & 1:
+                destinations.append(hub)
+            rng.shuffle(destinations)
+            lines.append(f"%{flip_flop} -> {', '.join(destinations)}")
+
+        hub_destinations = [
+            flip_flop
+            for k, flip_flop in enumerate(flip_flops)
+            if k == 0 or not period >> k & 1
+        ]
+        hub_destinations.append(inverter)
+        rng.shuffle(hub_destinations)
+
+        lines.append(f"&{hub} -> {', '.join(hub_destinations)}")
+        lines.append(f"&{inverter} -> {FINAL_CONJUNCTION}")
+
+    lines.append(f"&{FINAL_CONJUNCTION} -> rx")
+    rng.shuffle(lines)
+
+    return "\n".join(lines) + "\n"
+
+
+def size(input: str) -> int:
+    """presses part 2 needs, the longest counter period, read back from the bits
+    feeding the hubs"""
+    modules = {}
+    for line in input.splitlines():
+        left, _, right = line.partition(" -> ")
+        modules[left.lstrip("%&")] = (left[0], right.split(", "))
+
+    periods = []
+    for counter_input in COUNTERS_INPUTS:
+        period = 0
+        flip_flop: str | None = counter_input
+        k = 0
+
+        while flip_flop is not None:
+            _, destinations = modules[flip_flop]
+            flip_flop = None
+
+            for destination in destinations:
+                if modules[destination][0] == "%":
+                    flip_flop = destination
+                else:
+                    period |= 1 << k
+
+            k += 1
+
+        periods.append(period)
+
+    return max(periods)
@@ -0,0 +1,35 @@
+from random import Random
+
+from aoc.generators.common import count_cells, scaled_side
+
+UNIT = "cells"
+
+
+def generate(rng: Random, scale: float) -> str:
+    """a square garden with a clear border and a clear cross through its center
+
+    part 2 hardcodes the official 131 x 131 layout, its answer only makes sense
+    for inputs generated at scale 1
+    """
+    side = scaled_side(131, scale) | 1
+    center = side // 2
+
+    rows = []
+    for i in range(side):
+        row = [
+            (
+                "."
+                if i in (0, center, side - 1) or j in (0, center, side - 1)
+                else rng.choices("#.", weights=(15, 85))[0]
+            )
+            for j in range(side)
+        ]
+        rows.append(row)
+
+    rows[center][center] = "S"
+
+    return "\n".join("".join(row) for row in rows) + "\n"
+
+
+def size(input: str) -> int:
+    return count_cells(input)
@@ -0,0 +1,45 @@
+from random import Random
+
+from aoc.generators.common import count_lines, scaled_count
+
+UNIT = "bricks"
+
+FOOTPRINT = 10
+
+
+def generate(rng: Random, scale: float) -> str:
+    bricks_count = scaled_count(1200, scale)
+
+    occupied: set[tuple[int, int, int]] = set()
+    lines: list[str] = []
+
+    while len(lines) < bricks_count:
+        start = [
+            rng.randrange(FOOTPRINT),
+            rng.randrange(FOOTPRINT),
+            rng.randint(1, 2 + len(lines) // 3),
+        ]
+        end = start.copy()
+        axis = rng.randrange(3)
+        end[axis] += rng.randint(0, 3)
+
+        if end[0] >= FOOTPRINT or end[1] >= FOOTPRINT:
+            continue
+
+        cells = {
+            (x, y, z)
+            for x in range(start[0], end[0] + 1)
+            for y in range(start[1], end[1] + 1)
+            for z in range(start[2], end[2] + 1)
+        }
+        if cells & occupied:
+            continue
+
+        occupied |= cells
+        lines.append(f"{','.join(map(str, start))}~{','.join(map(str, end))}")
+
+    return "\n".join(lines) + "\n"
+
+
+def size(input: str) -> int:
+    return count_lines(input)
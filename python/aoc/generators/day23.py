@@ -0,0 +1,81 @@
+from random import Random
+
+from aoc.generators.common import count_cells, scaled_side
+
+UNIT = "cells"
+
+SPACING = 23
+JITTER = 3
+
+Position = tuple[int, int]
+
+
+def corridor(start: Position, end: Position, horizontal: bool) -> list[Position]:
+    """cells from `start` to `end` (right or below it), bending once half way"""
+    (r1, c1), (r2, c2) = start, end
+    cells: list[Position] = []
+
+    if horizontal:
+        m = (c1 + c2) // 2
+        cells.extend((r1, c) for c in range(c1, m + 1))
+        step = 1 if r2 >= r1 else -1
+        cells.extend((r, m) for r in range(r1 + step, r2 + step, step))
+        cells.extend((r2, c) for c in range(m + 1, c2 + 1))
+    else:
+        m = (r1 + r2) // 2
+        cells.extend((r, c1) for r in range(r1, m + 1))
+        step = 1 if c2 >= c1 else -1
+        cells.extend((m, c) for c in range(c1 + step, c2 + step, step))
+        cells.extend((r, c2) for r in range(m + 1, r2 + 1))
+
+    return cells
+
+
+def generate(rng: Random, scale: float) -> str:
+    """a lattice of junctions linked by corridors, slopes only allowing to go
+    right or down, like the official 6 x 6 junctions inputs"""
+    junctions_side = max(2, scaled_side(6, scale))
+    side = junctions_side * SPACING + 3
+
+    junctions = [
+        [
+            (
+                SPACING // 2 + a * SPACING + rng.randint(-JITTER, JITTER),
+                SPACING // 2 + b * SPACING + rng.randint(-JITTER, JITTER),
+            )
+            for b in range(junctions_side)
+        ]
+        for a in range(junctions_side)
+    ]
+
+    grid = [["#"] * side for _ in range(side)]
+
+    def dig(cells: list[Position]) -> None:
+        for i, j in cells:
+            grid[i][j] = "."
+
+    for a in range(junctions_side):
+        for b in range(junctions_side):
+            i, j = junctions[a][b]
+
+            if b + 1 < junctions_side:
+                dig(corridor((i, j), junctions[a][b + 1], horizontal=True))
+                i_end, j_end = junctions[a][b + 1]
+                grid[i][j + 1] = grid[i_end][j_end - 1] = ">"
+
+            if a + 1 < junctions_side:
+                dig(corridor((i, j), junctions[a + 1][b], horizontal=False))
+                i_end, j_end = junctions[a + 1][b]
+                grid[i + 1][j] = grid[i_end - 1][j_end] = "v"
+
+    i, j = junctions[0][0]
+    dig([(r, j) for r in range(i)])
+
+    i, j = junctions[-1][-1]
+    dig([(r, j) for r in range(i, side)])
+
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def size(input: str) -> int:
+    return count_cells(input)
@@ -0,0 +1,41 @@
+from random import Random
+
+from aoc.generators.common import count_lines, scaled_count
+
+UNIT = "hailstones"
+
+LOW, HIGH = 50_000_000_000_000, 500_000_000_000_000
+
+
+def generate(rng: Random, scale: float) -> str:
+    # every hailstone crosses the path of a rock thrown at integer times, as
+    # part 2 expects
+    rock_position = [rng.randint(2 * LOW, HIGH - 2 * LOW) for _ in range(3)]
+    rock_velocity = [rng.randint(-300, 300) for _ in range(3)]
+
+    lines: list[str] = []
+    times: set[int] = set()
+
+    while len(lines) < scaled_count(300, scale):
+        t = rng.randint(10**11, 10**12)
+        velocity = [rng.randint(-300, 300) for _ in range(3)]
+        position = [
+            p + (v - v_h) * t
+            for p, v, v_h in zip(rock_position, rock_velocity, velocity)
+        ]
+
+        if t in times or velocity == rock_velocity:
+            continue
+        if not all(LOW <= x <= HIGH for x in position):
+            continue
+
+        times.add(t)
+        lines.append(
+            f"{', '.join(map(str, position))} @ {', '.join(map(str, velocity))}"
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def size(input: str) -> int:
+    return count_lines(input)
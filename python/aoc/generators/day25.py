@@ -0,0 +1,45 @@
+from collections import defaultdict
+from random import Random
+
+from aoc.generators.common import random_names, scaled_count
+
+UNIT = "components"
+
+
+def generate_component(rng: Random, nodes: list[str]) -> list[tuple[str, str]]:
+    """a 4-edge-connected graph, so that the only 3-cut is the planted one"""
+    edges = [(u, v) for i, u in enumerate(nodes[:5]) for v in nodes[i + 1 : 5]]
+
+    for i in range(5, len(nodes)):
+        edges.extend((nodes[i], v) for v in rng.sample(nodes[:i], 4))
+
+    return edges
+
+
+def generate(rng: Random, scale: float) -> str:
+    nodes_count = max(10, scaled_count(1500, scale))
+
+    length = 3
+    while 26**length < 2 * nodes_count:
+        length += 1
+
+    nodes = random_names(rng, nodes_count, length)
+    a, b = nodes[: nodes_count // 2], nodes[nodes_count // 2 :]
+
+    edges = generate_component(rng, a) + generate_component(rng, b)
+    edges.extend(zip(rng.sample(a, 3), rng.sample(b, 3)))
+
+    neighbors = defaultdict(list)
+    for u, v in edges:
+        if rng.random() < 0.5:
+            u, v = v, u
+        neighbors[u].append(v)
+
+    lines = [f"{u}: {' '.join(vs)}" for u, vs in neighbors.items()]
+    rng.shuffle(lines)
+
+    return "\n".join(lines) + "\n"
+
+
+def size(input: str) -> int:
+    return len(set(input.replace(":", " ").split()))
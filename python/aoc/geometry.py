@@ -0,0 +1,27 @@
+"""grid directions as small ints, with their properties in lookup tables
+
+directions go clockwise from the right, in the order of `Grid.offsets`, so
+that a direction indexes both these tables and a grid's flat offsets
+"""
+
+Direction = int
+
+RIGHT, DOWN, LEFT, UP = DIRECTIONS = (0, 1, 2, 3)
+
+# (di, dj) of a step in each direction
+DELTAS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+OPPOSITE = (LEFT, UP, RIGHT, DOWN)
+TURN_RIGHT = (DOWN, LEFT, UP, RIGHT)
+TURN_LEFT = (UP, RIGHT, DOWN, LEFT)
+
+NAMES = ("right", "down", "left", "up")
+
+
+def is_horizontal(dir: Direction) -> bool:
+    return dir == RIGHT or dir == LEFT
+
+
+def move(i: int, j: int, dir: Direction, steps: int = 1) -> tuple[int, int]:
+    di, dj = DELTAS[dir]
+    return i + steps * di, j + steps * dj
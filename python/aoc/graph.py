@@ -0,0 +1,187 @@
+"""graphs with dense int nodes and compressed sparse row adjacency
+
+node labels (strings, grid indices...) are interned to ints `0..n - 1`, the
+edges leaving `u` are `targets[offsets[u] : offsets[u + 1]]`, with their
+weights at the same positions in `weights`. Everything lives in a few flat
+`array`s, so traversals walk contiguous memory and a graph costs a handful of
+bytes per edge instead of a dict per node. Hot loops bind `offsets`, `targets`
+and `weights` to locals and index them directly
+"""
+
+from __future__ import annotations
+from array import array
+from collections import deque
+from itertools import accumulate
+from collections.abc import Collection, Hashable, Iterable, Iterator, Mapping
+
+
+def intern[L: Hashable](label: L, index: dict[L, int], labels: list[L]) -> int:
+    u = index.get(label)
+    if u is None:
+        u = index[label] = len(labels)
+        labels.append(label)
+
+    return u
+
+
+class Graph[L: Hashable]:
+    def __init__(
+        self,
+        labels: list[L],
+        offsets: array[int],
+        targets: array[int],
+        weights: array[int] | None = None,
+        index: dict[L, int] | None = None,
+    ):
+        if len(offsets) != len(labels) + 1 or offsets[-1] != len(targets):
+            raise ValueError("offsets don't match the nodes and edges")
+        if weights is not None and len(weights) != len(targets):
+            raise ValueError("weights don't match the edges")
+
+        self.labels = labels
+        if index is None:
+            index = {label: u for u, label in enumerate(labels)}
+        self.index = index
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_adjacency(cls, adjacency: Mapping[L, Collection[L]]) -> Graph[L]:
+        """graph of the edges from each key to its values, in their order
+
+        nodes are numbered in order of appearance, keys first
+        """
+        labels = list(adjacency)
+        index = {label: u for u, label in enumerate(labels)}
+
+        values = [v for neighbors in adjacency.values() for v in neighbors]
+        # the nodes only found in values have no edges
+        for v in values:
+            if v not in index:
+                intern(v, index, labels)
+
+        offsets = array("l", [0])
+        offsets.extend(accumulate(map(len, adjacency.values())))
+        offsets.extend([len(values)] * (len(labels) + 1 - len(offsets)))
+        targets = array("l", map(index.__getitem__, values))
+
+        return cls(labels, offsets, targets, index=index)
+
+    @classmethod
+    def from_weighted_adjacency(
+        cls, adjacency: Mapping[L, Mapping[L, int]]
+    ) -> Graph[L]:
+        graph = cls.from_adjacency(adjacency)
+        graph.weights = array(
+            "l", (w for neighbors in adjacency.values() for w in neighbors.values())
+        )
+
+        return graph
+
+    @classmethod
+    def from_edges(
+        cls, edges: Iterable[tuple[L, L]], undirected: bool = False
+    ) -> Graph[L]:
+        """graph of the `(u, v)` edges, with `(v, u)` too if `undirected`"""
+        index: dict[L, int] = {}
+        labels: list[L] = []
+
+        sources = array("l")
+        destinations = array("l")
+        for a, b in edges:
+            u, v = intern(a, index, labels), intern(b, index, labels)
+            sources.append(u)
+            destinations.append(v)
+            if undirected:
+                sources.append(v)
+                destinations.append(u)
+
+        # counting sort of the edges by source
+        offsets = array("l", [0]) * (len(labels) + 1)
+        for u in sources:
+            offsets[u + 1] += 1
+        for u in range(len(labels)):
+            offsets[u + 1] += offsets[u]
+
+        targets = array("l", [0]) * len(sources)
+        next_positions = offsets[:-1]
+        for u, v in zip(sources, destinations):
+            targets[next_positions[u]] = v
+            next_positions[u] += 1
+
+        return cls(labels, offsets, targets, index=index)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @property
+    def edges_count(self) -> int:
+        return len(self.targets)
+
+    def edge_range(self, u: int) -> range:
+        """positions of the edges leaving `u` in `targets` and `weights`"""
+        return range(self.offsets[u], self.offsets[u + 1])
+
+    def neighbors(self, u: int) -> array[int]:
+        return self.targets[self.offsets[u] : self.offsets[u + 1]]
+
+    def degree(self, u: int) -> int:
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def in_degrees(self) -> array[int]:
+        degrees = array("l", [0]) * len(self)
+        for v in self.targets:
+            degrees[v] += 1
+
+        return degrees
+
+    def reverse_edges(self) -> array[int]:
+        """position of the `(v, u)` edge for each `(u, v)` edge, of undirected
+        graphs without parallel edges"""
+        offsets, targets = self.offsets, self.targets
+
+        positions = {}
+        for u in range(len(self)):
+            for e in range(offsets[u], offsets[u + 1]):
+                positions[u, targets[e]] = e
+
+        reverse = array("l", [0]) * len(targets)
+        for (u, v), e in positions.items():
+            reverse[e] = positions[v, u]
+
+        return reverse
+
+    def bfs(self, source: int) -> Iterator[int]:
+        """nodes reachable from `source`, nearest first"""
+        offsets, targets = self.offsets, self.targets
+
+        seen = bytearray(len(self))
+        seen[source] = 1
+        q = deque([source])
+
+        while q:
+            u = q.popleft()
+            yield u
+
+            for v in targets[offsets[u] : offsets[u + 1]]:
+                if not seen[v]:
+                    seen[v] = 1
+                    q.append(v)
+
+    def dfs(self, source: int) -> Iterator[int]:
+        """nodes reachable from `source`, in depth-first preorder"""
+        offsets, targets = self.offsets, self.targets
+
+        seen = bytearray(len(self))
+        stack = [source]
+
+        while stack:
+            u = stack.pop()
+            if seen[u]:
+                continue
+            seen[u] = 1
+            yield u
+
+            # reversed, so that neighbors get visited in their order
+            stack.extend(reversed(targets[offsets[u] : offsets[u + 1]]))
@@ -0,0 +1,155 @@
+"""puzzle grids stored as one byte per cell
+
+cells live row after row in a flat `bytearray`, so hot loops move around with
+flat indices and precomputed offsets (`grid.data[k + grid.offsets[d]]`) instead
+of `grid[i][j]` lookups. An optional border of padding cells lets them step out
+of the puzzle without bounds checks. `array` exposes the same memory as a numpy
+`uint8` array for vectorized work, rows, columns and transposes being views
+"""
+
+from __future__ import annotations
+from collections.abc import Iterator
+
+from aoc.lazy import lazy_import
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+else:
+    np = lazy_import("numpy")
+
+
+class Grid:
+    def __init__(self, data: bytearray, height: int, width: int, padding: int = 0):
+        self.data = data
+        # size of the puzzle, the padding excluded
+        self.height = height
+        self.width = width
+        self.padding = padding
+        # distance between vertically adjacent cells in `data`
+        self.stride = width + 2 * padding
+
+        if len(data) != (height + 2 * padding) * self.stride:
+            raise ValueError("data doesn't match the grid size")
+
+        # flat offsets to the neighbors, indexed by `aoc.geometry` directions
+        self.offsets = (1, self.stride, -1, -self.stride)
+        # same with the diagonals, clockwise from the right
+        self.offsets8 = (
+            1,
+            self.stride + 1,
+            self.stride,
+            self.stride - 1,
+            -1,
+            -self.stride - 1,
+            -self.stride,
+            -self.stride + 1,
+        )
+
+    @classmethod
+    def parse(cls, input: str, pad: str | None = None) -> Grid:
+        """grid of the input lines, surrounded by a border of `pad` if given"""
+        lines = input.splitlines()
+        width = len(lines[0])
+
+        if any(len(line) != width for line in lines):
+            raise ValueError("grid lines must have the same length")
+
+        if pad is None:
+            return cls(bytearray("".join(lines).encode()), len(lines), width)
+
+        if len(pad) != 1:
+            raise ValueError("padding must be a single character")
+
+        border = pad * (width + 2)
+        rows = [border, *(pad + line + pad for line in lines), border]
+
+        return cls(bytearray("".join(rows).encode()), len(lines), width, padding=1)
+
+    @property
+    def rows_count(self) -> int:
+        """rows of `data`, the padding included"""
+        return self.height + 2 * self.padding
+
+    def index(self, i: int, j: int) -> int:
+        return (i + self.padding) * self.stride + j + self.padding
+
+    def position(self, k: int) -> tuple[int, int]:
+        i, j = divmod(k, self.stride)
+        return i - self.padding, j - self.padding
+
+    def is_inside(self, k: int) -> bool:
+        """whether a flat index is a cell of the puzzle rather than padding"""
+        i, j = self.position(k)
+        return 0 <= i < self.height and 0 <= j < self.width
+
+    def indices(self) -> Iterator[int]:
+        """flat indices of the puzzle cells, row by row"""
+        for i in range(self.height):
+            start = self.index(i, 0)
+            yield from range(start, start + self.width)
+
+    def find(self, c: str) -> int:
+        k = self.data.find(c.encode())
+        if k == -1:
+            raise ValueError(f"{c!r} not in grid")
+
+        return k
+
+    def __getitem__(self, pos: tuple[int, int]) -> int:
+        return self.data[self.index(*pos)]
+
+    def __setitem__(self, pos: tuple[int, int], value: int) -> None:
+        self.data[self.index(*pos)] = value
+
+    def copy(self) -> Grid:
+        return Grid(self.data.copy(), self.height, self.width, self.padding)
+
+    def row_bytes(self, i: int) -> bytes:
+        start = self.index(i, 0)
+        return bytes(self.data[start : start + self.width])
+
+    def column_bytes(self, j: int) -> bytes:
+        start = self.index(0, j)
+        return bytes(self.data[start : start + self.height * self.stride : self.stride])
+
+    def set_row_bytes(self, i: int, value: bytes) -> None:
+        start = self.index(i, 0)
+        self.data[start : start + self.width] = value
+
+    def set_column_bytes(self, j: int, value: bytes) -> None:
+        start = self.index(0, j)
+        self.data[start : start + self.height * self.stride : self.stride] = value
+
+    @property
+    def padded_array(self) -> NDArray[np.uint8]:
+        """writable view of `data`, the padding included"""
+        return np.frombuffer(self.data, dtype=np.uint8).reshape(
+            self.rows_count, self.stride
+        )
+
+    @property
+    def array(self) -> NDArray[np.uint8]:
+        """writable view of the puzzle cells, the padding excluded"""
+        p = self.padding
+        return self.padded_array[p : p + self.height, p : p + self.width]
+
+    def row(self, i: int) -> NDArray[np.uint8]:
+        return self.array[i]
+
+    def column(self, j: int) -> NDArray[np.uint8]:
+        return self.array[:, j]
+
+    def transpose(self) -> NDArray[np.uint8]:
+        return self.array.T
+
+    def __str__(self) -> str:
+        start = self.index(0, 0)
+        return "\n".join(
+            self.data[
+                start + i * self.stride : start + i * self.stride + self.width
+            ].decode()
+            for i in range(self.height)
+        )
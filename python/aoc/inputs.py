@@ -0,0 +1,132 @@
+"""input files mapped in memory instead of read into a `str`
+
+inputs are ASCII, so the solutions of `registry.BUFFER_INPUT_DAYS` also accept
+the raw bytes of their input. Mapping the file hands them those bytes without
+reading them into the process (the OS pages them in and can drop them again),
+and without the copy and the UTF-8 decoding pass a `str` costs. `bytes` and
+`mmap` both provide `find`, slicing and regex matching with `bytes` patterns,
+which is what byte level solutions use. `to_bytes` turns CRLF newlines into LF
+ones, as reading a `str` in text mode does, which copies the data only when it
+has some, and copies `bytearray`s, whose slices aren't `bytes`
+"""
+
+from __future__ import annotations
+import mmap
+import re
+from array import array
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+Buffer = bytes | bytearray | mmap.mmap
+# buffers whose slices are `bytes`
+Bytes = bytes | mmap.mmap
+
+NEWLINE_REGEX = re.compile(rb"\n")
+
+
+class MappedInput:
+    def __init__(self, path: Path | str):
+        with open(path, mode="rb") as file:
+            # empty files can't be mapped
+            if file.seek(0, 2) == 0:
+                self.data: Buffer = b""
+            else:
+                self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._line_offsets: array[int] | None = None
+
+    @property
+    def view(self) -> memoryview:
+        return memoryview(self.data)
+
+    @property
+    def line_offsets(self) -> array[int]:
+        if self._line_offsets is None:
+            self._line_offsets = line_offsets(self.data)
+
+        return self._line_offsets
+
+    def line(self, k: int) -> memoryview:
+        """line `k` without its newline, as a view of the mapped bytes"""
+        offsets = self.line_offsets
+        return self.view[offsets[k] : offsets[k + 1] - 1]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def close(self) -> None:
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __enter__(self) -> MappedInput:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def line_offsets(data: Buffer) -> array[int]:
+    """start of each line, then one past the end of the data as if it ended with
+    a newline, so that line `k` is `data[offsets[k] : offsets[k + 1] - 1]`"""
+    offsets = array("q", [0])
+    offsets.extend(m.end() for m in NEWLINE_REGEX.finditer(data))
+
+    if offsets[-1] != len(data):
+        offsets.append(len(data) + 1)
+
+    return offsets
+
+
+def normalize_newlines(data: Bytes) -> Bytes:
+    if data.find(b"\r\n") == -1:
+        return data
+
+    return bytes(data).replace(b"\r\n", b"\n")
+
+
+def to_bytes(input: str | Buffer) -> Bytes:
+    if isinstance(input, str):
+        input = input.encode()
+    elif isinstance(input, bytearray):
+        input = bytes(input)
+
+    return normalize_newlines(input)
+
+
+def iter_lines(data: Bytes, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+    """lines without their newline, copying one line at a time, of
+    `data[start:end]` which should start at the start of a line"""
+    if end is None:
+        end = len(data)
+
+    while (line_end := data.find(b"\n", start, end)) != -1:
+        yield data[start:line_end]
+        start = line_end + 1
+
+    if start < end:
+        yield data[start:end]
+
+
+def strip_newlines(lines: Iterable[bytes]) -> Iterator[bytes]:
+    """lines of a file opened in binary mode without their newline, CRLF ones
+    included"""
+    for line in lines:
+        yield line.rstrip(b"\r\n")
+
+
+def chunk_bounds(data: Buffer, count: int) -> list[tuple[int, int]]:
+    """`(start, end)` of up to `count` chunks of about the same size, made of
+    whole lines"""
+    bounds = []
+
+    start = 0
+    for k in range(1, count + 1):
+        end = len(data) * k // count
+        if end < len(data):
+            end = data.find(b"\n", end) + 1 or len(data)
+
+        if end > start:
+            bounds.append((start, end))
+            start = end
+
+    return bounds
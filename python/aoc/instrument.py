@@ -0,0 +1,86 @@
+"""opt-in timers for the phases of a solution (parsing, preprocessing...)
+
+solutions mark their phases with `phase`, either as a decorator or as a context
+manager. Unless collection was enabled, e.g. with `aoc run --phases`, a
+decorated function costs one flag check on top of its call and a `with` block
+an object and two method calls, which is cheap but not free: mark whole phases
+(parsing the input, a loop over its lines) rather than what runs once per line
+"""
+
+from __future__ import annotations
+import functools
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from time import perf_counter_ns
+
+
+# solutions import this module, it keeps away from `dataclasses` and `typing`
+# which would weigh on their import time
+class PhaseStats:
+    __slots__ = ("total_ns", "calls")
+
+    def __init__(self, total_ns: int = 0, calls: int = 0) -> None:
+        self.total_ns = total_ns
+        self.calls = calls
+
+    def __repr__(self) -> str:
+        return f"PhaseStats(total_ns={self.total_ns}, calls={self.calls})"
+
+
+_enabled = False
+_stats: dict[str, PhaseStats] = {}
+
+
+def _record(name: str, start: int) -> None:
+    stats = _stats.setdefault(name, PhaseStats())
+    stats.total_ns += perf_counter_ns() - start
+    stats.calls += 1
+
+
+class phase:
+    """times its `with` block, or every call of the function it decorates"""
+
+    __slots__ = ("name", "_start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._start: int | None = None
+
+    def __enter__(self) -> None:
+        if _enabled:
+            self._start = perf_counter_ns()
+
+    def __exit__(self, *exc_info) -> None:
+        if self._start is not None:
+            _record(self.name, self._start)
+            self._start = None
+
+    def __call__[**P, R](self, f: Callable[P, R]) -> Callable[P, R]:
+        name = self.name
+
+        # the start time is local to each call, recursive calls included
+        @functools.wraps(f)
+        def timed(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not _enabled:
+                return f(*args, **kwargs)
+
+            start = perf_counter_ns()
+            try:
+                return f(*args, **kwargs)
+            finally:
+                _record(name, start)
+
+        return timed
+
+
+@contextmanager
+def collecting() -> Iterator[dict[str, PhaseStats]]:
+    """enables collection, yielding the stats gathered until the block ends"""
+    global _enabled
+
+    _stats.clear()
+    _enabled = True
+    try:
+        yield _stats
+    finally:
+        _enabled = False
@@ -0,0 +1,159 @@
+"""sets of integers stored as sorted, disjoint half-open intervals
+
+an `IntervalSet` keeps the bounds of its intervals in one sorted tuple
+`(start_0, end_0, start_1, end_1...)` with overlapping and adjacent intervals
+merged, so a value is in the set when an odd number of bounds are below or
+equal to it. Clipping bisects the bounds, set operations merge two bound lists
+in one sweep. Sets are immutable and hashable
+"""
+
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import NamedTuple
+
+
+class Interval(NamedTuple):
+    """`[start, end)`"""
+
+    start: int
+    end: int
+
+
+class IntervalSet:
+    __slots__ = ("bounds",)
+
+    def __init__(self, bounds: Sequence[int] = ()):
+        """set of already normalized bounds, see `from_intervals` otherwise"""
+        self.bounds = tuple(bounds)
+
+    @classmethod
+    def of(cls, start: int, end: int) -> IntervalSet:
+        return cls((start, end) if start < end else ())
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[tuple[int, int]]) -> IntervalSet:
+        bounds: list[int] = []
+
+        for start, end in sorted(intervals):
+            if start >= end:
+                continue
+
+            if bounds and start <= bounds[-1]:
+                bounds[-1] = max(bounds[-1], end)
+            else:
+                bounds += (start, end)
+
+        return cls(bounds)
+
+    def __iter__(self) -> Iterator[Interval]:
+        bounds = self.bounds
+        return map(Interval, bounds[::2], bounds[1::2])
+
+    def __len__(self) -> int:
+        """number of intervals"""
+        return len(self.bounds) // 2
+
+    def __bool__(self) -> bool:
+        return bool(self.bounds)
+
+    def __contains__(self, value: int) -> bool:
+        return bisect_right(self.bounds, value) % 2 == 1
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, IntervalSet) and self.bounds == other.bounds
+
+    def __hash__(self) -> int:
+        return hash(self.bounds)
+
+    def __repr__(self) -> str:
+        intervals = ", ".join(f"[{start}, {end})" for start, end in self)
+        return f"IntervalSet({intervals})"
+
+    @property
+    def size(self) -> int:
+        """number of values in the set"""
+        bounds = self.bounds
+        return sum(bounds[1::2]) - sum(bounds[::2])
+
+    @property
+    def start(self) -> int:
+        if not self.bounds:
+            raise ValueError("empty interval set")
+
+        return self.bounds[0]
+
+    @property
+    def end(self) -> int:
+        if not self.bounds:
+            raise ValueError("empty interval set")
+
+        return self.bounds[-1]
+
+    def translate(self, offset: int) -> IntervalSet:
+        return IntervalSet(tuple(bound + offset for bound in self.bounds))
+
+    def clip(self, start: int, end: int) -> IntervalSet:
+        """values of the set in `[start, end)`"""
+        if start >= end:
+            return IntervalSet()
+
+        bounds = self.bounds
+        i = bisect_right(bounds, start)
+        j = bisect_left(bounds, end)
+
+        clipped = list(bounds[i:j])
+        # an odd number of bounds before a value means it's inside an interval
+        if i % 2 == 1:
+            clipped.insert(0, start)
+        if j % 2 == 1:
+            clipped.append(end)
+
+        return IntervalSet(clipped)
+
+    def split(self, value: int) -> tuple[IntervalSet, IntervalSet]:
+        """values of the set below `value`, and the others"""
+        if not self.bounds:
+            return self, self
+
+        return self.clip(self.start, value), self.clip(value, self.end)
+
+    def __or__(self, other: IntervalSet) -> IntervalSet:
+        return combine(self, other, lambda a, b: a or b)
+
+    def __and__(self, other: IntervalSet) -> IntervalSet:
+        return combine(self, other, lambda a, b: a and b)
+
+    def __sub__(self, other: IntervalSet) -> IntervalSet:
+        return combine(self, other, lambda a, b: a and not b)
+
+
+def combine(
+    a: IntervalSet, b: IntervalSet, keep: Callable[[bool, bool], bool]
+) -> IntervalSet:
+    """values for which `keep(in a, in b)`, sweeping the bounds of both sets"""
+    a_bounds, b_bounds = a.bounds, b.bounds
+    i, j = 0, 0
+    inside = False
+
+    bounds: list[int] = []
+
+    while i < len(a_bounds) or j < len(b_bounds):
+        # the smallest bound not passed yet, one of the sets may have none left
+        if j == len(b_bounds) or (i < len(a_bounds) and a_bounds[i] <= b_bounds[j]):
+            value = a_bounds[i]
+        else:
+            value = b_bounds[j]
+
+        if i < len(a_bounds) and a_bounds[i] == value:
+            i += 1
+        if j < len(b_bounds) and b_bounds[j] == value:
+            j += 1
+
+        # the parity of the bounds passed tells whether `value` is in each set
+        kept = keep(i % 2 == 1, j % 2 == 1)
+        if kept != inside:
+            bounds.append(value)
+            inside = kept
+
+    return IntervalSet(bounds)
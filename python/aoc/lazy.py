@@ -0,0 +1,38 @@
+"""deferred imports of heavy dependencies (numpy, networkx...)
+
+`np = lazy_import("numpy")` binds a placeholder module, the actual import only
+happening on the first attribute access, so that importing a solution (or every
+solution) stays cheap until one of them really needs the dependency. A missing
+dependency is only reported then, by that first access raising
+`ModuleNotFoundError`, so that modules which only use it in some of their
+functions (`aoc.grid`'s numpy views) import without it
+"""
+
+from __future__ import annotations
+import importlib
+from time import perf_counter_ns
+from types import ModuleType
+
+# time spent in the deferred imports done so far, by module name
+import_times_ns: dict[str, int] = {}
+
+
+class LazyModule(ModuleType):
+    def __getattr__(self, attr: str) -> object:
+        # only reached until the first load, which copies the module attributes
+        module = load(self.__name__)
+        self.__dict__.update(module.__dict__)
+
+        return getattr(module, attr)
+
+
+def load(name: str) -> ModuleType:
+    start = perf_counter_ns()
+    module = importlib.import_module(name)
+    import_times_ns.setdefault(name, perf_counter_ns() - start)
+
+    return module
+
+
+def lazy_import(name: str) -> ModuleType:
+    return LazyModule(name)
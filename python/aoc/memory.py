@@ -0,0 +1,124 @@
+"""peak memory of a solution, traced with `tracemalloc`
+
+tracing slows solutions down a lot, these runs are never the timed ones
+"""
+
+from __future__ import annotations
+import fnmatch
+import threading
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any
+
+from aoc.inputs import Buffer
+from aoc.registry import Solver
+
+# snapshots are taken when the traced memory grew by that much since the last one
+SNAPSHOT_GROWTH = 1.1
+POLL_INTERVAL_S = 0.001
+
+# allocations of the tracing itself, left out of the snapshots
+SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, threading.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+]
+
+
+@dataclass
+class AllocationSite:
+    location: str
+    size: int
+    count: int
+
+
+@dataclass
+class MemoryResult:
+    peak_bytes: int
+    # biggest allocation sites of the snapshot closest to the peak
+    top_sites: list[AllocationSite]
+
+
+class PeakSnapshotter(threading.Thread):
+    """keeps the statistics of a snapshot taken close to the traced memory peak"""
+
+    def __init__(self, top: int) -> None:
+        super().__init__(daemon=True)
+
+        self.top = top
+        self.sites: list[AllocationSite] = []
+        self._snapshot_size = 0
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(POLL_INTERVAL_S):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self._snapshot_size * SNAPSHOT_GROWTH:
+                self._take_snapshot(current)
+
+    def _take_snapshot(self, size: int) -> None:
+        snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+
+        self._snapshot_size = size
+        self.sites = [
+            AllocationSite(str(stat.traceback), stat.size, stat.count)
+            for stat in snapshot.statistics("lineno")[: self.top]
+        ]
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+def measure_peak(solver: Solver, input: str | Buffer) -> tuple[Any, int]:
+    """answer and peak of the memory allocated while solving, in bytes"""
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        answer = solver(input)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return answer, peak - baseline
+
+
+def find_top_sites(
+    solver: Solver, input: str | Buffer, top: int = 10
+) -> list[AllocationSite]:
+    """allocation sites holding the most memory around the peak
+
+    snapshots themselves allocate traced memory, so this is a separate run from
+    the one measuring the peak
+    """
+    # filters match file names with `fnmatch`, which compiles and caches a regex
+    # per pattern on first use: compiled while tracing, they would show up as
+    # the top sites of the first solution traced
+    for snapshot_filter in SNAPSHOT_FILTERS:
+        fnmatch.fnmatch("", snapshot_filter.filename_pattern)
+
+    tracemalloc.start()
+    snapshotter = PeakSnapshotter(top)
+    snapshotter.start()
+    try:
+        solver(input)
+    finally:
+        snapshotter.stop()
+        tracemalloc.stop()
+
+    return snapshotter.sites
+
+
+def trace(solver: Solver, input: str | Buffer, top: int = 10) -> MemoryResult:
+    _, peak = measure_peak(solver, input)
+    return MemoryResult(peak, find_top_sites(solver, input, top))
+
+
+def format_bytes(size: float) -> str:
+    for unit, scale in (("GB", 1e9), ("MB", 1e6), ("kB", 1e3)):
+        if size >= scale:
+            return f"{size / scale:.2f}{unit}"
+
+    return f"{size:.0f}B"
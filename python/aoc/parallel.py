@@ -0,0 +1,51 @@
+"""sums over the lines of big inputs, spread over worker processes
+
+the input is bound to a module global before the workers are forked, so they
+read the parent's buffer (a mapped file stays mapped once, its pages shared by
+every worker) and only receive the bounds of their chunk of lines, instead of
+a pickled copy of it
+"""
+
+from __future__ import annotations
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from aoc.inputs import Bytes, chunk_bounds, iter_lines
+
+LinesSolver = Callable[[Iterable[bytes]], int]
+
+# the input the forked workers read
+_data: Bytes = b""
+
+
+def solve_chunk(solve_lines: LinesSolver, start: int, end: int) -> int:
+    return solve_lines(iter_lines(_data, start, end))
+
+
+def sum_chunks(
+    solve_lines: LinesSolver, data: Bytes, max_workers: int | None = None
+) -> int:
+    """sum of `solve_lines` over chunks of the lines of `data`, one per worker
+
+    `solve_lines` must be a module level function, sent to the workers by name,
+    and `max_workers` None means one worker per core
+    """
+    global _data
+
+    max_workers = max_workers or os.cpu_count() or 1
+    bounds = chunk_bounds(data, max_workers)
+    if len(bounds) <= 1:
+        return solve_lines(iter_lines(data))
+
+    _data = data
+    try:
+        with ProcessPoolExecutor(
+            len(bounds), mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            starts, ends = zip(*bounds)
+            return sum(executor.map(solve_chunk, repeat(solve_lines), starts, ends))
+    finally:
+        _data = b""
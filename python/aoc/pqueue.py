@@ -0,0 +1,278 @@
+"""priority queues for shortest path searches
+
+every queue maps nodes to priorities: `push` inserts a node or changes its
+priority, `pop` removes a node of minimal priority. The backends trade
+generality for speed:
+
+- `HeapQueue`, a binary heap of plain tuples, changed priorities leaving stale
+  entries behind that `pop` skips
+- `IndexedHeap`, a binary heap tracking the position of each node, changing a
+  priority moves its entry in place (true decrease-key)
+- `BucketQueue`, a list of buckets indexed by priority for small non-negative
+  integer priorities that never go below the last popped one (Dijkstra with
+  small integer weights)
+
+`python -m aoc.pqueue` measures their push/pop throughput
+"""
+
+from __future__ import annotations
+from heapq import heappop, heappush
+from itertools import count
+from typing import Protocol
+
+
+# `BucketQueue` only takes integer priorities
+class PriorityQueue[T, P: float](Protocol):
+    def push(self, node: T, priority: P) -> None: ...
+
+    def pop(self) -> tuple[T, P]: ...
+
+    def __contains__(self, node: T) -> bool: ...
+
+    def __len__(self) -> int: ...
+
+
+class HeapQueue[T]:
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, T]] = []
+        # current priority of the nodes in the queue
+        self._priorities: dict[T, float] = {}
+        # breaks ties so that nodes never get compared
+        self._counter = count()
+
+    def push(self, node: T, priority: float) -> None:
+        self._priorities[node] = priority
+        heappush(self._heap, (priority, next(self._counter), node))
+
+    def pop(self) -> tuple[T, float]:
+        heap, priorities = self._heap, self._priorities
+
+        while heap:
+            priority, _, node = heappop(heap)
+
+            # skip the entries left behind by a priority change or a removal
+            if priorities.get(node) == priority:
+                del priorities[node]
+                return node, priority
+
+        raise KeyError("pop from an empty priority queue")
+
+    def remove(self, node: T) -> None:
+        del self._priorities[node]
+
+    def __contains__(self, node: T) -> bool:
+        return node in self._priorities
+
+    def __len__(self) -> int:
+        return len(self._priorities)
+
+
+class IndexedHeap[T]:
+    def __init__(self) -> None:
+        self._priorities: list[float] = []
+        self._nodes: list[T] = []
+        # index of each node in the heap lists
+        self._positions: dict[T, int] = {}
+
+    def push(self, node: T, priority: float) -> None:
+        k = self._positions.get(node)
+
+        if k is None:
+            k = len(self._nodes)
+            self._priorities.append(priority)
+            self._nodes.append(node)
+            self._positions[node] = k
+            self._sift_up(k)
+            return
+
+        previous = self._priorities[k]
+        self._priorities[k] = priority
+
+        if priority < previous:
+            self._sift_up(k)
+        else:
+            self._sift_down(k)
+
+    def pop(self) -> tuple[T, float]:
+        if not self._nodes:
+            raise KeyError("pop from an empty priority queue")
+
+        node, priority = self._nodes[0], self._priorities[0]
+        self._remove_at(0)
+
+        return node, priority
+
+    def remove(self, node: T) -> None:
+        self._remove_at(self._positions[node])
+
+    def priority(self, node: T) -> float:
+        return self._priorities[self._positions[node]]
+
+    def _remove_at(self, k: int) -> None:
+        priorities, nodes, positions = self._priorities, self._nodes, self._positions
+
+        del positions[nodes[k]]
+
+        last_priority, last_node = priorities.pop(), nodes.pop()
+        if k == len(nodes):
+            return
+
+        # the last entry fills the hole, then moves to where it belongs
+        previous = priorities[k]
+        priorities[k], nodes[k] = last_priority, last_node
+        positions[last_node] = k
+
+        if last_priority < previous:
+            self._sift_up(k)
+        else:
+            self._sift_down(k)
+
+    def _sift_up(self, k: int) -> None:
+        priorities, nodes, positions = self._priorities, self._nodes, self._positions
+        priority, node = priorities[k], nodes[k]
+
+        while k > 0:
+            parent = (k - 1) >> 1
+            if priorities[parent] <= priority:
+                break
+
+            priorities[k], nodes[k] = priorities[parent], nodes[parent]
+            positions[nodes[k]] = k
+            k = parent
+
+        priorities[k], nodes[k] = priority, node
+        positions[node] = k
+
+    def _sift_down(self, k: int) -> None:
+        priorities, nodes, positions = self._priorities, self._nodes, self._positions
+        priority, node = priorities[k], nodes[k]
+        n = len(nodes)
+
+        while True:
+            child = 2 * k + 1
+            if child >= n:
+                break
+            if child + 1 < n and priorities[child + 1] < priorities[child]:
+                child += 1
+            if priority <= priorities[child]:
+                break
+
+            priorities[k], nodes[k] = priorities[child], nodes[child]
+            positions[nodes[k]] = k
+            k = child
+
+        priorities[k], nodes[k] = priority, node
+        positions[node] = k
+
+    def __contains__(self, node: T) -> bool:
+        return node in self._positions
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+
+class BucketQueue[T]:
+    def __init__(self) -> None:
+        self._buckets: list[list[T]] = []
+        self._priorities: dict[T, int] = {}
+        # no bucket below it holds a node
+        self._cursor = 0
+
+    def push(self, node: T, priority: int) -> None:
+        if priority < self._cursor:
+            raise ValueError(
+                f"priority {priority} is below the last popped one ({self._cursor})"
+            )
+
+        buckets = self._buckets
+        if priority >= len(buckets):
+            buckets.extend([] for _ in range(priority + 1 - len(buckets)))
+
+        self._priorities[node] = priority
+        buckets[priority].append(node)
+
+    def pop(self) -> tuple[T, int]:
+        buckets, priorities = self._buckets, self._priorities
+        cursor = self._cursor
+
+        while cursor < len(buckets):
+            bucket = buckets[cursor]
+
+            while bucket:
+                node = bucket.pop()
+
+                # skip the entries left behind by a priority change or a removal
+                if priorities.get(node) == cursor:
+                    del priorities[node]
+                    self._cursor = cursor
+                    return node, cursor
+
+            cursor += 1
+
+        self._cursor = cursor
+        raise KeyError("pop from an empty priority queue")
+
+    def remove(self, node: T) -> None:
+        del self._priorities[node]
+
+    def __contains__(self, node: T) -> bool:
+        return node in self._priorities
+
+    def __len__(self) -> int:
+        return len(self._priorities)
+
+
+# queues of integer nodes with integer priorities, as benchmarked
+QueueType = type[PriorityQueue[int, float]] | type[PriorityQueue[int, int]]
+
+QUEUES: dict[str, QueueType] = {
+    "heap": HeapQueue,
+    "indexed": IndexedHeap,
+    "bucket": BucketQueue,
+}
+
+
+def bench_push_pop(queue_type: QueueType, n: int, seed: int = 0) -> float:
+    """operations per second pushing `n` nodes, decreasing the priority of half
+    of them then popping them all, with priorities below 256"""
+    from random import Random
+    from time import perf_counter_ns
+
+    rng = Random(seed)
+    # the bucket queue can't go below the last popped priority, so every
+    # priority is pushed before the first pop
+    priorities = [rng.randrange(128, 256) for _ in range(n)]
+    decreases = [(rng.randrange(n), rng.randrange(128)) for _ in range(n // 2)]
+
+    queue = queue_type()
+
+    start = perf_counter_ns()
+
+    for node, priority in enumerate(priorities):
+        queue.push(node, priority)
+    for node, priority in decreases:
+        queue.push(node, priority)
+    while queue:
+        queue.pop()
+
+    elapsed_ns = perf_counter_ns() - start
+
+    return (2 * n + len(decreases)) / elapsed_ns * 1e9
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from aoc.bench import format_rate
+
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.pqueue", description="priority queues throughput"
+    )
+    parser.add_argument("--sizes", default="1000,100000", help="comma separated")
+    parser.add_argument("--repeat", type=int, default=5, help="best of")
+    args = parser.parse_args()
+
+    for n in map(int, args.sizes.split(",")):
+        for name, queue_type in QUEUES.items():
+            rate = max(bench_push_pop(queue_type, n) for _ in range(args.repeat))
+            print(f"{name} n={n}: {format_rate(rate, 'ops')}")
@@ -0,0 +1,249 @@
+"""profiles of a solution: sampled call stacks for flame graphs, or cProfile
+
+the sampler is a thread reading the stack of the solving thread every
+millisecond or so with `sys._current_frames`, so the solution runs unmodified
+at close to its normal speed, where cProfile hooks every call. A thread only
+gets the GIL back every switch interval (5ms by default), so sampling lowers it
+to half the sampling interval for the whole process, restoring it afterwards.
+The sampler can still wake up late: every sample stands for the time measured
+since the previous one. Frames are named by their qualified name, which tells
+closures such as `parse.<locals>.get_neighbors_with_costs` apart. Sampled stacks
+are written as a speedscope profile (https://www.speedscope.app) weighted by
+those times, or as collapsed stacks, one `a;b;c count` line per stack, which
+flamegraph.pl and most viewers read
+"""
+
+from __future__ import annotations
+import cProfile
+import json
+import pstats
+import sys
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from types import CodeType
+from typing import NamedTuple
+
+from aoc.inputs import Buffer
+from aoc.registry import Solution, Solver
+
+MODES = ("sample", "cprofile")
+# file suffix of each output format of sampled profiles
+FORMATS = {"speedscope": ".speedscope.json", "collapsed": ".collapsed.txt"}
+
+DEFAULT_PROFILES_DIR = Path("./.aoc/profiles")
+
+Stack = tuple[CodeType, ...]
+
+
+class Sample(NamedTuple):
+    stack: Stack
+    # `perf_counter` time the stack was read at, and time since the previous
+    # sample, in seconds
+    time_s: float
+    elapsed_s: float
+
+
+@dataclass
+class ProfileOptions:
+    mode: str = "sample"
+    directory: Path = DEFAULT_PROFILES_DIR
+    format: str = "speedscope"
+    interval_s: float = 0.001
+    # functions reported by cProfile
+    top: int = 15
+
+
+@dataclass
+class FunctionStats:
+    location: str
+    calls: int
+    # time spent in the function itself, and including the functions it called
+    own_s: float
+    cumulative_s: float
+
+
+@dataclass
+class ProfileResult:
+    mode: str
+    # where the sampled stacks were written
+    path: str | None = None
+    samples: int = 0
+    top_functions: list[FunctionStats] = field(default_factory=list)
+
+
+class StackSampler(threading.Thread):
+    """samples the stacks of a thread below the frame running `root`"""
+
+    def __init__(self, thread_id: int, root: CodeType, interval_s: float) -> None:
+        super().__init__(daemon=True)
+
+        self.thread_id = thread_id
+        self.root = root
+        self.interval_s = interval_s
+        self.samples: list[Sample] = []
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        root = self.root
+        previous_s = perf_counter()
+
+        while not self._stop_event.wait(self.interval_s):
+            frame = sys._current_frames().get(self.thread_id)
+            time_s = perf_counter()
+            elapsed_s, previous_s = time_s - previous_s, time_s
+
+            stack = []
+            while frame is not None and frame.f_code is not root:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+
+            # outside of the solver, before it started or after it returned
+            if frame is None or not stack:
+                continue
+
+            stack.reverse()
+            self.samples.append(Sample(tuple(stack), time_s, elapsed_s))
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+def sample(solver: Solver, input: str | Buffer, interval_s: float) -> list[Sample]:
+    """stacks of the solver, in the order they were sampled
+
+    lowers the switch interval of the process while solving
+    """
+    sampler = StackSampler(threading.get_ident(), sys._getframe().f_code, interval_s)
+
+    # the sampler only gets the GIL back from the solver every switch interval
+    switch_interval = sys.getswitchinterval()
+    try:
+        sys.setswitchinterval(min(switch_interval, interval_s / 2))
+        sampler.start()
+        solver(input)
+    finally:
+        if sampler.is_alive():
+            sampler.stop()
+        sys.setswitchinterval(switch_interval)
+
+    return sampler.samples
+
+
+def frame_name(code: CodeType) -> str:
+    return f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def to_collapsed(samples: list[Sample]) -> str:
+    counts = Counter(sample.stack for sample in samples)
+
+    return "".join(
+        f"{';'.join(map(frame_name, stack))} {count}\n"
+        for stack, count in counts.most_common()
+    )
+
+
+def to_speedscope(samples: list[Sample], name: str) -> str:
+    frames: dict[CodeType, int] = {}
+    stacks = []
+    for sample in samples:
+        stacks.append([frames.setdefault(code, len(frames)) for code in sample.stack])
+
+    # speedscope lays the samples out one after the other, by their weights
+    weights = [sample.elapsed_s * 1000 for sample in samples]
+    # from the time the first sample stands for to the last one
+    duration_ms = (
+        (samples[-1].time_s - samples[0].time_s + samples[0].elapsed_s) * 1000
+        if samples
+        else 0
+    )
+
+    profile = {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "aoc",
+        "shared": {
+            "frames": [
+                {
+                    "name": code.co_qualname,
+                    "file": code.co_filename,
+                    "line": code.co_firstlineno,
+                }
+                for code in frames
+            ]
+        },
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": duration_ms,
+                "samples": stacks,
+                "weights": weights,
+            }
+        ],
+    }
+
+    return json.dumps(profile)
+
+
+def write_samples(
+    samples: list[Sample], solution: Solution, options: ProfileOptions
+) -> Path:
+    name = solution.name.replace("/", "_").replace(":", "_")
+    path = options.directory / f"{name}{FORMATS[options.format]}"
+
+    if options.format == "speedscope":
+        output = to_speedscope(samples, solution.name)
+    else:
+        output = to_collapsed(samples)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, mode="w", encoding="utf-8") as file:
+        file.write(output)
+
+    return path
+
+
+def profile_calls(solver: Solver, input: str | Buffer, top: int) -> list[FunctionStats]:
+    """functions with the highest cumulative time under cProfile"""
+    profiler = cProfile.Profile()
+    profiler.runcall(solver, input)
+
+    profiles = pstats.Stats(profiler).get_stats_profile().func_profiles
+    ranked = sorted(profiles.items(), key=lambda item: item[1].cumtime, reverse=True)
+
+    top_functions = []
+    for name, function in ranked[:top]:
+        # builtins have no file, "~"
+        if function.file_name == "~":
+            location = name
+        else:
+            location = f"{function.file_name}:{function.line_number}({name})"
+
+        # "calls/primitive calls" for recursive functions
+        calls = int(function.ncalls.split("/")[0])
+
+        top_functions.append(
+            FunctionStats(location, calls, function.tottime, function.cumtime)
+        )
+
+    return top_functions
+
+
+def profile(
+    solution: Solution, solver: Solver, input: str | Buffer, options: ProfileOptions
+) -> ProfileResult:
+    if options.mode == "cprofile":
+        return ProfileResult(
+            options.mode, top_functions=profile_calls(solver, input, options.top)
+        )
+
+    samples = sample(solver, input, options.interval_s)
+    path = write_samples(samples, solution, options)
+
+    return ProfileResult(options.mode, str(path), len(samples))
@@ -0,0 +1,206 @@
+from __future__ import annotations
+import importlib
+import re
+import sys
+from collections.abc import Callable, Iterable
+from functools import partial
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Literal, NamedTuple, overload
+
+from aoc.inputs import Buffer
+
+ROOT = Path(__file__).resolve().parent.parent
+SOLUTION_PATH_REGEX = re.compile(r"^day(?P<day>\d{2})/part(?P<part>\d)\.py$")
+
+# the part of the solutions answering both parts at once, with a `dayNN/both.py`
+# parsing and preprocessing the input once, or by solving each part otherwise
+BOTH_PART = 0
+
+# extra arguments mirroring what the `__main__` blocks pass to `solve`
+SOLVE_KWARGS: dict[tuple[int, int], dict[str, Any]] = {
+    (2, 1): {"bag_assumption": {"red": 12, "green": 13, "blue": 14}},
+    (2, BOTH_PART): {"bag_assumption": {"red": 12, "green": 13, "blue": 14}},
+}
+
+# days whose `solve` expects its text input stripped
+# (day 5 relies on the trailing newline, so stripping can't be done blindly)
+STRIPPED_INPUT_DAYS = frozenset(
+    {8, 9, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 23, 24, 25}
+)
+
+# days whose solutions also accept their input as the bytes of the file (a
+# `aoc.inputs.Buffer`, typically mapped in memory)
+BUFFER_INPUT_DAYS = frozenset({1, 2, 4, 6, 7, 9, 15, 18})
+
+# parts of the days with a `solve_stream(lines)` reading their input one line
+# at a time, lines being `bytes` with or without their `\n` (`aoc stream` strips
+# newlines, CRLF ones included)
+STREAM_PARTS = {
+    1: (1, 2),
+    2: (1, 2),
+    4: (1,),
+    6: (1, 2),
+    7: (1, 2),
+    9: (1, 2),
+    18: (1, 2),
+}
+
+# alternative solvers of some parts by engine name, selected with
+# `aoc run --engine NAME`, taking the same input as their `solve`
+ENGINES: dict[tuple[int, int], dict[str, str]] = {
+    (1, 1): {"numpy": "solve_numpy", "parallel": "solve_parallel"},
+    (1, 2): {"numpy": "solve_numpy", "parallel": "solve_parallel"},
+}
+
+# recursion limits the `__main__` blocks raise before solving
+RECURSION_LIMITS = {16: 10000, 23: 5000}
+
+Solver = Callable[[str | Buffer], Any]
+# `solve_stream` of the `STREAM_PARTS`
+LinesSolver = Callable[[Iterable[bytes]], Any]
+
+
+class Solution(NamedTuple):
+    day: int
+    part: int
+    # one of the `ENGINES` of the part, its `solve` if None
+    engine: str | None = None
+
+    @classmethod
+    def both(cls, day: int) -> Solution:
+        return cls(day, BOTH_PART)
+
+    @property
+    def is_both(self) -> bool:
+        return self.part == BOTH_PART
+
+    @property
+    def stem(self) -> str:
+        return "both" if self.is_both else f"part{self.part}"
+
+    @property
+    def name(self) -> str:
+        name = f"day{self.day:02d}/{self.stem}"
+        return name if self.engine is None else f"{name}:{self.engine}"
+
+    @property
+    def engines(self) -> list[str]:
+        return list(ENGINES.get((self.day, self.part), {}))
+
+    def with_engine(self, engine: str) -> Solution:
+        if engine not in self.engines:
+            raise LookupError(f"{self.name} has no {engine} engine")
+
+        return self._replace(engine=engine)
+
+    @property
+    def module_name(self) -> str:
+        return f"day{self.day:02d}.{self.stem}"
+
+    @property
+    def path(self) -> Path:
+        return ROOT / f"day{self.day:02d}" / f"{self.stem}.py"
+
+    @property
+    def parts(self) -> list[Solution]:
+        """the solutions of each part, for both parts"""
+        if not self.is_both:
+            return [self]
+
+        return [solution for solution in discover() if solution.day == self.day]
+
+    @property
+    def source_paths(self) -> list[Path]:
+        """files the answers depend on, every module of the day since parts and
+        `both.py` can reuse each other's code"""
+        return sorted(self.path.parent.glob("*.py"))
+
+    def load(self) -> ModuleType:
+        return importlib.import_module(self.module_name)
+
+    @property
+    def accepts_buffer(self) -> bool:
+        return self.day in BUFFER_INPUT_DAYS
+
+    @property
+    def accepts_stream(self) -> bool:
+        return self.part in STREAM_PARTS.get(self.day, ())
+
+    def prepare(self, input: str | Buffer) -> str | Buffer:
+        # stripping would copy a buffer, solutions accepting them handle the
+        # trailing newline themselves
+        if isinstance(input, str) and self.day in STRIPPED_INPUT_DAYS:
+            return input.strip()
+
+        return input
+
+    @overload
+    def get_solver(self, stream: Literal[False] = False) -> Solver: ...
+
+    @overload
+    def get_solver(self, stream: Literal[True]) -> LinesSolver: ...
+
+    def get_solver(self, stream: bool = False) -> Solver | LinesSolver:
+        """`solve`, or `solve_stream` if `stream`, with the extra arguments the
+        solution needs"""
+        if self.is_both and not self.path.exists():
+            return self._get_parts_solver()
+
+        module = self.load()
+
+        recursion_limit = RECURSION_LIMITS.get(self.day, 0)
+        if recursion_limit > sys.getrecursionlimit():
+            sys.setrecursionlimit(recursion_limit)
+
+        if self.engine is not None:
+            solve = getattr(module, ENGINES[self.day, self.part][self.engine])
+        else:
+            solve = module.solve_stream if stream else module.solve
+
+        return partial(solve, **SOLVE_KWARGS.get((self.day, self.part), {}))
+
+    def _get_parts_solver(self) -> Solver:
+        """both answers from the part solvers, for days without a `both.py`"""
+        solvers = [solution.get_solver() for solution in self.parts]
+
+        def solve(input: str | Buffer) -> tuple[Any, ...]:
+            return tuple(solver(input) for solver in solvers)
+
+        return solve
+
+
+def discover() -> list[Solution]:
+    solutions = []
+
+    for path in ROOT.glob("day*/part*.py"):
+        m = SOLUTION_PATH_REGEX.match(path.relative_to(ROOT).as_posix())
+        if m is not None:
+            solutions.append(Solution(int(m["day"]), int(m["part"])))
+
+    return sorted(solutions)
+
+
+def select(
+    day: int | None = None, part: int | None = None, both: bool = False
+) -> list[Solution]:
+    """solutions of `day` and `part` (all of them if None), or with `both` the
+    solution answering both parts of each selected day"""
+    solutions = [
+        solution
+        for solution in discover()
+        if (day is None or solution.day == day)
+        and (part is None or solution.part == part)
+    ]
+
+    if not solutions:
+        raise LookupError(f"no solution found for {day = }, {part = }")
+
+    if both:
+        return [Solution.both(day) for day in sorted({s.day for s in solutions})]
+
+    return solutions
+
+
+def default_input_path(day: int) -> Path:
+    return Path("./inputs") / f"day{day:02d}.txt"
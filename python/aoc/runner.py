@@ -0,0 +1,269 @@
+from __future__ import annotations
+import json
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from math import inf
+from pathlib import Path
+from statistics import median
+from time import perf_counter_ns
+from typing import Any
+
+from aoc import instrument, lazy, memory, profiling
+from aoc.cache import Cache, cached_solver
+from aoc.inputs import Buffer
+from aoc.registry import Solution, Solver
+
+# median solve times of the last runs, used to start the slowest solutions first
+TIMINGS_PATH = Path("./.aoc/timings.json")
+
+
+@dataclass
+class RunResult:
+    solution: Solution
+    answer: Any
+    times_ns: list[int] = field(default_factory=list)
+    # mean time and calls count per run of each marked phase, when collected
+    phases: dict[str, instrument.PhaseStats] = field(default_factory=dict)
+    # time spent importing the solution module, and the deferred dependencies it
+    # loaded while running (0 when they were already imported in this process)
+    import_ns: int = 0
+    lazy_imports_ns: dict[str, int] = field(default_factory=dict)
+    # peak and allocation sites of an extra traced run, when asked for
+    memory: memory.MemoryResult | None = None
+    # sampled stacks or cProfile statistics of an extra run, when asked for
+    profile: profiling.ProfileResult | None = None
+
+    @property
+    def min_ns(self) -> int:
+        return min(self.times_ns)
+
+    @property
+    def mean_ns(self) -> float:
+        return sum(self.times_ns) / len(self.times_ns)
+
+    @property
+    def median_ns(self) -> float:
+        return median(self.times_ns)
+
+    @property
+    def p95_ns(self) -> float:
+        return percentile(self.times_ns, 95)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "solution": self.solution.name,
+            "answer": self.answer,
+            "runs": len(self.times_ns),
+            "min_ns": self.min_ns,
+            "median_ns": self.median_ns,
+            "p95_ns": self.p95_ns,
+            "import_ns": self.import_ns,
+            "lazy_imports_ns": self.lazy_imports_ns,
+            "phases": {
+                name: {"ns": stats.total_ns, "calls": stats.calls}
+                for name, stats in self.phases.items()
+            },
+            "memory": None if self.memory is None else asdict(self.memory),
+            "profile": None if self.profile is None else asdict(self.profile),
+        }
+
+
+def percentile(values: list[int], q: float) -> float:
+    """linear interpolation between closest ranks, like `numpy.percentile`"""
+    ordered = sorted(values)
+
+    k = (len(ordered) - 1) * q / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def time_solver(
+    solver: Solver, input: str | Buffer, repeat: int
+) -> tuple[Any, list[int]]:
+    answer = None
+    times_ns = []
+
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        answer = solver(input)
+        times_ns.append(perf_counter_ns() - start)
+
+    return answer, times_ns
+
+
+def run(
+    solution: Solution,
+    input: str | Buffer,
+    warmup: int = 0,
+    repeat: int = 1,
+    phases: bool = False,
+    trace_memory: bool = False,
+    cache: Cache | None = None,
+    profile: profiling.ProfileOptions | None = None,
+) -> RunResult:
+    """times `repeat` runs of `solution`, collecting the phases it marks if
+    `phases` is set (which adds a bit of overhead to the measured times)
+
+    `trace_memory` adds untimed runs under `tracemalloc` to report the peak
+    memory and the biggest allocation sites, `profile` an untimed profiled run,
+    and `cache` answers from (and fills) an on-disk cache, so that runs after
+    the first measure cache hits
+    """
+    if repeat < 1:
+        raise ValueError("at least one measured run is needed")
+
+    start = perf_counter_ns()
+    solver = solution.get_solver()
+    import_ns = perf_counter_ns() - start
+
+    if cache is not None:
+        solver = cached_solver(solution, solver, cache)
+
+    input = solution.prepare(input)
+    already_imported = set(lazy.import_times_ns)
+
+    for _ in range(warmup):
+        solver(input)
+
+    if not phases:
+        answer, times_ns = time_solver(solver, input, repeat)
+        result = RunResult(solution, answer, times_ns)
+    else:
+        with instrument.collecting() as stats:
+            answer, times_ns = time_solver(solver, input, repeat)
+
+        mean_stats = {
+            name: instrument.PhaseStats(phase.total_ns // repeat, phase.calls // repeat)
+            for name, phase in stats.items()
+        }
+        result = RunResult(solution, answer, times_ns, mean_stats)
+
+    result.import_ns = import_ns
+    result.lazy_imports_ns = {
+        name: ns
+        for name, ns in lazy.import_times_ns.items()
+        if name not in already_imported
+    }
+
+    if trace_memory:
+        result.memory = memory.trace(solver, input)
+
+    if profile is not None:
+        result.profile = profiling.profile(solution, solver, input, profile)
+
+    return result
+
+
+def run_parallel(
+    jobs: list[tuple[Solution, str | Buffer]],
+    warmup: int = 0,
+    repeat: int = 1,
+    phases: bool = False,
+    trace_memory: bool = False,
+    cache: Cache | None = None,
+    profile: profiling.ProfileOptions | None = None,
+    max_workers: int | None = None,
+    timings: dict[str, float] | None = None,
+) -> Iterator[RunResult]:
+    """runs every (solution, input) job in a process pool, yielding results as
+    they complete
+
+    inputs are pickled to the workers, so they can't be mapped files
+
+    jobs are submitted slowest first according to `timings`, unknown ones being
+    assumed slow, so that the total time gets close to the slowest job's one
+    """
+    timings = timings or {}
+    ordered_jobs = sorted(jobs, key=lambda job: -timings.get(job[0].name, inf))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                run,
+                solution,
+                input,
+                warmup,
+                repeat,
+                phases,
+                trace_memory,
+                cache,
+                profile,
+            )
+            for solution, input in ordered_jobs
+        ]
+
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def load_timings(path: Path = TIMINGS_PATH) -> dict[str, float]:
+    if not path.exists():
+        return {}
+
+    with open(path, mode="r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_timings(results: list[RunResult], path: Path = TIMINGS_PATH) -> None:
+    timings = load_timings(path)
+    timings.update({result.solution.name: result.median_ns for result in results})
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, mode="w", encoding="utf-8") as file:
+        json.dump(dict(sorted(timings.items())), file, indent=2)
+        file.write("\n")
+
+
+def format_ns(ns: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f}{unit}"
+
+    return f"{ns:.0f}ns"
+
+
+def format_result(result: RunResult) -> str:
+    line = (
+        f"{result.solution.name}: answer = {result.answer}"
+        f" | min {format_ns(result.min_ns)}"
+        f" | median {format_ns(result.median_ns)}"
+        f" | p95 {format_ns(result.p95_ns)}"
+        f" ({len(result.times_ns)} runs)"
+        f" | import {format_ns(result.import_ns)}"
+    )
+
+    for name, ns in result.lazy_imports_ns.items():
+        line += f"\n    lazy import of {name}: {format_ns(ns)} (during the first run)"
+
+    for name, stats in result.phases.items():
+        share = stats.total_ns / result.mean_ns
+        line += (
+            f"\n    {name}: {format_ns(stats.total_ns)} ({share:.0%})"
+            f" in {stats.calls} call(s)"
+        )
+
+    if result.memory is not None:
+        line += f"\n    peak memory: {memory.format_bytes(result.memory.peak_bytes)}"
+        for site in result.memory.top_sites:
+            line += (
+                f"\n      {site.location}: {memory.format_bytes(site.size)}"
+                f" in {site.count} block(s)"
+            )
+
+    if result.profile is not None and result.profile.path is not None:
+        line += (
+            f"\n    {result.profile.samples} stack samples written to"
+            f" {result.profile.path}"
+        )
+    elif result.profile is not None:
+        line += "\n    top functions by cumulative time:"
+        for function in result.profile.top_functions:
+            line += (
+                f"\n      {function.location}: {function.cumulative_s:.3f}s"
+                f" ({function.own_s:.3f}s own) in {function.calls} call(s)"
+            )
+
+    return line
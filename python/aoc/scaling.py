@@ -0,0 +1,111 @@
+"""empirical complexity of the solutions
+
+solutions are timed on generated inputs of geometrically growing sizes, the
+growth exponent being the slope of the time against the input size (as counted
+by the generators' `size`) on log-log axes. Generators list the parts whose
+loops don't grow with that size in `UNSCALED_PARTS`, with the reason
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from math import log
+from typing import Any
+
+from aoc import generators, runner
+from aoc.registry import Solution
+
+DEFAULT_SCALES = (0.125, 0.25, 0.5, 1.0)
+
+
+@dataclass
+class Point:
+    scale: float
+    n: int
+    time_ns: int
+
+
+@dataclass
+class ScalingResult:
+    solution: Solution
+    unit: str
+    points: list[Point]
+    exponent: float
+    # coefficient of determination of the fit, how much a power law explains
+    r2: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "solution": self.solution.name,
+            "unit": self.unit,
+            "exponent": self.exponent,
+            "r2": self.r2,
+            "points": [
+                {"scale": p.scale, "n": p.n, "time_ns": p.time_ns} for p in self.points
+            ],
+        }
+
+
+def fit_power_law(xs: list[float], ys: list[float]) -> tuple[float, float]:
+    """slope and r² of the least squares line through (log x, log y)"""
+    log_xs = [log(x) for x in xs]
+    log_ys = [log(y) for y in ys]
+
+    mean_x = sum(log_xs) / len(log_xs)
+    mean_y = sum(log_ys) / len(log_ys)
+
+    sxx = sum((x - mean_x) ** 2 for x in log_xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(log_xs, log_ys))
+    syy = sum((y - mean_y) ** 2 for y in log_ys)
+
+    if sxx == 0:
+        raise ValueError("the input sizes must differ to fit an exponent")
+
+    slope = sxy / sxx
+    r2 = 1.0 if syy == 0 else sxy**2 / (sxx * syy)
+
+    return slope, r2
+
+
+def unscaled_reason(solution: Solution) -> str | None:
+    """why the generated inputs can't measure how `solution` scales, if so"""
+    generator = generators.get_generator(solution.day)
+    return getattr(generator, "UNSCALED_PARTS", {}).get(solution.part)
+
+
+def measure(
+    solution: Solution,
+    scales: list[float],
+    seed: int = 0,
+    repeat: int = 3,
+) -> ScalingResult:
+    reason = unscaled_reason(solution)
+    if reason is not None:
+        raise ValueError(f"{solution.name} can't be scaled, {reason}")
+
+    generator = generators.get_generator(solution.day)
+
+    points = []
+    for scale in sorted(scales):
+        input = generators.generate(solution.day, scale=scale, seed=seed)
+        # the fastest run is the least noisy estimate of the cost
+        result = runner.run(solution, input, warmup=1, repeat=repeat)
+        points.append(Point(scale, generator.size(input), result.min_ns))
+
+    # scales too close to each other can generate inputs of the same size
+    distinct = list({p.n: p for p in points}.values())
+    exponent, r2 = fit_power_law(
+        [p.n for p in distinct], [max(p.time_ns, 1) for p in distinct]
+    )
+
+    return ScalingResult(solution, generator.UNIT, points, exponent, r2)
+
+
+def format_scaling(result: ScalingResult) -> str:
+    first, last = result.points[0], result.points[-1]
+
+    return (
+        f"day{result.solution.day:02d} part{result.solution.part}:"
+        f" O(n^{result.exponent:.1f}) in {result.unit}"
+        f" (r² {result.r2:.2f}, n from {first.n} to {last.n},"
+        f" {runner.format_ns(first.time_ns)} to {runner.format_ns(last.time_ns)})"
+    )
@@ -0,0 +1,180 @@
+"""local server solving inputs with every solution already imported
+
+starting the interpreter and importing a solution (compiling its regexes,
+building its tables) costs more than solving for most days. The server keeps a
+pool of worker processes, one per core by default, each of which imported every
+solution once, and answers over HTTP on localhost:
+
+- `POST /solve/<day>/<part>` with the input as the body, answering
+  `{"solution", "answer", "time_ns"}` (or `{"error"}` with a 4xx status)
+- `GET /solutions`, the names of the solutions
+
+`Client` talks to it, keeping its connection open between requests
+"""
+
+from __future__ import annotations
+import http.client
+import json
+import os
+import re
+import signal
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter_ns
+from typing import Any
+
+from aoc.inputs import Buffer, normalize_newlines
+from aoc.registry import Solution, Solver, discover
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8023
+
+SOLVE_PATH_REGEX = re.compile(r"^/solve/(?P<day>\d+)/(?P<part>\d+)$")
+
+
+@dataclass
+class SolveResult:
+    solution: Solution
+    answer: Any
+    # solve time in the worker, without the request round trip
+    time_ns: int
+
+
+# solvers of the pool workers, set up once by `init_worker`
+_worker_solvers: dict[Solution, Solver] = {}
+
+
+def init_worker() -> None:
+    # Ctrl-C reaches the whole process group, the server shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    for solution in discover():
+        _worker_solvers[solution] = solution.get_solver()
+
+
+def solve_in_worker(solution: Solution, data: bytes) -> tuple[Any, int]:
+    solver = _worker_solvers[solution]
+
+    input: str | Buffer
+    if solution.accepts_buffer:
+        input = data
+    else:
+        # like the input files read in text mode
+        input = solution.prepare(bytes(normalize_newlines(data)).decode())
+
+    start = perf_counter_ns()
+    answer = solver(input)
+
+    return answer, perf_counter_ns() - start
+
+
+class SolveHandler(BaseHTTPRequestHandler):
+    # keeps connections open, so that clients don't reconnect for each request
+    protocol_version = "HTTP/1.1"
+    # the headers and the body are written separately, which Nagle's algorithm
+    # would delay until the client acknowledges the headers
+    disable_nagle_algorithm = True
+    server: SolveServer
+
+    def do_GET(self) -> None:
+        if self.path != "/solutions":
+            self.send_json(404, {"error": f"unknown path {self.path}"})
+            return
+
+        self.send_json(200, [solution.name for solution in self.server.solutions])
+
+    def do_POST(self) -> None:
+        data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        m = SOLVE_PATH_REGEX.match(self.path)
+        if m is None:
+            self.send_json(404, {"error": f"unknown path {self.path}"})
+            return
+
+        solution = Solution(int(m["day"]), int(m["part"]))
+        if solution not in self.server.solutions:
+            self.send_json(404, {"error": f"no solution {solution.name}"})
+            return
+
+        future = self.server.executor.submit(solve_in_worker, solution, data)
+        try:
+            answer, time_ns = future.result()
+        except Exception as e:
+            self.send_json(422, {"error": f"{type(e).__name__}: {e}"})
+            return
+
+        self.send_json(
+            200, {"solution": solution.name, "answer": answer, "time_ns": time_ns}
+        )
+
+    def send_json(self, status: int, body: Any) -> None:
+        payload = json.dumps(body).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class SolveServer(ThreadingHTTPServer):
+    # the worker processes are what solves, request threads only wait for them
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], executor: Executor) -> None:
+        super().__init__(address, SolveHandler)
+
+        self.executor = executor
+        self.solutions = frozenset(discover())
+
+
+def serve(
+    host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, max_workers: int | None = None
+) -> None:
+    """serves until interrupted, `max_workers` None meaning one worker per core"""
+    max_workers = max_workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers, initializer=init_worker) as executor:
+        # workers are started on demand, start them all before the first request
+        list(executor.map(int, range(max_workers)))
+
+        with SolveServer((host, port), executor) as server:
+            print(f"serving on http://{host}:{server.server_port}", flush=True)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+
+
+class Client:
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        self._connection = http.client.HTTPConnection(host, port)
+
+    def request(self, method: str, path: str, body: bytes | None = None) -> Any:
+        self._connection.request(method, path, body)
+        response = self._connection.getresponse()
+        result = json.loads(response.read())
+
+        if response.status != 200:
+            raise RuntimeError(result["error"])
+
+        return result
+
+    def solutions(self) -> list[str]:
+        return self.request("GET", "/solutions")
+
+    def solve(self, solution: Solution, input: str | bytes) -> SolveResult:
+        data = input.encode() if isinstance(input, str) else input
+        result = self.request("POST", f"/solve/{solution.day}/{solution.part}", data)
+
+        return SolveResult(solution, result["answer"], result["time_ns"])
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
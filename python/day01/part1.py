@@ -1,17 +1,101 @@
-def solve(input: str) -> int:
+from __future__ import annotations
+from collections.abc import Iterable
+
+from aoc.inputs import Buffer, MappedInput, iter_lines, to_bytes
+from aoc.parallel import sum_chunks
+from aoc.lazy import lazy_import
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+else:
+    np = lazy_import("numpy")
+
+# every byte but the ASCII digits, removed with `bytes.translate`
+NON_DIGITS = bytes(c for c in range(256) if c not in b"0123456789")
+
+# bytes given at once to numpy, whose index arrays take 8 bytes per digit
+NUMPY_CHUNK_SIZE = 1 << 26
+
+
+def solve_stream(lines: Iterable[bytes]) -> int:
     total = 0
 
-    for line in input.splitlines(keepends=False):
-        digits = [int(c) for c in line if c.isdigit()]
-        line_value = 10 * digits[0] + digits[-1]
+    for line in lines:
+        digits = line.translate(None, NON_DIGITS)
+        if not digits:
+            raise ValueError(f"no digit in line {line!r}")
+
+        line_value = 10 * (digits[0] - ord("0")) + digits[-1] - ord("0")
         total += line_value
 
     return total
 
 
+def solve(input: str | Buffer) -> int:
+    return solve_stream(iter_lines(to_bytes(input)))
+
+
+def solve_parallel(input: str | Buffer) -> int:
+    """`solve` with the lines split between one process per core"""
+    return sum_chunks(solve_stream, to_bytes(input))
+
+
+def sum_line_values(chunk: NDArray[np.uint8]) -> int:
+    """sum of the values of whole lines"""
+    # bytes below "0" wrap around, only digits end up below 10
+    values = chunk - np.uint8(ord("0"))
+    digit_positions = np.flatnonzero(values < 10)
+
+    newlines = np.flatnonzero(chunk == ord("\n"))
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.append(newlines, len(chunk))
+
+    # there's no line after a trailing newline
+    if starts[-1] == len(chunk):
+        starts, ends = starts[:-1], ends[:-1]
+
+    # a line without any digit would take them from the next lines
+    first_indices = np.searchsorted(digit_positions, starts)
+    last_indices = np.searchsorted(digit_positions, ends) - 1
+    no_digit = first_indices > last_indices
+    if no_digit.any():
+        k = int(np.argmax(no_digit))
+        line = chunk[starts[k] : ends[k]].tobytes()
+        raise ValueError(f"no digit in line {line!r}")
+
+    # first digit at or after the start of each line, last one before its end
+    firsts = digit_positions[first_indices]
+    lasts = digit_positions[last_indices]
+
+    return int(
+        10 * values[firsts].sum(dtype=np.int64) + values[lasts].sum(dtype=np.int64)
+    )
+
+
+def solve_numpy(input: str | Buffer) -> int:
+    """`solve` with array operations instead of a loop over lines, in chunks of
+    whole lines"""
+    data = to_bytes(input)
+    total = 0
+
+    start = 0
+    while start < len(data):
+        end = min(start + NUMPY_CHUNK_SIZE, len(data))
+        if end < len(data):
+            end = data.find(b"\n", end) + 1 or len(data)
+
+        chunk = np.frombuffer(data, dtype=np.uint8, count=end - start, offset=start)
+        total += sum_line_values(chunk)
+        start = end
+
+    return total
+
+
 if __name__ == "__main__":
-    with open("./inputs/day01.txt", mode="r", encoding="utf-8") as file:
-        input = file.read()
+    with MappedInput("./inputs/day01.txt") as input:
+        answer = solve(input.data)
 
-    answer = solve(input)
     print(f"{answer = }")
@@ -1,9 +1,28 @@
-from itertools import product
+from __future__ import annotations
+from collections.abc import Iterable
+
+from aoc.automaton import Automaton
+from aoc.inputs import Buffer, MappedInput, iter_lines, to_bytes
+from aoc.lazy import lazy_import
+from aoc.parallel import sum_chunks
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+else:
+    np = lazy_import("numpy")
 
 WORD_TOKENS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
 DIGIT_TOKENS = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
 TOKENS = DIGIT_TOKENS + WORD_TOKENS
 
+# bytes given at once to numpy, each word taking a pass over them
+NUMPY_CHUNK_SIZE = 1 << 24
+# value of the positions where no token starts
+NO_DIGIT = 255
+
 
 def token_to_digit(token: str) -> int:
     if len(token) == 1 and token[0].isdigit():
@@ -12,29 +31,110 @@ def token_to_digit(token: str) -> int:
         return WORD_TOKENS.index(token) + 1
 
 
-def get_tokens(line: str) -> list[str]:
-    # some digits can be overlapping, like `oneight`...
-    tokens = []
-    for i, token in product(range(len(line)), TOKENS):
-        if line[i:].startswith(token):
-            tokens.append(token)
-    return tokens
+TOKENS_AUTOMATON = Automaton([token.encode() for token in TOKENS])
+REVERSED_TOKENS_AUTOMATON = TOKENS_AUTOMATON.reversed()
+TOKENS_DIGITS = [token_to_digit(token) for token in TOKENS]
 
 
-def solve(input: str) -> int:
+def solve_stream(lines: Iterable[bytes]) -> int:
     total = 0
 
-    for line in input.splitlines(keepends=False):
-        digits = [token_to_digit(token) for token in get_tokens(line)]
-        line_value = 10 * digits[0] + digits[-1]
+    for line in lines:
+        # no token contains another one, so the token ending first is also the
+        # first one to start
+        first = TOKENS_AUTOMATON.first(line)
+        last = REVERSED_TOKENS_AUTOMATON.first(reversed(line))
+        if first is None or last is None:
+            raise ValueError(f"no digit or digit word in line {line!r}")
+
+        line_value = 10 * TOKENS_DIGITS[first] + TOKENS_DIGITS[last]
         total += line_value
 
     return total
 
 
+def solve(input: str | Buffer) -> int:
+    return solve_stream(iter_lines(to_bytes(input)))
+
+
+def solve_parallel(input: str | Buffer) -> int:
+    """`solve` with the lines split between one process per core"""
+    return sum_chunks(solve_stream, to_bytes(input))
+
+
+def get_digits(chunk: NDArray[np.uint8]) -> NDArray[np.uint8]:
+    """digit of the token starting at each position, `NO_DIGIT` elsewhere"""
+    # bytes below "0" wrap around, only digits end up below 10
+    digits = chunk - np.uint8(ord("0"))
+    digits[digits >= 10] = NO_DIGIT
+
+    # tokens start at different positions even when they overlap (`oneight`)
+    for digit, word in enumerate(WORD_TOKENS, start=1):
+        starts_count = len(chunk) - len(word) + 1
+        if starts_count <= 0:
+            continue
+
+        matches = chunk[:starts_count] == ord(word[0])
+        for k, c in enumerate(word[1:], start=1):
+            matches &= chunk[k : k + starts_count] == ord(c)
+
+        digits[:starts_count][matches] = digit
+
+    return digits
+
+
+def sum_line_values(chunk: NDArray[np.uint8]) -> int:
+    """sum of the values of whole lines"""
+    digits = get_digits(chunk)
+    digit_positions = np.flatnonzero(digits != NO_DIGIT)
+
+    newlines = np.flatnonzero(chunk == ord("\n"))
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.append(newlines, len(chunk))
+
+    # there's no line after a trailing newline
+    if starts[-1] == len(chunk):
+        starts, ends = starts[:-1], ends[:-1]
+
+    # a line without any token would take them from the next lines
+    first_indices = np.searchsorted(digit_positions, starts)
+    last_indices = np.searchsorted(digit_positions, ends) - 1
+    no_digit = first_indices > last_indices
+    if no_digit.any():
+        k = int(np.argmax(no_digit))
+        line = chunk[starts[k] : ends[k]].tobytes()
+        raise ValueError(f"no digit or digit word in line {line!r}")
+
+    # first token starting in each line, and last one (tokens never span lines)
+    firsts = digit_positions[first_indices]
+    lasts = digit_positions[last_indices]
+
+    return int(
+        10 * digits[firsts].sum(dtype=np.int64) + digits[lasts].sum(dtype=np.int64)
+    )
+
+
+def solve_numpy(input: str | Buffer) -> int:
+    """`solve` with array operations over the whole buffer, in chunks of whole
+    lines"""
+    data = to_bytes(input)
+    total = 0
+
+    start = 0
+    while start < len(data):
+        end = min(start + NUMPY_CHUNK_SIZE, len(data))
+        if end < len(data):
+            end = data.find(b"\n", end) + 1 or len(data)
+
+        chunk = np.frombuffer(data, dtype=np.uint8, count=end - start, offset=start)
+        total += sum_line_values(chunk)
+        start = end
+
+    return total
+
+
 if __name__ == "__main__":
-    with open("./inputs/day01.txt", mode="r", encoding="utf-8") as file:
-        input = file.read()
+    with MappedInput("./inputs/day01.txt") as input:
+        answer = solve(input.data)
 
-    answer = solve(input)
     print(f"{answer = }")
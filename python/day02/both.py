@@ -0,0 +1,28 @@
+from aoc.inputs import Buffer, MappedInput, iter_lines, to_bytes
+from aoc.instrument import phase
+from day02.part1 import Bag, game_is_possible, parse_game
+from day02.part2 import minimal_bag, power
+
+
+# parsing is interleaved with solving, line by line
+@phase("stream")
+def solve(input: str | Buffer, bag_assumption: Bag) -> tuple[int, int]:
+    answer_1, answer_2 = 0, 0
+
+    for line in iter_lines(to_bytes(input)):
+        game = parse_game(line)
+
+        if game_is_possible(game, bag_assumption):
+            answer_1 += game.id
+        answer_2 += power(minimal_bag(game))
+
+    return answer_1, answer_2
+
+
+if __name__ == "__main__":
+    bag_assumption: Bag = {"red": 12, "green": 13, "blue": 14}
+
+    with MappedInput("./inputs/day02.txt") as input:
+        answers = solve(input.data, bag_assumption)
+
+    print(f"{answers = }")
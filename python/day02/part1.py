@@ -1,10 +1,14 @@
-import re
+from array import array
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing_extensions import TypedDict
 
+from aoc.inputs import Buffer, MappedInput, iter_lines, to_bytes
+from aoc.instrument import phase
+
 
 # defining a few types because type hinting >:3
-class Outcome(TypedDict):
+class Bag(TypedDict):
     red: int
     green: int
     blue: int
@@ -13,59 +17,156 @@ class Outcome(TypedDict):
 @dataclass
 class Game:
     id: int
-    outcomes: list[Outcome]
+    # counts of each draw, one after the other in the order of `COLORS`
+    counts: array[int]
 
 
-Bag = Outcome
 # done with type definitions...
 
+# red, green and blue, the order of the counts of a draw
 COLORS = ["red", "green", "blue"]
 
+# what follows a color: the end of the line, the next count of the same draw,
+# or the next draw. Lines get a NUL appended, so that the end of the line is a
+# separator like the others and the scan needs no bounds checks
+END, NEXT_COUNT, NEXT_DRAW = range(3)
+SEPARATORS = {b"\0": END, b",": NEXT_COUNT, b";": NEXT_DRAW}
+# color tokens, with the separator ending them, to their color, their length
+# and what follows
+COLOR_TOKENS = {
+    color.encode() + separator: (k, len(color) + 1, kind)
+    for k, color in enumerate(COLORS)
+    for separator, kind in SEPARATORS.items()
+}
+# length of the color token starting with each byte, 0 if none does
+TOKEN_LENGTHS = [0] * 256
+for color in COLORS:
+    TOKEN_LENGTHS[ord(color[0])] = len(color) + 1
+# value of each byte as a digit, -1 if it isn't one
+DIGITS = [-1] * 256
+for d in range(10):
+    DIGITS[ord("0") + d] = d
+
+SPACE, COLON = b" :"
+
+
+def malformed(line: bytes, offset: int, expected: str) -> ValueError:
+    return ValueError(
+        f"malformed game, expected {expected} at offset {offset}: {line!r}"
+    )
 
-def parse_outcome(raw_outcome: str) -> Outcome:
-    outcome: Outcome = {"red": 0, "green": 0, "blue": 0}
 
-    for color_data in raw_outcome.split(", "):
-        count, color = color_data.split()
-        outcome[color] = int(count)  # type: ignore
+def mismatch(s: bytes, pos: int, expected: bytes) -> int:
+    """offset of the first byte of `s` from `pos` on that differs from
+    `expected`, `s` ending with a NUL"""
+    for k, c in enumerate(expected):
+        if s[pos + k] != c:
+            return pos + k
 
-    return outcome
+    return pos + len(expected)
 
 
-def parse_game(line: str) -> Game:
-    m = re.match(
-        r"^Game (?P<game_id>\d+): (?P<game_outcomes>\d+ (red|green|blue)(, \d+ (red|green|blue))*(; \d+ (red|green|blue)(, \d+ (red|green|blue))*)*)$",
-        line,
-    )
+def color_error(line: bytes, s: bytes, pos: int) -> ValueError:
+    color = next((color for color in COLORS if ord(color[0]) == s[pos]), None)
+    if color is None:
+        return malformed(line, pos, "a color")
+
+    offset = mismatch(s, pos, color.encode())
+    if offset < pos + len(color):
+        return malformed(line, offset, repr(color))
+
+    return malformed(line, offset, "',', ';' or the end of the line")
+
+
+def parse_game(line: bytes) -> Game:
+    """parses `line` in a single scan, raising a `ValueError` with the offset of
+    the first byte that doesn't fit"""
+    end = len(line)
+    if line.endswith(b"\n"):
+        end -= 2 if line.endswith(b"\r\n") else 1
+    s = line[:end] + b"\0"
+
+    if not s.startswith(b"Game "):
+        raise malformed(line, mismatch(s, 0, b"Game "), "'Game '")
+
+    pos = 5
+    id = DIGITS[s[pos]]
+    if id < 0:
+        raise malformed(line, pos, "a game id")
+    pos += 1
+    while (digit := DIGITS[s[pos]]) >= 0:
+        id = id * 10 + digit
+        pos += 1
+    if s[pos] != COLON:
+        raise malformed(line, pos, "':'")
+    pos += 1
+
+    counts = array("l")
+    draw = [0, 0, 0]
 
-    assert m is not None
+    while True:
+        if s[pos] != SPACE:
+            raise malformed(line, pos, "' '")
+        pos += 1
 
-    id = int(m["game_id"])
-    outcomes_raw = m["game_outcomes"]
-    outcomes = [parse_outcome(raw_outcome) for raw_outcome in outcomes_raw.split("; ")]
+        count = DIGITS[s[pos]]
+        if count < 0:
+            raise malformed(line, pos, "a count")
+        pos += 1
+        while (digit := DIGITS[s[pos]]) >= 0:
+            count = count * 10 + digit
+            pos += 1
 
-    return Game(id=id, outcomes=outcomes)
+        if s[pos] != SPACE:
+            raise malformed(line, pos, "' '")
+        pos += 1
 
+        token = COLOR_TOKENS.get(s[pos : pos + TOKEN_LENGTHS[s[pos]]])
+        if token is None:
+            raise color_error(line, s, pos)
+        color, length, kind = token
 
-def outcome_is_possible(outcome: Outcome, bag_assumption: Bag) -> bool:
-    return all(outcome[color] <= bag_assumption[color] for color in COLORS)  # type: ignore
+        draw[color] = count
+        pos += length
+
+        if kind == NEXT_COUNT:
+            continue
+
+        counts.extend(draw)
+        if kind == END:
+            break
+        draw = [0, 0, 0]
+
+    # a NUL in the line ends it early
+    if pos != end + 1:
+        raise malformed(line, pos - 1, "',' or ';'")
+
+    return Game(id, counts)
 
 
 def game_is_possible(game: Game, bag_assumption: Bag) -> bool:
     return all(
-        outcome_is_possible(outcome, bag_assumption) for outcome in game.outcomes
+        max(game.counts[k::3], default=0) <= bag_assumption[color]  # type: ignore
+        for k, color in enumerate(COLORS)
     )
 
 
-def solve(input: str, bag_assumption: Bag) -> int:
-    games = [parse_game(line) for line in input.splitlines()]
+# parsing is interleaved with solving, line by line
+@phase("stream")
+def solve_stream(lines: Iterable[bytes], bag_assumption: Bag) -> int:
+    games = (parse_game(line) for line in lines)
+
     return sum(game.id for game in games if game_is_possible(game, bag_assumption))
 
 
-if __name__ == "__main__":
-    with open("./inputs/day02.txt", mode="r", encoding="utf-8") as file:
-        input = file.read()
+def solve(input: str | Buffer, bag_assumption: Bag) -> int:
+    return solve_stream(iter_lines(to_bytes(input)), bag_assumption)
+
 
+if __name__ == "__main__":
     bag_assumption: Bag = {"red": 12, "green": 13, "blue": 14}
-    answer = solve(input, bag_assumption)
+
+    with MappedInput("./inputs/day02.txt") as input:
+        answer = solve(input.data, bag_assumption)
+
     print(f"{answer = }")
@@ -1,59 +1,49 @@
 import re
 
-NumberLocation = tuple[int, int, int]
-Position = tuple[int, int]
+from aoc.grid import Grid
+from aoc.instrument import phase
 
+NUMBER_REGEX = re.compile(rb"\d+")
+EMPTY = ord(".")
 
-def is_symbol(c: str) -> bool:
-    return c != "."
+# flat indices of the first and past the last digits of a number in the grid
+NumberLocation = tuple[int, int]
 
 
-def is_symbol_at(line_index: int, col_index: int, lines: list[str]) -> bool:
-    lines_count, cols_count = len(lines), len(lines[0])
+def get_neighboring_indices(number_location: NumberLocation, grid: Grid) -> list[int]:
+    start, end = number_location
+    neighbors = [start - 1, end]
 
-    return (
-        0 <= line_index < lines_count
-        and 0 <= col_index < cols_count
-        and is_symbol(lines[line_index][col_index])
-    )
-
-
-def get_neighboring_positions(number_location: NumberLocation) -> list[Position]:
-    line_index, start, end = number_location
-    neighbors = [(line_index, start - 1), (line_index, end)]
-
-    for col_index in range(start - 1, end + 1):
-        neighbors.append((line_index - 1, col_index))
-        neighbors.append((line_index + 1, col_index))
+    for k in range(start - 1, end + 1):
+        neighbors.append(k - grid.stride)
+        neighbors.append(k + grid.stride)
 
     return neighbors
 
 
-def is_part_number_at(number_location: NumberLocation, lines: list[str]) -> bool:
+def is_part_number_at(number_location: NumberLocation, grid: Grid) -> bool:
+    # the padding is empty, neighbors outside of the puzzle are never symbols
     return any(
-        is_symbol_at(i, j, lines) for i, j in get_neighboring_positions(number_location)
+        grid.data[k] != EMPTY for k in get_neighboring_indices(number_location, grid)
     )
 
 
-def get_numbers_locations(lines: list[str]) -> list[tuple[int, NumberLocation]]:
-    locations = []
-
-    for line_index, line in enumerate(lines):
-        for regex_match in re.finditer("\d+", line):
-            number = int(regex_match[0])
-            start, end = regex_match.span()
-            locations.append((number, (line_index, start, end)))
-
-    return locations
+@phase("parse")
+def get_numbers_locations(grid: Grid) -> list[tuple[int, NumberLocation]]:
+    # numbers can't span rows since they're separated by the padding
+    return [
+        (int(regex_match[0]), regex_match.span())
+        for regex_match in NUMBER_REGEX.finditer(grid.data)
+    ]
 
 
 def solve(input: str) -> int:
-    lines = input.splitlines()
+    grid = Grid.parse(input, pad=".")
 
     return sum(
         number
-        for (number, number_location) in get_numbers_locations(lines)
-        if is_part_number_at(number_location, lines)
+        for (number, number_location) in get_numbers_locations(grid)
+        if is_part_number_at(number_location, grid)
     )
 
 
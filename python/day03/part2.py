@@ -2,65 +2,53 @@ import re
 from collections import defaultdict
 from math import prod
 
-NumberLocation = tuple[int, int, int]
-Position = tuple[int, int]
+from aoc.grid import Grid
+from aoc.instrument import phase
 
+NUMBER_REGEX = re.compile(rb"\d+")
+GEAR = ord("*")
 
-def is_gear(c: str) -> bool:
-    return c == "*"
+# flat indices of the first and past the last digits of a number in the grid
+NumberLocation = tuple[int, int]
 
 
-def is_gear_at(line_index: int, col_index: int, lines: list[str]) -> bool:
-    lines_count, cols_count = len(lines), len(lines[0])
+def get_neighboring_indices(number_location: NumberLocation, grid: Grid) -> list[int]:
+    start, end = number_location
+    neighbors = [start - 1, end]
 
-    return (
-        0 <= line_index < lines_count
-        and 0 <= col_index < cols_count
-        and is_gear(lines[line_index][col_index])
-    )
-
-
-def get_neighboring_positions(number_location: NumberLocation) -> list[Position]:
-    line_index, start, end = number_location
-    neighbors = [(line_index, start - 1), (line_index, end)]
-
-    for col_index in range(start - 1, end + 1):
-        neighbors.append((line_index - 1, col_index))
-        neighbors.append((line_index + 1, col_index))
+    for k in range(start - 1, end + 1):
+        neighbors.append(k - grid.stride)
+        neighbors.append(k + grid.stride)
 
     return neighbors
 
 
-def get_numbers_locations(lines: list[str]) -> list[tuple[int, NumberLocation]]:
-    locations = []
-
-    for line_index, line in enumerate(lines):
-        for regex_match in re.finditer(r"\d+", line):
-            number = int(regex_match[0])
-            start, end = regex_match.span()
-            locations.append((number, (line_index, start, end)))
-
-    return locations
+@phase("parse")
+def get_numbers_locations(grid: Grid) -> list[tuple[int, NumberLocation]]:
+    # numbers can't span rows since they're separated by the padding
+    return [
+        (int(regex_match[0]), regex_match.span())
+        for regex_match in NUMBER_REGEX.finditer(grid.data)
+    ]
 
 
-def get_gears_neighboring_numbers(lines: list[str]) -> defaultdict[Position, list[int]]:
+def get_gears_neighboring_numbers(grid: Grid) -> defaultdict[int, list[int]]:
     gears_neighboring_numbers = defaultdict(list)
 
-    for number, location in get_numbers_locations(lines):
-        for i, j in get_neighboring_positions(location):
-            if is_gear_at(i, j, lines):
-                gear_position = (i, j)
-                gears_neighboring_numbers[gear_position].append(number)
+    for number, location in get_numbers_locations(grid):
+        for k in get_neighboring_indices(location, grid):
+            if grid.data[k] == GEAR:
+                gears_neighboring_numbers[k].append(number)
 
     return gears_neighboring_numbers
 
 
 def solve(input: str) -> int:
-    lines = input.splitlines()
+    grid = Grid.parse(input, pad=".")
 
     return sum(
         prod(neighboring_numbers)
-        for _, neighboring_numbers in get_gears_neighboring_numbers(lines).items()
+        for _, neighboring_numbers in get_gears_neighboring_numbers(grid).items()
         if len(neighboring_numbers) == 2
     )
 
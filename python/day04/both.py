@@ -0,0 +1,26 @@
+from aoc.inputs import Buffer, MappedInput, iter_lines, to_bytes
+from aoc.instrument import phase
+from day04.part1 import count_matches, parse_line
+
+
+def solve(input: str | Buffer) -> tuple[int, int]:
+    with phase("parse"):
+        matches_counts = [
+            count_matches(*parse_line(line)) for line in iter_lines(to_bytes(input))
+        ]
+
+    points = sum(2 ** (count - 1) for count in matches_counts if count != 0)
+
+    copies = [1] * len(matches_counts)
+    for i, matches_count in enumerate(matches_counts):
+        for j in range(i + 1, i + 1 + matches_count):
+            copies[j] += copies[i]
+
+    return points, sum(copies)
+
+
+if __name__ == "__main__":
+    with MappedInput("./inputs/day04.txt") as input:
+        answers = solve(input.data)
+
+    print(f"{answers = }")
@@ -1,11 +1,15 @@
 import re
+from collections.abc import Iterable
+
+from aoc.inputs import Buffer, MappedInput, iter_lines, to_bytes
+from aoc.instrument import phase
 
 REGEX = re.compile(
-    r"^Card\s+\d+:(?P<winning_numbers>(\s+\d+)*) \|(?P<obtained_numbers>(\s+\d+)*)$"
+    rb"^Card\s+\d+:(?P<winning_numbers>(\s+\d+)*) \|(?P<obtained_numbers>(\s+\d+)*)$"
 )
 
 
-def parse_line(line: str) -> tuple[list[int], list[int]]:
+def parse_line(line: bytes) -> tuple[list[int], list[int]]:
     m = REGEX.match(line)
     assert m is not None
 
@@ -25,10 +29,12 @@ def count_matches(winning_numbers: list[int], obtained_numbers: list[int]) -> in
     return sum(1 for number in obtained_numbers if number in winning_numbers_)
 
 
-def solve(input: str) -> int:
+# parsing is interleaved with solving, line by line
+@phase("stream")
+def solve_stream(lines: Iterable[bytes]) -> int:
     answer = 0
 
-    for line in input.splitlines():
+    for line in lines:
         winning_numbers, obtained_numbers = parse_line(line)
         matches_count = count_matches(winning_numbers, obtained_numbers)
         if matches_count != 0:
@@ -37,9 +43,12 @@ def solve(input: str) -> int:
     return answer
 
 
+def solve(input: str | Buffer) -> int:
+    return solve_stream(iter_lines(to_bytes(input)))
+
+
 if __name__ == "__main__":
-    with open("./inputs/day04.txt", mode="r", encoding="utf-8") as file:
-        input = file.read()
+    with MappedInput("./inputs/day04.txt") as input:
+        answer = solve(input.data)
 
-    answer = solve(input)
     print(f"{answer = }")
@@ -1,8 +1,11 @@
 import re
 from dataclasses import dataclass
 
+from aoc.inputs import Buffer, MappedInput, iter_lines, to_bytes
+from aoc.instrument import phase
+
 REGEX = re.compile(
-    r"^Card\s+\d+:(?P<winning_numbers>(\s+\d+)*) \|(?P<obtained_numbers>(\s+\d+)*)$"
+    rb"^Card\s+\d+:(?P<winning_numbers>(\s+\d+)*) \|(?P<obtained_numbers>(\s+\d+)*)$"
 )
 
 
@@ -12,7 +15,7 @@ class CardData:
     copies: int = 1
 
 
-def parse_line(line: str) -> tuple[list[int], list[int]]:
+def parse_line(line: bytes) -> tuple[list[int], list[int]]:
     m = REGEX.match(line)
     assert m is not None
 
@@ -32,12 +35,13 @@ def count_matches(winning_numbers: list[int], obtained_numbers: list[int]) -> in
     return sum(1 for number in obtained_numbers if number in winning_numbers_)
 
 
-def solve(input: str) -> int:
+def solve(input: str | Buffer) -> int:
     cards_data: list[CardData] = []
-    for i, line in enumerate(input.splitlines()):
-        winning_numbers, obtained_numbers = parse_line(line)
-        matches_count = count_matches(winning_numbers, obtained_numbers)
-        cards_data.append(CardData(matches_count, copies=1))
+    with phase("parse"):
+        for i, line in enumerate(iter_lines(to_bytes(input))):
+            winning_numbers, obtained_numbers = parse_line(line)
+            matches_count = count_matches(winning_numbers, obtained_numbers)
+            cards_data.append(CardData(matches_count, copies=1))
 
     # update copies counts
     for i, card_data in enumerate(cards_data):
@@ -52,8 +56,7 @@ def solve(input: str) -> int:
 
 
 if __name__ == "__main__":
-    with open("./inputs/day04.txt", mode="r", encoding="utf-8") as file:
-        input = file.read()
+    with MappedInput("./inputs/day04.txt") as input:
+        answer = solve(input.data)
 
-    answer = solve(input)
     print(f"{answer = }")
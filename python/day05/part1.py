@@ -1,6 +1,8 @@
 from enum import Enum
 import re
 
+from aoc.instrument import phase
+
 TableEntry = tuple[int, int, int]
 
 
@@ -14,6 +16,7 @@ class TableNames(Enum):
     HUMIDITY_TO_LOCATION = "humidity-to-location"
 
 
+@phase("parse")
 def parse(input: str) -> tuple[list[int], dict[TableNames, list[TableEntry]]]:
     def get_seeds(input: str) -> list[int]:
         m = re.search(r"^seeds:(?P<values>( \d+)*)$", input, flags=re.MULTILINE)
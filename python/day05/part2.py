@@ -1,9 +1,11 @@
 from __future__ import annotations
 from enum import Enum
 import re
-from typing import NamedTuple
 from collections.abc import Callable
 
+from aoc.instrument import phase
+from aoc.intervals import IntervalSet
+
 
 class TableName(Enum):
     SEED_TO_SOIL = "seed-to-soil"
@@ -21,47 +23,18 @@ Tables = dict[TableName, TableData]
 MappingFn = Callable[[int], int]
 
 
-class Interval(NamedTuple):
-    start: int
-    end: int
-
-    def intersection(self: Interval, other: Interval) -> Interval | None:
-        intersection_start = max(self.start, other.start)
-        intersection_end = min(self.end, other.end)
-
-        if intersection_start > intersection_end:
-            return None
-
-        return Interval(intersection_start, intersection_end)
-
-    def substract(self, other: Interval) -> list[Interval]:
-        result = []
-
-        if other.start > self.start:
-            start = self.start
-            end = min(self.end, other.start - 1)
-            result.append(Interval(start, end))
-
-        if other.end < self.end:
-            start = max(self.start, other.end + 1)
-            end = self.end
-            result.append(Interval(start, end))
-
-        return result
-
-
-def parse(input: str) -> tuple[list[Interval], Tables]:
-    def get_seeds(input: str) -> list[Interval]:
+@phase("parse")
+def parse(input: str) -> tuple[IntervalSet, Tables]:
+    def get_seeds(input: str) -> IntervalSet:
         m = re.match(r"seeds:(?P<values>( \d+)*)\n", input)
 
         assert m is not None
 
         values = [int(s) for s in m["values"].split()]
 
-        return [
-            Interval(start, start + length - 1)
-            for start, length in zip(values[::2], values[1::2])
-        ]
+        return IntervalSet.from_intervals(
+            (start, start + length) for start, length in zip(values[::2], values[1::2])
+        )
 
     def get_table(table_name: TableName, input: str) -> list[tuple[int, int, int]]:
         m = re.search(
@@ -82,40 +55,23 @@ def parse(input: str) -> tuple[list[Interval], Tables]:
     return get_seeds(input), get_tables(input)
 
 
-def convert_interval(interval: Interval, convertion_table: TableData) -> list[Interval]:
-    new_intervals = []
-
-    leftovers = [interval]
-    for d_start, s_start, length in convertion_table:
-        offset = d_start - s_start
-        source_interval = Interval(s_start, s_start + length - 1)
-
-        leftovers_ = []
-
-        for i in leftovers:
-            if intersection := i.intersection(source_interval):
-                leftovers_.extend(i.substract(intersection))
-                new_interval = Interval(
-                    intersection.start + offset, intersection.end + offset
-                )
-                new_intervals.append(new_interval)
-            else:
-                leftovers_.append(i)
-
-        leftovers = leftovers_
-
-    return new_intervals + leftovers
-
-
 def convert_intervals(
-    intervals: list[Interval], convertion_table: TableData
-) -> list[Interval]:
-    new_intervals = []
+    intervals: IntervalSet, convertion_table: TableData
+) -> IntervalSet:
+    converted = [
+        interval
+        for d_start, s_start, length in convertion_table
+        for interval in intervals.clip(s_start, s_start + length).translate(
+            d_start - s_start
+        )
+    ]
 
-    for interval in intervals:
-        new_intervals.extend(convert_interval(interval, convertion_table))
+    # values outside of every source range are kept as they are
+    sources = IntervalSet.from_intervals(
+        (s_start, s_start + length) for _, s_start, length in convertion_table
+    )
 
-    return new_intervals
+    return IntervalSet.from_intervals([*converted, *(intervals - sources)])
 
 
 def solve(input: str) -> int:
@@ -124,7 +80,7 @@ def solve(input: str) -> int:
     for table_name in TableName:
         intervals = convert_intervals(intervals, tables[table_name])
 
-    return min(interval.start for interval in intervals)
+    return intervals.start
 
 
 if __name__ == "__main__":
@@ -1,14 +1,25 @@
-def parse(input: str) -> tuple[list[int], list[int]]:
-    lines = input.splitlines()
+from collections.abc import Iterable
+from itertools import islice
 
-    times = [int(t_str) for t_str in lines[0].removeprefix("Time:").split()]
-    distances = [int(d_str) for d_str in lines[1].removeprefix("Distance:").split()]
+from aoc.inputs import Buffer, MappedInput, iter_lines, to_bytes
+from aoc.instrument import phase
+
+
+@phase("parse")
+def parse(lines: Iterable[bytes]) -> tuple[list[int], list[int]]:
+    # only the first two lines are read
+    time_line, distance_line = islice(lines, 2)
+
+    times = [int(t_str) for t_str in time_line.removeprefix(b"Time:").split()]
+    distances = [
+        int(d_str) for d_str in distance_line.removeprefix(b"Distance:").split()
+    ]
 
     return times, distances
 
 
-def solve(input: str) -> int:
-    times, distances = parse(input)
+def solve_stream(lines: Iterable[bytes]) -> int:
+    times, distances = parse(lines)
 
     answer = 1
 
@@ -25,9 +36,12 @@ def solve(input: str) -> int:
     return answer
 
 
+def solve(input: str | Buffer) -> int:
+    return solve_stream(iter_lines(to_bytes(input)))
+
+
 if __name__ == "__main__":
-    with open("./inputs/day06.txt", mode="r", encoding="utf-8") as file:
-        input = file.read()
+    with MappedInput("./inputs/day06.txt") as input:
+        answer = solve(input.data)
 
-    answer = solve(input)
     print(f"{answer = }")
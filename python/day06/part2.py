@@ -1,14 +1,23 @@
-def parse(input: str) -> tuple[int, int]:
-    lines = input.splitlines()
+from collections.abc import Iterable
+from itertools import islice
 
-    time = int(lines[0].removeprefix("Time:").replace(" ", ""))
-    distance = int(lines[1].removeprefix("Distance:").replace(" ", ""))
+from aoc.inputs import Buffer, MappedInput, iter_lines, to_bytes
+from aoc.instrument import phase
+
+
+@phase("parse")
+def parse(lines: Iterable[bytes]) -> tuple[int, int]:
+    # only the first two lines are read
+    time_line, distance_line = islice(lines, 2)
+
+    time = int(time_line.removeprefix(b"Time:").replace(b" ", b""))
+    distance = int(distance_line.removeprefix(b"Distance:").replace(b" ", b""))
 
     return time, distance
 
 
-def solve(input: str) -> int:
-    time, distance = parse(input)
+def solve_stream(lines: Iterable[bytes]) -> int:
+    time, distance = parse(lines)
     # too lazy for solving a quadratic equation...
     wins = 0
     for charge_time in range(time + 1):
@@ -19,9 +28,12 @@ def solve(input: str) -> int:
     return wins
 
 
+def solve(input: str | Buffer) -> int:
+    return solve_stream(iter_lines(to_bytes(input)))
+
+
 if __name__ == "__main__":
-    with open("./inputs/day06.txt", mode="r", encoding="utf-8") as file:
-        input = file.read()
+    with MappedInput("./inputs/day06.txt") as input:
+        answer = solve(input.data)
 
-    answer = solve(input)
     print(f"{answer = }")
@@ -1,7 +1,11 @@
 from collections import defaultdict
+from collections.abc import Iterable
 from enum import Enum
 from functools import cache
 
+from aoc.inputs import Buffer, MappedInput, iter_lines, to_bytes
+from aoc.instrument import phase
+
 
 class HandType(Enum):
     FIVE_OF_A_KIND = -1
@@ -56,21 +60,23 @@ def hand_comparison_key(hand: str) -> tuple[int, tuple[int, ...]]:
     return get_hand_type(hand).value, tuple(get_card_strength(card) for card in hand)
 
 
-def parse(input: str) -> list[tuple[str, int]]:
+@phase("parse")
+def parse(lines: Iterable[bytes]) -> list[tuple[str, int]]:
     hands = []
 
-    for line in input.splitlines():
-        hand, bid_str = line.split()
+    for line in lines:
+        raw_hand, bid_str = line.split()
         bid = int(bid_str)
-        hand = hand
+        # hands are short, only they get decoded
+        hand = raw_hand.decode()
 
         hands.append((hand, bid))
 
     return hands
 
 
-def solve(input: str) -> int:
-    hands = parse(input)
+def solve_stream(lines: Iterable[bytes]) -> int:
+    hands = parse(lines)
     sorted_hands = sorted(hands, key=lambda x: hand_comparison_key(x[0]))
 
     winnings = 0
@@ -80,9 +86,12 @@ def solve(input: str) -> int:
     return winnings
 
 
+def solve(input: str | Buffer) -> int:
+    return solve_stream(iter_lines(to_bytes(input)))
+
+
 if __name__ == "__main__":
-    with open("./inputs/day07.txt", encoding="utf-8") as file:
-        input = file.read()
+    with MappedInput("./inputs/day07.txt") as input:
+        answer = solve(input.data)
 
-    answer = solve(input)
     print(f"{answer = }")
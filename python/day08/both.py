@@ -0,0 +1,42 @@
+from math import lcm
+
+from day08.part1 import Node, parse
+
+
+def count_steps(node: Node, moves: list[list[Node]], is_end: list[bool]) -> int:
+    """steps to an end node, `moves` holding the next nodes of every step of
+    the instructions"""
+    steps = 0
+
+    while True:
+        for next_nodes in moves:
+            node = next_nodes[node]
+            steps += 1
+
+            if is_end[node]:
+                return steps
+
+
+def solve(input: str) -> tuple[int, int]:
+    instructions, labels, successors = parse(input)
+    moves = [successors[instruction] for instruction in instructions]
+
+    is_end = [label == "ZZZ" for label in labels]
+    steps = count_steps(labels.index("AAA"), moves, is_end)
+
+    is_end = [label.endswith("Z") for label in labels]
+    ghosts_steps = [
+        count_steps(u, moves, is_end)
+        for u, label in enumerate(labels)
+        if label.endswith("A")
+    ]
+
+    return steps, lcm(*ghosts_steps)
+
+
+if __name__ == "__main__":
+    with open("./inputs/day08.txt", encoding="utf-8") as file:
+        input = file.read().strip()
+
+    answers = solve(input)
+    print(f"{answers = }")
@@ -1,43 +1,63 @@
 import re
-from collections.abc import Callable
-from typing import Literal
 
-Node = str
-Instruction = Literal["LR"]
+from aoc.instrument import phase
 
+NODE_REGEX = re.compile(
+    r"(?P<Node>\w{3}) = \((?P<LeftNeighbor>\w{3}), (?P<RightNeighbor>\w{3})\)"
+)
 
-def parse(input: str) -> tuple[list[Instruction], Callable[[Node, Instruction], Node]]:
-    lines = input.splitlines()
+# dense index of a node, in order of the input lines
+Node = int
+# position of the neighbor to go to, 0 for left and 1 for right
+Instruction = int
+# next node of every node, for the left and the right instruction: the
+# adjacency of a graph whose nodes all have 2 edges, as two flat lists that the
+# walks index once per step
+Successors = tuple[list[Node], list[Node]]
 
-    instructions: list[Instruction] = list(lines[0])  # type: ignore
-    neighbors = {}
 
-    for line in lines[2:]:
-        m = re.fullmatch(
-            r"(?P<Node>\w{3}) = \((?P<LeftNeighbor>\w{3}), (?P<RightNeighbor>\w{3})\)",
-            line,
-        )
-        assert m is not None
-        neighbors[m["Node"]] = (m["LeftNeighbor"], m["RightNeighbor"])
+def parse_nodes(input: str) -> tuple[list[str], Successors]:
+    """labels of the nodes, and their successors"""
+    nodes = []
+    # every line after the instructions and the blank line is a node
+    for line in input.splitlines()[2:]:
+        m = NODE_REGEX.fullmatch(line)
+        if m is None:
+            raise ValueError(f"malformed node line {line!r}")
+        nodes.append(m.groups())
 
-    def get_next(node: Node, instruction: Instruction) -> Node:
-        return neighbors[node][0 if instruction == "L" else 1]
+    labels = [node for node, _, _ in nodes]
+    index = {label: u for u, label in enumerate(labels)}
+    successors = (
+        [index[left] for _, left, _ in nodes],
+        [index[right] for _, _, right in nodes],
+    )
 
-    return instructions, get_next
+    return labels, successors
+
+
+@phase("parse")
+def parse(input: str) -> tuple[list[Instruction], list[str], Successors]:
+    instructions = [0 if c == "L" else 1 for c in input[: input.index("\n")]]
+    labels, successors = parse_nodes(input)
+
+    return instructions, labels, successors
 
 
 def solve(input: str) -> int:
-    instructions, get_next = parse(input)
+    instructions, labels, successors = parse(input)
+    moves = [successors[instruction] for instruction in instructions]
 
     steps = 0
-    current_node = "AAA"
+    current_node = labels.index("AAA")
+    end = labels.index("ZZZ")
 
-    while current_node != "ZZZ":
-        for instruction in instructions:
-            current_node = get_next(current_node, instruction)
+    while current_node != end:
+        for next_nodes in moves:
+            current_node = next_nodes[current_node]
             steps += 1
 
-            if current_node == "ZZZ":
+            if current_node == end:
                 break
 
     return steps
@@ -1,49 +1,58 @@
 import re
 from math import lcm
-from collections.abc import Callable
-from typing import Literal
 
-Node = str
-Instruction = Literal["LR"]
+from aoc.instrument import phase
 
+NODE_REGEX = re.compile(
+    r"(?P<Node>\w{3}) = \((?P<LeftNeighbor>\w{3}), (?P<RightNeighbor>\w{3})\)"
+)
 
-def parse(
-    input: str,
-) -> tuple[list[Instruction], set[Node], Callable[[Node, Instruction], Node]]:
-    lines = input.splitlines()
-
-    instructions: list[Instruction] = list(lines[0])  # type: ignore
+# dense index of a node, in order of the input lines
+Node = int
+# position of the neighbor to go to, 0 for left and 1 for right
+Instruction = int
+# next node of every node, for the left and the right instruction: the
+# adjacency of a graph whose nodes all have 2 edges, as two flat lists that the
+# walks index once per step
+Successors = tuple[list[Node], list[Node]]
 
-    starting_nodes = set()
-    neighbors = {}
 
-    for line in lines[2:]:
-        m = re.fullmatch(
-            r"(?P<Node>\w{3}) = \((?P<LeftNeighbor>\w{3}), (?P<RightNeighbor>\w{3})\)",
-            line,
-        )
+def parse_nodes(input: str) -> tuple[list[str], Successors]:
+    """labels of the nodes, and their successors"""
+    nodes = []
+    # every line after the instructions and the blank line is a node
+    for line in input.splitlines()[2:]:
+        m = NODE_REGEX.fullmatch(line)
+        if m is None:
+            raise ValueError(f"malformed node line {line!r}")
+        nodes.append(m.groups())
 
-        assert m is not None, line
+    labels = [node for node, _, _ in nodes]
+    index = {label: u for u, label in enumerate(labels)}
+    successors = (
+        [index[left] for _, left, _ in nodes],
+        [index[right] for _, _, right in nodes],
+    )
 
-        node, left_neighbor, right_neighbor = (
-            m["Node"],
-            m["LeftNeighbor"],
-            m["RightNeighbor"],
-        )
+    return labels, successors
 
-        if node.endswith("A"):
-            starting_nodes.add(node)
 
-        neighbors[node] = (left_neighbor, right_neighbor)
+@phase("parse")
+def parse(
+    input: str,
+) -> tuple[list[Instruction], set[Node], list[bool], Successors]:
+    instructions = [0 if c == "L" else 1 for c in input[: input.index("\n")]]
+    labels, successors = parse_nodes(input)
 
-    def get_next(node: Node, instruction: Instruction) -> Node:
-        return neighbors[node][0 if instruction == "L" else 1]
+    starting_nodes = {u for u, label in enumerate(labels) if label.endswith("A")}
+    is_end = [label.endswith("Z") for label in labels]
 
-    return instructions, starting_nodes, get_next
+    return instructions, starting_nodes, is_end, successors
 
 
 def solve(input: str) -> int:
-    instructions, starting_nodes, get_neighbor = parse(input)
+    instructions, starting_nodes, is_end, successors = parse(input)
+    moves = [successors[instruction] for instruction in instructions]
 
     steps_per_starting_node = []
     for node in starting_nodes:
@@ -51,10 +60,10 @@ def solve(input: str) -> int:
 
         stop = False
         while not stop:
-            for instruction in instructions:
-                node = get_neighbor(node, instruction)
+            for next_nodes in moves:
+                node = next_nodes[node]
                 steps += 1
-                if node.endswith("Z"):
+                if is_end[node]:
                     stop = True
                     break
 
@@ -0,0 +1,42 @@
+from aoc.inputs import Buffer, MappedInput, iter_lines, to_bytes
+from aoc.instrument import phase
+from day09.part1 import parse_line
+
+
+def extrapolate_both_ways(sequence: list[int]) -> tuple[int, int]:
+    """next and previous values, from the same differences"""
+    next_value, previous_value = 0, 0
+    sign = 1
+
+    diffs = sequence
+    while not all(x == 0 for x in diffs):
+        next_value += diffs[-1]
+        previous_value += sign * diffs[0]
+        sign = -sign
+        diffs = [diffs[i + 1] - diffs[i] for i in range(len(diffs) - 1)]
+
+    return next_value, previous_value
+
+
+# parsing is interleaved with solving, line by line
+@phase("stream")
+def solve(input: str | Buffer) -> tuple[int, int]:
+    answer_1, answer_2 = 0, 0
+
+    for line in iter_lines(to_bytes(input)):
+        # buffers aren't stripped, skipping the blank lines does it
+        if not line.strip():
+            continue
+
+        next_value, previous_value = extrapolate_both_ways(parse_line(line))
+        answer_1 += next_value
+        answer_2 += previous_value
+
+    return answer_1, answer_2
+
+
+if __name__ == "__main__":
+    with MappedInput("./inputs/day09.txt") as input:
+        answers = solve(input.data)
+
+    print(f"{answers}")
@@ -1,10 +1,11 @@
-def parse(input) -> list[list[int]]:
-    sequences = []
+from collections.abc import Iterable
 
-    for line in input.strip().splitlines():
-        sequences.append([int(num_str) for num_str in line.split()])
+from aoc.inputs import Buffer, MappedInput, iter_lines, to_bytes
+from aoc.instrument import phase
 
-    return sequences
+
+def parse_line(line: bytes) -> list[int]:
+    return [int(num_str) for num_str in line.split()]
 
 
 def extrapolate(sequence: list[int]) -> int:
@@ -18,15 +19,21 @@ def extrapolate(sequence: list[int]) -> int:
     return result
 
 
-def solve(input: str) -> int:
-    sequences = parse(input)
+# parsing is interleaved with solving, line by line
+@phase("stream")
+def solve_stream(lines: Iterable[bytes]) -> int:
+    # buffers aren't stripped, skipping the blank lines does it
+    sequences = (parse_line(line) for line in lines if line.strip())
 
     return sum(extrapolate(sequence) for sequence in sequences)
 
 
+def solve(input: str | Buffer) -> int:
+    return solve_stream(iter_lines(to_bytes(input)))
+
+
 if __name__ == "__main__":
-    with open("./inputs/day09.txt", encoding="utf-8") as file:
-        input = file.read().strip()
+    with MappedInput("./inputs/day09.txt") as input:
+        answer = solve(input.data)
 
-    answer = solve(input)
     print(f"{answer}")
@@ -1,3 +1,7 @@
+from aoc.instrument import phase
+
+
+@phase("parse")
 def parse(input: str) -> tuple[list[tuple[int, int]], set[int], set[int]]:
     coords = []
 
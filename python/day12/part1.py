@@ -1,6 +1,9 @@
 import re
 
+from aoc.instrument import phase
 
+
+@phase("parse")
 def parse(input: str) -> list[tuple[str, tuple[int, ...]]]:
     result = []
 
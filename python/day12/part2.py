@@ -2,7 +2,10 @@ from collections import defaultdict
 from collections.abc import Iterator
 from itertools import product
 
+from aoc.instrument import phase
 
+
+@phase("parse")
 def parse(input: str) -> list[tuple[str, tuple[int, ...]]]:
     result = []
 
@@ -1,19 +1,24 @@
-Pattern = list[list[str]]
+from aoc.instrument import phase
 
+# rows (or columns) of a pattern as bitmasks of their rocks
+Pattern = list[int]
 
-def parse(input: str) -> list[Pattern]:
-    patterns = []
+ROCKS_TO_BITS = str.maketrans("#.", "10")
 
-    for pattern_str in input.split("\n\n"):
-        pattern = [[c for c in line] for line in pattern_str.splitlines()]
-        patterns.append(pattern)
 
-    return patterns
+@phase("parse")
+def parse(input: str) -> list[tuple[Pattern, Pattern]]:
+    """rows and columns of each pattern, straight from its lines"""
+    patterns = []
 
+    # translated once for every pattern, their lines are binary numbers
+    for pattern_str in input.translate(ROCKS_TO_BITS).split("\n\n"):
+        lines = pattern_str.splitlines()
+        rows = [int(line, 2) for line in lines]
+        columns = [int("".join(column), 2) for column in zip(*lines)]
+        patterns.append((rows, columns))
 
-def transpose(pattern: Pattern) -> Pattern:
-    lines_count, cols_count = len(pattern), len(pattern[0])
-    return [[pattern[i][j] for i in range(lines_count)] for j in range(cols_count)]
+    return patterns
 
 
 def get_horizontal_symetries(pattern: Pattern) -> list[tuple[int, int]]:
@@ -30,10 +35,10 @@ def get_horizontal_symetries(pattern: Pattern) -> list[tuple[int, int]]:
 
 
 def find_symetries(
-    pattern: Pattern,
+    rows: Pattern, columns: Pattern
 ) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
-    horizontal_syms = get_horizontal_symetries(pattern)
-    vertical_syms = get_horizontal_symetries(transpose(pattern))
+    horizontal_syms = get_horizontal_symetries(rows)
+    vertical_syms = get_horizontal_symetries(columns)
 
     return vertical_syms, horizontal_syms
 
@@ -41,8 +46,8 @@ def find_symetries(
 def solve(input: str) -> int:
     answer = 0
 
-    for pattern in parse(input):
-        vertical_syms, horizontal_syms = find_symetries(pattern)
+    for rows, columns in parse(input):
+        vertical_syms, horizontal_syms = find_symetries(rows, columns)
 
         assert len(vertical_syms) + len(horizontal_syms) == 1
 
@@ -1,45 +1,38 @@
-from copy import deepcopy
+from aoc.grid import Grid
+from aoc.instrument import phase
 
-Platform = list[list[str]]
 
+@phase("parse")
+def parse(input: str) -> Grid:
+    return Grid.parse(input)
 
-def parse(input: str) -> Platform:
-    platform = []
 
-    for line in input.splitlines():
-        platform.append([c for c in line])
+def roll(line: bytes) -> bytes:
+    """`line` with its rounded rocks rolled towards its start"""
+    segments = []
 
-    return platform
+    for segment in line.split(b"#"):
+        rocks_count = segment.count(b"O")
+        segments.append(b"O" * rocks_count + b"." * (len(segment) - rocks_count))
 
+    return b"#".join(segments)
 
-def tilt_north(platform: Platform) -> Platform:
-    platform = deepcopy(platform)
 
-    lines_count = len(platform)
-    cols_count = len(platform[0])
+def tilt_north(platform: Grid) -> Grid:
+    platform = platform.copy()
 
-    for j in range(cols_count):
-        last_static = -1
-        for i in range(lines_count):
-            match platform[i][j]:
-                case "#":
-                    last_static = i
-                case ".":
-                    continue
-                case "O":
-                    platform[i][j] = "."
-                    platform[last_static + 1][j] = "O"
-                    last_static = last_static + 1
+    for j in range(platform.width):
+        platform.set_column_bytes(j, roll(platform.column_bytes(j)))
 
     return platform
 
 
-def compute_load(platform: Platform) -> int:
+def compute_load(platform: Grid) -> int:
     load = 0
 
-    n = len(platform)
-    for i, line in enumerate(platform):
-        load += sum(1 for c in line if c == "O") * (n - i)
+    n = platform.height
+    for i in range(n):
+        load += platform.row_bytes(i).count(b"O") * (n - i)
 
     return load
 
@@ -1,88 +1,65 @@
-from copy import deepcopy
 from itertools import count
 
-Platform = list[list[str]]
-PlatformAsTuples = tuple[tuple[str, ...], ...]
+from aoc.grid import Grid
+from aoc.instrument import phase
 
 
-def parse(input: str) -> Platform:
-    platform = []
+@phase("parse")
+def parse(input: str) -> Grid:
+    return Grid.parse(input)
 
-    for line in input.splitlines():
-        platform.append([c for c in line])
 
-    return platform
-
-
-def to_tuples(platform: Platform) -> PlatformAsTuples:
-    return tuple(tuple(line) for line in platform)
-
-
-def rotate(platform: Platform) -> Platform:
-    lines_count = len(platform)
-    cols_count = len(platform[0])
+def roll(line: bytes) -> bytes:
+    """`line` with its rounded rocks rolled towards its start"""
+    segments = []
 
-    return [
-        [platform[i][j] for i in reversed(range(lines_count))]
-        for j in range(cols_count)
-    ]
+    for segment in line.split(b"#"):
+        rocks_count = segment.count(b"O")
+        segments.append(b"O" * rocks_count + b"." * (len(segment) - rocks_count))
 
+    return b"#".join(segments)
 
-def tilt_north(platform: Platform) -> Platform:
-    platform = deepcopy(platform)
-
-    lines_count = len(platform)
-    cols_count = len(platform[0])
-
-    for j in range(cols_count):
-        last_static = -1
-        for i in range(lines_count):
-            match platform[i][j]:
-                case "#":
-                    last_static = i
-                case ".":
-                    continue
-                case "O":
-                    platform[i][j] = "."
-                    platform[last_static + 1][j] = "O"
-                    last_static = last_static + 1
-
-    return platform
 
+def cycle(platform: Grid) -> Grid:
+    platform = platform.copy()
 
-def cycle(platform: Platform) -> Platform:
-    for _ in range(4):
-        platform = tilt_north(platform)
-        platform = rotate(platform)
+    for j in range(platform.width):  # north
+        platform.set_column_bytes(j, roll(platform.column_bytes(j)))
+    for i in range(platform.height):  # west
+        platform.set_row_bytes(i, roll(platform.row_bytes(i)))
+    for j in range(platform.width):  # south
+        platform.set_column_bytes(j, roll(platform.column_bytes(j)[::-1])[::-1])
+    for i in range(platform.height):  # east
+        platform.set_row_bytes(i, roll(platform.row_bytes(i)[::-1])[::-1])
 
     return platform
 
 
-def compute_load(platform: Platform | PlatformAsTuples) -> int:
+def compute_load(platform: Grid) -> int:
     load = 0
 
-    n = len(platform)
-    for i, line in enumerate(platform):
-        load += sum(1 for c in line if c == "O") * (n - i)
+    n = platform.height
+    for i in range(n):
+        load += platform.row_bytes(i).count(b"O") * (n - i)
 
     return load
 
 
 def get_first_platform_transforms(
-    platform: Platform,
-) -> tuple[list[PlatformAsTuples], int, int]:
-    platforms: list[PlatformAsTuples] = []
+    platform: Grid,
+) -> tuple[list[Grid], int, int]:
+    platforms: list[Grid] = []
     cycle_start, cycle_length = -1, -1
 
-    indices: dict[PlatformAsTuples, int] = {}
+    indices: dict[bytes, int] = {}
     for i in count():
-        t = to_tuples(platform)
-        if t in indices:
-            cycle_start, cycle_length = indices[t], i - indices[t]
+        state = bytes(platform.data)
+        if state in indices:
+            cycle_start, cycle_length = indices[state], i - indices[state]
             break
 
-        indices[t] = i
-        platforms.append(t)
+        indices[state] = i
+        platforms.append(platform)
 
         platform = cycle(platform)
 
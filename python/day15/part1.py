@@ -1,27 +1,36 @@
-def parse(input: str) -> list[str]:
-    return input.split(",")
+import re
 
+from aoc.inputs import Buffer, MappedInput, to_bytes
+from aoc.instrument import phase
 
-def hash_step(step: str) -> int:
+# steps are separated by commas, a trailing newline isn't part of the last one
+STEP_REGEX = re.compile(rb"[^,\n]+")
+
+
+@phase("parse")
+def parse(input: str | Buffer) -> list[bytes]:
+    return STEP_REGEX.findall(to_bytes(input))
+
+
+def hash_step(step: bytes) -> int:
     result = 0
 
     for c in step:
-        result += ord(c)
+        result += c
         result *= 17
         result %= 256
 
     return result
 
 
-def solve(input: str) -> int:
+def solve(input: str | Buffer) -> int:
     steps = parse(input)
 
     return sum(hash_step(step) for step in steps)
 
 
 if __name__ == "__main__":
-    with open("./inputs/day15.txt", encoding="utf-8") as file:
-        input = file.read().strip()
+    with MappedInput("./inputs/day15.txt") as input:
+        answer = solve(input.data)
 
-    answer = solve(input)
     print(f"{answer = }")
@@ -1,19 +1,28 @@
 from typing import NamedTuple
 import re
 
+from aoc.inputs import Buffer, MappedInput, to_bytes
+from aoc.instrument import phase
+
+STEP_REGEX = re.compile(rb"(?P<label>\w+)(?P<operation>-|=)(?P<length>\d+)?")
+
 
 class Step(NamedTuple):
-    label: str
-    operation: str
+    label: bytes
+    operation: bytes
     focal_length: int
 
 
-def parse(input: str) -> list[Step]:
+@phase("parse")
+def parse(input: str | Buffer) -> list[Step]:
     steps = []
 
-    for raw_step in input.split(","):
-        m = re.fullmatch(r"(?P<label>\w+)(?P<operation>-|=)(?P<length>\d+)?", raw_step)
-        assert m is not None
+    # slicing copies mapped files to bytes, which buffers aren't stripped of
+    # their trailing newline
+    for step in to_bytes(input)[:].rstrip(b"\n").split(b","):
+        m = STEP_REGEX.fullmatch(step)
+        if m is None:
+            raise ValueError(f"malformed step {step!r}")
 
         steps.append(
             Step(
@@ -26,29 +35,29 @@ def parse(input: str) -> list[Step]:
     return steps
 
 
-def hash_label(label: str) -> int:
+def hash_label(label: bytes) -> int:
     result = 0
 
     for c in label:
-        result += ord(c)
+        result += c
         result *= 17
         result %= 256
 
     return result
 
 
-def solve(input: str) -> int:
+def solve(input: str | Buffer) -> int:
     steps = parse(input)
 
-    boxes: list[dict[str, int]] = [
+    boxes: list[dict[bytes, int]] = [
         dict() for _ in range(256)  # dictionaries preserve key insertion order
     ]
 
     for step in steps:
         box = boxes[hash_label(step.label)]
-        if step.operation == "=":
+        if step.operation == b"=":
             box[step.label] = step.focal_length
-        if step.operation == "-":
+        if step.operation == b"-":
             if step.label in box:
                 del box[step.label]
 
@@ -61,8 +70,7 @@ def solve(input: str) -> int:
 
 
 if __name__ == "__main__":
-    with open("./inputs/day15.txt", encoding="utf-8") as file:
-        input = file.read().strip()
+    with MappedInput("./inputs/day15.txt") as input:
+        answer = solve(input.data)
 
-    answer = solve(input)
     print(f"{answer = }")
@@ -1,100 +1,80 @@
-from enum import Enum
 from itertools import chain
 from collections.abc import Callable, Iterator
 from typing import Literal
 
-
-class Directions(Enum):
-    Right = (0, 1)
-    Down = (1, 0)
-    Left = (0, -1)
-    Up = (-1, 0)
-
+from aoc.geometry import DIRECTIONS, DOWN, LEFT, RIGHT, UP, Direction, is_horizontal
+from aoc.grid import Grid
+from aoc.instrument import phase
 
 Mirror = Literal[".", "|", "-", "/", "\\"]
-Position = tuple[int, int]
-State = tuple[Position, Directions]
+MIRRORS: tuple[Mirror, ...] = (".", "|", "-", "/", "\\")
+# flat index in the padded grid and direction of the ray
+State = tuple[int, Direction]
 NeighborsGetter = Callable[[State], list[State]]
 
+# the grid is padded so that rays leaving it don't need bounds checks
+OUTSIDE = " "
 
-def propagate(position: Position, direction: Directions) -> Position:
-    i, j = position
-    di, dj = direction.value
-    return i + di, j + dj
+# directions rays leave mirrors by, indexed by their incoming direction
+SLASH_REFLECTIONS = (UP, LEFT, DOWN, RIGHT)  # (di, dj) -> (-dj, -di)
+BACKSLASH_REFLECTIONS = (DOWN, RIGHT, UP, LEFT)  # (di, dj) -> (dj, di)
 
 
-def get_reflections(ray_direction: Directions, mirror: Mirror) -> list[Directions]:
+def get_reflections(ray_direction: Direction, mirror: Mirror) -> list[Direction]:
     match mirror:
         case ".":
             return [ray_direction]
         case "|":
-            match ray_direction:
-                case Directions.Left | Directions.Right:
-                    return [Directions.Down, Directions.Up]
-                case Directions.Down | Directions.Up:
-                    return [ray_direction]
+            if is_horizontal(ray_direction):
+                return [DOWN, UP]
+            return [ray_direction]
         case "-":
-            match ray_direction:
-                case Directions.Down | Directions.Up:
-                    return [Directions.Right, Directions.Left]
-                case Directions.Right | Directions.Left:
-                    return [ray_direction]
+            if is_horizontal(ray_direction):
+                return [ray_direction]
+            return [RIGHT, LEFT]
         case "/":
-            # note that (di, dj) -> (-dj, -di)
-            match ray_direction:
-                case Directions.Right:
-                    return [Directions.Up]
-                case Directions.Down:
-                    return [Directions.Left]
-                case Directions.Left:
-                    return [Directions.Down]
-                case Directions.Up:
-                    return [Directions.Right]
+            return [SLASH_REFLECTIONS[ray_direction]]
         case "\\":
-            # note that (di, dj) -> (dj, di)
-            match ray_direction:
-                case Directions.Right:
-                    return [Directions.Down]
-                case Directions.Down:
-                    return [Directions.Right]
-                case Directions.Left:
-                    return [Directions.Up]
-                case Directions.Up:
-                    return [Directions.Left]
+            return [BACKSLASH_REFLECTIONS[ray_direction]]
 
 
+@phase("parse")
 def parse(input: str) -> tuple[Iterator[State], NeighborsGetter]:
-    grid: list[list[Mirror]] = []
-    for line in input.splitlines():
-        grid.append([])
-        for mirror in line:
-            grid[-1].append(mirror)  # type: ignore
-
-    lines_count, cols_count = len(grid), len(grid[0])
+    grid = Grid.parse(input, pad=OUTSIDE)
+    outside = ord(OUTSIDE)
+
+    # directions and offsets of the next cells, by ray direction then mirror
+    next_states = [
+        {
+            ord(mirror): [
+                (new_dir, grid.offsets[new_dir])
+                for new_dir in get_reflections(dir, mirror)
+            ]
+            for mirror in MIRRORS
+        }
+        for dir in DIRECTIONS
+    ]
+
+    data = grid.data
 
     def get_neighbors(state: State) -> list[State]:
-        def is_within_boundaries(position: Position) -> bool:
-            i, j = position
-            return 0 <= i < lines_count and 0 <= j < cols_count
-
-        pos, dir = state
-        i, j = pos
-        mirror = grid[i][j]
-        new_directions = get_reflections(dir, mirror)
+        k, dir = state
 
         neighbors = []
-        for new_dir in new_directions:
-            new_pos = propagate(pos, new_dir)
-            if is_within_boundaries(new_pos):
-                neighbors.append((new_pos, new_dir))
+        for new_dir, offset in next_states[dir][data[k]]:
+            if data[k + offset] != outside:
+                neighbors.append((k + offset, new_dir))
 
         return neighbors
 
+    lines_count, cols_count = grid.height, grid.width
+    index = grid.index
+
     start_iter = chain(
-        (((0, j), Directions.Down) for j in range(cols_count)),
-        (((cols_count - 1, i), Directions.Left) for i in range(lines_count)),
-        (((lines_count - 1, j), Directions.Up) for j in range(cols_count)),
-        (((0, i), Directions.Right) for i in range(lines_count)),
+        ((index(0, j), DOWN) for j in range(cols_count)),
+        ((index(cols_count - 1, i), LEFT) for i in range(lines_count)),
+        ((index(lines_count - 1, j), UP) for j in range(cols_count)),
+        ((index(0, i), RIGHT) for i in range(lines_count)),
     )
 
     return start_iter, get_neighbors
@@ -122,7 +102,7 @@ def solve(input: str) -> int:
 
     for start in start_iter:
         states = dfs(start, get_neighbors)
-        energized_positions = set((i, j) for (i, j), dir in states)
+        energized_positions = set(k for k, dir in states)
         answer = max(answer, len(energized_positions))
 
     return answer
@@ -1,159 +1,90 @@
 from __future__ import annotations
-from enum import Enum
-from math import inf
 from typing import NamedTuple
 from collections.abc import Callable
-from itertools import product
-from dataclasses import dataclass, field
-from heapq import heappush, heappop
 
-
-@dataclass(order=True)
-class Entry[T]:
-    priority: float
-    # `None` is used as a placeholder for a value that's not of type `T`, it's a bad design choice if `None` can be an instance of `T`
-    node: T | None = field(compare=False)
-
-
-class PriorityQueue[T]:
-    def __init__(self) -> None:
-        self._hq = []
-        self._node_to_entry: dict[T, Entry[T]] = {}
-
-    def push(self, node: T, priority: float) -> None:
-        if node in self._node_to_entry:
-            self.remove(node)
-
-        entry = Entry(priority, node)
-        heappush(self._hq, entry)
-
-        self._node_to_entry[node] = entry
-
-    def pop(self) -> tuple[T, float]:
-        while self._hq:
-            entry = heappop(self._hq)
-
-            if entry.node is not None:
-                del self._node_to_entry[entry.node]
-                return entry.node, entry.priority
-
-        raise KeyError
-
-    def remove(self, node: T) -> None:
-        if node not in self._node_to_entry:
-            raise KeyError
-
-        entry = self._node_to_entry.pop(node)
-        entry.node = None
-
-    def __contains__(self, node: T) -> bool:
-        return node in self._node_to_entry
-
-    def __len__(self) -> int:
-        return len(self._node_to_entry)
-
-
-class Direction(Enum):
-    Right = (0, 1)
-    Down = (1, 0)
-    Left = (0, -1)
-    Up = (-1, 0)
-
-    def opposite(self) -> Direction:
-        di, dj = self.value
-        return Direction((-di, -dj))
+from aoc.geometry import DIRECTIONS, DOWN, RIGHT, TURN_LEFT, TURN_RIGHT, Direction
+from aoc.grid import Grid
+from aoc.instrument import phase
+from aoc.pqueue import BucketQueue
 
 
 class Node(NamedTuple):
-    pos: tuple[int, int]
+    # flat index in the padded grid
+    pos: int
     dir: Direction | None
 
 
 NeighborsGetter = Callable[[Node], list[tuple[Node, int]]]
-Grid = list[list[int]]
-
 
-def parse(input: str) -> tuple[Grid, set[Node], NeighborsGetter]:
-    grid = []
-    for line in input.splitlines():
-        grid.append([int(c) for c in line])
+# the grid is padded so that moves leaving it don't need bounds checks
+OUTSIDE = " "
 
-    lines_count = len(grid)
-    cols_count = len(grid[0])
 
-    nodes = set(
-        Node((i, j), dir)
-        for i, j, dir in product(range(lines_count), range(cols_count), Direction)
-    )
-    nodes.add(Node((0, 0), None))
+@phase("parse")
+def parse(input: str) -> tuple[Grid, NeighborsGetter]:
+    grid = Grid.parse(input, pad=OUTSIDE)
+    outside = ord(OUTSIDE)
 
-    def is_within_boundaries(i: int, j: int) -> bool:
-        return 0 <= i < lines_count and 0 <= j < cols_count
+    # crucibles can only turn, once they moved
+    next_directions = [(TURN_LEFT[dir], TURN_RIGHT[dir]) for dir in DIRECTIONS]
+    # the heat loss of a cell is its digit
+    costs = [c - ord("0") for c in grid.data]
+    data = grid.data
 
     def get_neighbors_with_costs(node: Node) -> list[tuple[Node, int]]:
         result = []
 
-        (i, j), prev_dir = node
-        for dir in Direction:
-            if prev_dir is not None and (dir == prev_dir or dir == prev_dir.opposite()):
-                continue
-
-            new_i, new_j = i, j
-            di, dj = dir.value
+        k, prev_dir = node
+        for dir in DIRECTIONS if prev_dir is None else next_directions[prev_dir]:
+            new_k = k
+            offset = grid.offsets[dir]
             cost = 0
 
             for _ in range(3):
-                new_i += di
-                new_j += dj
+                new_k += offset
 
-                if not is_within_boundaries(new_i, new_j):
+                if data[new_k] == outside:
                     break
 
-                cost += grid[new_i][new_j]
-                new_node = Node((new_i, new_j), dir)
+                cost += costs[new_k]
+                new_node = Node(new_k, dir)
 
                 result.append((new_node, cost))
 
         return result
 
-    return grid, nodes, get_neighbors_with_costs
+    return grid, get_neighbors_with_costs
 
 
 def dijkstra(
-    source: Node, nodes: set[Node], get_neighbors_with_costs: NeighborsGetter
-) -> dict[Node, float]:
-    dist = {}
+    source: Node, get_neighbors_with_costs: NeighborsGetter
+) -> dict[Node, int]:
+    dist = {source: 0}
 
-    q: PriorityQueue[Node] = PriorityQueue()
-    for u in nodes:
-        dist[u] = inf if u != source else 0
-        q.push(u, dist[u])
+    # heat losses are small integers, popped in increasing order
+    q: BucketQueue[Node] = BucketQueue()
+    q.push(source, 0)
 
     while q:
-        u, _ = q.pop()
+        u, d = q.pop()
         for v, cost in get_neighbors_with_costs(u):
-            if v not in q:
-                continue
-
-            d = dist[u] + cost
-            if d < dist[v]:
-                dist[v] = d
-                q.push(v, dist[v])
+            new_d = d + cost
+            # popped nodes have their final distance and are never improved
+            if v not in dist or new_d < dist[v]:
+                dist[v] = new_d
+                q.push(v, new_d)
 
     return dist
 
 
 def solve(input: str) -> int:
-    grid, nodes, get_neighbors_with_costs = parse(input)
-    dist = dijkstra(Node((0, 0), None), nodes, get_neighbors_with_costs)
+    grid, get_neighbors_with_costs = parse(input)
+    dist = dijkstra(Node(grid.index(0, 0), None), get_neighbors_with_costs)
 
-    lines_count, cols_count = len(grid), len(grid[0])
-    ends = [
-        Node((lines_count - 1, cols_count - 1), Direction.Down),
-        Node((lines_count - 1, cols_count - 1), Direction.Right),
-    ]
+    end = grid.index(grid.height - 1, grid.width - 1)
+    ends = [Node(end, DOWN), Node(end, RIGHT)]
 
-    return int(min(dist[end] for end in ends))
+    return min(dist[end] for end in ends if end in dist)
 
 
 if __name__ == "__main__":
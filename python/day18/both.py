@@ -0,0 +1,54 @@
+import re
+
+from aoc.geometry import Direction
+from aoc.inputs import Buffer, MappedInput, iter_lines, to_bytes
+from aoc.instrument import phase
+from day18 import part1, part2
+
+INSTRUCTION_REGEX = re.compile(
+    rb"^(?P<dir>R|D|L|U) (?P<count>\d+) \(#(?P<color>[0-9a-f]{6})\)$"
+)
+
+Instruction = tuple[Direction, int]
+
+
+def parse_line(line: bytes) -> tuple[Instruction, Instruction] | None:
+    """the instruction of each part, from the same match"""
+    m = INSTRUCTION_REGEX.match(line)
+
+    # lines that aren't instructions are skipped
+    if m is None:
+        return None
+
+    color = m["color"]
+
+    return (
+        (part1.DIRECTIONS_BY_CHAR[m["dir"]], int(m["count"])),
+        (part2.DIRECTIONS_BY_CHAR[color[-1:]], int(color[:-1], base=16)),
+    )
+
+
+def get_lagoon_size(instructions: list[Instruction]) -> int:
+    area, perimeter = part1.shoelace(instructions)
+
+    return int(abs(area) + perimeter / 2 + 1)
+
+
+def solve(input: str | Buffer) -> tuple[int, int]:
+    instructions_1, instructions_2 = [], []
+
+    with phase("parse"):
+        for line in iter_lines(to_bytes(input)):
+            instructions = parse_line(line)
+            if instructions is not None:
+                instructions_1.append(instructions[0])
+                instructions_2.append(instructions[1])
+
+    return get_lagoon_size(instructions_1), get_lagoon_size(instructions_2)
+
+
+if __name__ == "__main__":
+    with MappedInput("./inputs/day18.txt") as input:
+        answers = solve(input.data)
+
+    print(f"{answers = }")
@@ -1,85 +1,69 @@
-from enum import Enum
 import re
+from collections.abc import Iterable, Iterator
 
+from aoc.geometry import DELTAS, DOWN, LEFT, RIGHT, UP, Direction
+from aoc.inputs import Buffer, MappedInput, iter_lines, to_bytes
+from aoc.instrument import phase
 
-class Direction(Enum):
-    Right = (0, 1)
-    Down = (1, 0)
-    Left = (0, -1)
-    Up = (-1, 0)
+INSTRUCTION_REGEX = re.compile(rb"^(?P<dir>R|D|L|U) (?P<count>\d+) \(#[0-9a-f]{6}\)$")
+DIRECTIONS_BY_CHAR = {b"R": RIGHT, b"D": DOWN, b"L": LEFT, b"U": UP}
 
 
-def get_dir_from_char(char: str) -> Direction:
-    match char:
-        case "R":
-            return Direction.Right
-        case "D":
-            return Direction.Down
-        case "L":
-            return Direction.Left
-        case "U":
-            return Direction.Up
-        case _:
-            raise RuntimeError
+def parse_line(line: bytes) -> tuple[Direction, int] | None:
+    m = INSTRUCTION_REGEX.match(line)
 
+    # lines that aren't instructions are skipped
+    if m is None:
+        return None
 
-def parse(input: str) -> list[tuple[Direction, int]]:
-    result = []
+    return DIRECTIONS_BY_CHAR[m["dir"]], int(m["count"])
 
-    for m in re.finditer(
-        r"^(?P<dir>R|D|L|U) (?P<count>\d+) \(#[0-9a-f]{6}\)$", input, re.MULTILINE
-    ):
-        dir = get_dir_from_char(m["dir"])
-        count = int(m["count"])
 
-        result.append((dir, count))
+def parse(lines: Iterable[bytes]) -> Iterator[tuple[Direction, int]]:
+    for line in lines:
+        instruction = parse_line(line)
+        if instruction is not None:
+            yield instruction
 
-    return result
 
-
-def get_positions(
-    instructions: list[tuple[Direction, int]]
-) -> tuple[list[tuple[int, int]], int]:
-    positions: list[tuple[int, int]] = [(0, 0)]
+def shoelace(instructions: Iterable[tuple[Direction, int]]) -> tuple[float, int]:
+    """signed area and perimeter of the trench, following it once"""
+    # twice the area, so that it stays an exact integer
+    a = 0
     perimeter = 0
 
-    i, j = 0, 0
+    x_a, y_a = 0, 0
     for dir, count in instructions:
-        di, dj = dir.value
+        di, dj = DELTAS[dir]
 
-        i += count * di
-        j += count * dj
+        x_b, y_b = x_a + count * di, y_a + count * dj
+        a += (y_a + y_b) * (x_a - x_b)
 
-        positions.append((i, j))
+        x_a, y_a = x_b, y_b
         perimeter += count
 
-    return positions, perimeter
+    # back to the start
+    a += y_a * x_a
 
+    return a / 2, perimeter
 
-def shoelace(positions: list[tuple[int, int]]) -> float:
-    a = 0
-
-    for (x_a, y_a), (x_b, y_b) in zip(positions, positions[1:]):
-        a += (y_a + y_b) * (x_a - x_b) / 2
 
-    (x_a, y_a), (x_b, y_b) = positions[-1], positions[0]
-    a += (y_a + y_b) * (x_a - x_b) / 2
+# parsing is interleaved with solving, line by line
+@phase("stream")
+def solve_stream(lines: Iterable[bytes]) -> int:
+    area, perimeter = shoelace(parse(lines))
 
-    return a
+    a = abs(area) + perimeter / 2 + 1
 
+    return int(a)
 
-def solve(input: str) -> int:
-    instructions = parse(input)
-    positions, perimeter = get_positions(instructions)
-
-    a = abs(shoelace(positions)) + perimeter / 2 + 1
 
-    return int(a)
+def solve(input: str | Buffer) -> int:
+    return solve_stream(iter_lines(to_bytes(input)))
 
 
 if __name__ == "__main__":
-    with open("./inputs/day18.txt", encoding="utf-8") as file:
-        input = file.read().strip()
+    with MappedInput("./inputs/day18.txt") as input:
+        answer = solve(input.data)
 
-    answer = solve(input)
     print(f"{answer = }")
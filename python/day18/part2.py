@@ -1,86 +1,73 @@
-from enum import Enum
 import re
+from collections.abc import Iterable, Iterator
 
+from aoc.geometry import DELTAS, DOWN, LEFT, RIGHT, UP, Direction
+from aoc.inputs import Buffer, MappedInput, iter_lines, to_bytes
+from aoc.instrument import phase
 
-class Direction(Enum):
-    Right = (0, 1)
-    Down = (1, 0)
-    Left = (0, -1)
-    Up = (-1, 0)
+INSTRUCTION_REGEX = re.compile(rb"^(R|D|L|U) \d+ \(#(?P<color>[0-9a-f]{6})\)$")
+DIRECTIONS_BY_CHAR = {b"0": RIGHT, b"1": DOWN, b"2": LEFT, b"3": UP}
 
 
-def get_dir_from_char(char: str) -> Direction:
-    match char:
-        case "0":
-            return Direction.Right
-        case "1":
-            return Direction.Down
-        case "2":
-            return Direction.Left
-        case "3":
-            return Direction.Up
-        case _:
-            raise RuntimeError
+def parse_line(line: bytes) -> tuple[Direction, int] | None:
+    m = INSTRUCTION_REGEX.match(line)
 
+    # lines that aren't instructions are skipped
+    if m is None:
+        return None
 
-def parse(input: str) -> list[tuple[Direction, int]]:
-    result = []
+    color = m["color"]
+    count = int(color[:-1], base=16)
+    dir = DIRECTIONS_BY_CHAR[color[-1:]]
 
-    for m in re.finditer(
-        r"^(R|D|L|U) \d+ \(#(?P<color>[0-9a-f]{6})\)$", input, re.MULTILINE
-    ):
-        color = m["color"]
-        count = int(color[:-1], base=16)
-        dir = get_dir_from_char(color[-1])
+    return dir, count
 
-        result.append((dir, count))
 
-    return result
+def parse(lines: Iterable[bytes]) -> Iterator[tuple[Direction, int]]:
+    for line in lines:
+        instruction = parse_line(line)
+        if instruction is not None:
+            yield instruction
 
 
-def get_positions(
-    instructions: list[tuple[Direction, int]]
-) -> tuple[list[tuple[int, int]], int]:
-    positions: list[tuple[int, int]] = [(0, 0)]
+def shoelace(instructions: Iterable[tuple[Direction, int]]) -> tuple[float, int]:
+    """signed area and perimeter of the trench, following it once"""
+    # twice the area, so that it stays an exact integer
+    a = 0
     perimeter = 0
 
-    i, j = 0, 0
+    x_a, y_a = 0, 0
     for dir, count in instructions:
-        di, dj = dir.value
+        di, dj = DELTAS[dir]
 
-        i += count * di
-        j += count * dj
+        x_b, y_b = x_a + count * di, y_a + count * dj
+        a += (y_a + y_b) * (x_a - x_b)
 
-        positions.append((i, j))
+        x_a, y_a = x_b, y_b
         perimeter += count
 
-    return positions, perimeter
-
-
-def shoelace(positions: list[tuple[int, int]]) -> float:
-    a = 0
+    # back to the start
+    a += y_a * x_a
 
-    for (x_a, y_a), (x_b, y_b) in zip(positions, positions[1:]):
-        a += (y_a + y_b) * (x_a - x_b) / 2
+    return a / 2, perimeter
 
-    (x_a, y_a), (x_b, y_b) = positions[-1], positions[0]
-    a += (y_a + y_b) * (x_a - x_b) / 2
 
-    return a
+# parsing is interleaved with solving, line by line
+@phase("stream")
+def solve_stream(lines: Iterable[bytes]) -> int:
+    area, perimeter = shoelace(parse(lines))
 
+    a = abs(area) + perimeter / 2 + 1
 
-def solve(input: str) -> int:
-    instructions = parse(input)
-    positions, perimeter = get_positions(instructions)
+    return int(a)
 
-    a = abs(shoelace(positions)) + perimeter / 2 + 1
 
-    return int(a)
+def solve(input: str | Buffer) -> int:
+    return solve_stream(iter_lines(to_bytes(input)))
 
 
 if __name__ == "__main__":
-    with open("./inputs/day18.txt", encoding="utf-8") as file:
-        input = file.read().strip()
+    with MappedInput("./inputs/day18.txt") as input:
+        answer = solve(input.data)
 
-    answer = solve(input)
     print(f"{answer = }")
@@ -4,6 +4,13 @@ import operator
 from collections.abc import Callable
 from enum import Enum, auto
 
+from aoc.instrument import phase
+
+CONDITION_REGEX = re.compile(r"([xmas])([<>])(\d+):([AR]|[a-z]+)")
+DEFAULT_CONDITION_REGEX = re.compile(r"([AR]|[a-z]+)")
+WORKFLOW_REGEX = re.compile(r"([a-z]+)\{(.*)\}")
+PART_REGEX = re.compile(r"{x=(\d+),m=(\d+),a=(\d+),s=(\d+)}")
+
 
 class Status(Enum):
     ACCEPTED = auto()
@@ -46,7 +53,7 @@ def make_condition(condition_str: str) -> Condition:
 
         return check
 
-    m = re.fullmatch(r"([xmas])([<>])(\d+):([AR]|[a-z]+)", condition_str)
+    m = CONDITION_REGEX.fullmatch(condition_str)
 
     if m is not None:
         cat = m[1]
@@ -56,7 +63,7 @@ def make_condition(condition_str: str) -> Condition:
 
         return Condition(make_check(cat, cmp, value), dest)
 
-    m = re.fullmatch(r"([AR]|[a-z]+)", condition_str)
+    m = DEFAULT_CONDITION_REGEX.fullmatch(condition_str)
 
     if m is not None:
         dest = m[1]
@@ -66,6 +73,7 @@ def make_condition(condition_str: str) -> Condition:
     raise ValueError
 
 
+@phase("parse")
 def parse(input: str) -> tuple[dict[str, Workflow], list[Part]]:
     workflows: dict[str, Workflow] = {}
     parts: list[Part] = []
@@ -76,7 +84,7 @@ def parse(input: str) -> tuple[dict[str, Workflow], list[Part]]:
     workflows["R"] = lambda _: Status.REJECTED
 
     for raw_workflow in workflows_str.splitlines():
-        m = re.fullmatch(r"([a-z]+)\{(.*)\}", raw_workflow)
+        m = WORKFLOW_REGEX.fullmatch(raw_workflow)
 
         assert m is not None
 
@@ -87,7 +95,7 @@ def parse(input: str) -> tuple[dict[str, Workflow], list[Part]]:
         workflows[id] = make_workflow(conditions, workflows)
 
     for raw_part in parts_str.splitlines():
-        m = re.fullmatch(r"{x=(\d+),m=(\d+),a=(\d+),s=(\d+)}", raw_part)
+        m = PART_REGEX.fullmatch(raw_part)
 
         assert m is not None
 
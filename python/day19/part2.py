@@ -3,33 +3,30 @@ from typing import NamedTuple
 from collections.abc import Callable
 from enum import Enum, auto
 
+from aoc.instrument import phase
+from aoc.intervals import IntervalSet
+
+CONDITION_REGEX = re.compile(r"([xmas])([<>])(\d+):([AR]|[a-z]+)")
+DEFAULT_CONDITION_REGEX = re.compile(r"([AR]|[a-z]+)")
+WORKFLOW_REGEX = re.compile(r"([a-z]+){(.*)}")
+
 
 class Status(Enum):
     ACCEPTED = auto()
     REJECTED = auto()
 
 
-class Interval(NamedTuple):
-    start: int
-    end: int
-
-
-DEFAULT_INTERVAL = Interval(1, 4001)
+DEFAULT_INTERVAL = IntervalSet.of(1, 4001)
 
 
 class PartsRange(NamedTuple):
-    x: Interval = DEFAULT_INTERVAL
-    m: Interval = DEFAULT_INTERVAL
-    a: Interval = DEFAULT_INTERVAL
-    s: Interval = DEFAULT_INTERVAL
+    x: IntervalSet = DEFAULT_INTERVAL
+    m: IntervalSet = DEFAULT_INTERVAL
+    a: IntervalSet = DEFAULT_INTERVAL
+    s: IntervalSet = DEFAULT_INTERVAL
 
     def get_count(self) -> int:
-        return (
-            (self.x.end - self.x.start)
-            * (self.m.end - self.m.start)
-            * (self.a.end - self.a.start)
-            * (self.s.end - self.s.start)
-        )
+        return self.x.size * self.m.size * self.a.size * self.s.size
 
 
 class ConditionResult(NamedTuple):
@@ -78,33 +75,21 @@ def make_workflow(
 def make_condition(condition_str: str) -> Condition:
     def make_check(cat, cmp, value):
         def check(parts_range: PartsRange) -> ConditionResult:
-            a, r = None, None
-            i: Interval = getattr(parts_range, cat)
+            i: IntervalSet = getattr(parts_range, cat)
 
             if cmp == "<":
-                if value <= i.start:
-                    a, r = None, i
-                elif i.end <= value:
-                    a, r = i, None
-                else:
-                    a, r = Interval(i.start, value), Interval(value, i.end)
-
-            if cmp == ">":
-                if value + 1 <= i.start:
-                    a, r = i, None
-                elif i.end <= value + 1:
-                    a, r = None, i
-                else:
-                    a, r = Interval(value + 1, i.end), Interval(i.start, value + 1)
-
-            accepted_range = None if a is None else parts_range._replace(**{cat: a})
-            rejected_range = None if r is None else parts_range._replace(**{cat: r})
+                a, r = i.split(value)
+            else:
+                r, a = i.split(value + 1)
+
+            accepted_range = parts_range._replace(**{cat: a}) if a else None
+            rejected_range = parts_range._replace(**{cat: r}) if r else None
 
             return ConditionResult(accepted_range, rejected_range)
 
         return check
 
-    m = re.fullmatch(r"([xmas])([<>])(\d+):([AR]|[a-z]+)", condition_str)
+    m = CONDITION_REGEX.fullmatch(condition_str)
 
     if m is not None:
         cat = m[1]
@@ -114,7 +99,7 @@ def make_condition(condition_str: str) -> Condition:
 
         return Condition(make_check(cat, cmp, value), dest)
 
-    m = re.fullmatch(r"([AR]|[a-z]+)", condition_str)
+    m = DEFAULT_CONDITION_REGEX.fullmatch(condition_str)
 
     if m is not None:
         dest = m[1]
@@ -124,6 +109,7 @@ def make_condition(condition_str: str) -> Condition:
     raise ValueError
 
 
+@phase("parse")
 def parse(input: str) -> dict[str, Workflow]:
     workflows: dict[str, Workflow] = {}
 
@@ -133,7 +119,7 @@ def parse(input: str) -> dict[str, Workflow]:
     workflows["R"] = workflow_R
 
     for raw_workflow in workflows_str.splitlines():
-        m = re.fullmatch(r"([a-z]+){(.*)}", raw_workflow)
+        m = WORKFLOW_REGEX.fullmatch(raw_workflow)
 
         assert m is not None
 
@@ -156,12 +142,7 @@ def solve(input: str) -> int:
     answer = 0
 
     for parts_range in result.accepted:
-        answer += (
-            (parts_range.x.end - parts_range.x.start)
-            * (parts_range.m.end - parts_range.m.start)
-            * (parts_range.a.end - parts_range.a.start)
-            * (parts_range.s.end - parts_range.s.start)
-        )
+        answer += parts_range.get_count()
 
     return answer
 
@@ -1,141 +1,83 @@
-from __future__ import annotations
-from enum import Enum
-from abc import ABC, abstractmethod
-from queue import Queue
-from collections import defaultdict
+from array import array
+from collections import deque
 import re
 
+from aoc.graph import Graph
+from aoc.instrument import phase
 
-class Pulse(Enum):
-    Low = 0
-    High = 1
+MODULE_REGEX = re.compile(r"^(?P<type>%|&|)(?P<name>\w+)$")
 
-    def opposite(self) -> Pulse:
-        return Pulse(1 - self.value)
+LOW, HIGH = 0, 1
 
+# modules only found in destinations forward pulses like the broadcaster, to no one
+BROADCASTER, FLIP_FLOP, CONJUNCTION = 0, 1, 2
+KINDS = {"": BROADCASTER, "%": FLIP_FLOP, "&": CONJUNCTION}
 
-class Module(ABC):
-    def __init__(self, name):
-        self.name = name
-        self.destinations = []
 
-    def set_destinations(self, destinations: list[Module]) -> None:
-        self.destinations = destinations.copy()
-
-    def __hash__(self) -> int:
-        return hash(self.name)
-
-    @abstractmethod
-    def process_input(self, source: Module, pulse: Pulse) -> list[tuple[Module, Pulse]]:
-        ...
-
-
-class Broadcaster(Module):
-    def process_input(self, source: Module, pulse: Pulse) -> list[tuple[Module, Pulse]]:
-        return [(dest, pulse) for dest in self.destinations]
-
-
-class FlipFLop(Module):
-    def __init__(self, name) -> None:
-        super().__init__(name)
-
-        self.state = False
-
-    def process_input(self, source: Module, pulse: Pulse) -> list[tuple[Module, Pulse]]:
-        if pulse == Pulse.High:
-            return []
-
-        self.state = not self.state
-
-        out_pulse = Pulse.High if self.state else Pulse.Low
-
-        return [(dest, out_pulse) for dest in self.destinations]
-
-
-class Conjunction(Module):
-    def __init__(self, name) -> None:
-        super().__init__(name)
-
-        self.state: dict[Module, Pulse] = {}
-
-    def set_sources(self, sources: list[Module]) -> None:
-        self.state = {module: Pulse.Low for module in sources}
-
-    def add_source(self, source: Module) -> None:
-        self.state[source] = Pulse.Low
-
-    def process_input(self, source: Module, pulse: Pulse) -> list[tuple[Module, Pulse]]:
-        self.state[source] = pulse
-
-        out_pulse = (
-            Pulse.Low
-            if all(p == Pulse.High for p in self.state.values())
-            else Pulse.High
-        )
-
-        return [(dest, out_pulse) for dest in self.destinations]
-
-
-def parse(input: str) -> dict[str, Module]:
-    modules: dict[str, Module] = {}
-
-    destinations: dict[str, list[str]] = {}
+@phase("parse")
+def parse(input: str, pressed: str = "broadcaster") -> tuple[Graph[str], bytearray]:
+    """wiring of the modules, with a `button` module sending to `pressed`, and
+    their kinds"""
+    destinations = {"button": [pressed]}
+    kinds_by_name = {"button": BROADCASTER}
 
     for line in input.splitlines():
         left, sep, right = line.partition(" -> ")
 
-        m = re.match(r"^(?P<type>%|&|)(?P<name>\w+)$", left)
+        m = MODULE_REGEX.match(left)
         assert m is not None
 
-        dest_name = m["name"]
+        kinds_by_name[m["name"]] = KINDS[m["type"]]
+        destinations[m["name"]] = right.split(", ")
 
-        match m["type"]:
-            case "%":
-                modules[dest_name] = FlipFLop(dest_name)
-            case "&":
-                modules[dest_name] = Conjunction(dest_name)
-            case "":
-                modules[dest_name] = Broadcaster(dest_name)
-            case _:
-                raise RuntimeError
+    graph = Graph.from_adjacency(destinations)
+    kinds = bytearray(kinds_by_name.get(name, BROADCASTER) for name in graph.labels)
 
-        destinations[dest_name] = right.split(", ")
+    return graph, kinds
 
-    for source_name, dest_names in destinations.items():
-        source_module = modules[source_name]
 
-        for dest_name in dest_names:
-            # some modules are to be found in destinations but not in sources, we need to instantiate them
-            if dest_name not in modules:
-                modules[dest_name] = Broadcaster(dest_name)
-
-            dest_module = modules[dest_name]
-            if isinstance(dest_module, Conjunction):
-                dest_module.add_source(source_module)
+def solve(input: str, repeat: int = 1000) -> int:
+    graph, kinds = parse(input)
+    offsets, targets = graph.offsets, graph.targets
 
-        source_module.set_destinations([modules[dest_name] for dest_name in dest_names])
+    # whether each flip-flop is on
+    on = bytearray(len(graph))
+    # last pulse sent along each edge, that conjunctions remember
+    memory = bytearray(graph.edges_count)
+    high_inputs = array("l", [0]) * len(graph)
+    inputs_count = graph.in_degrees()
 
-    return modules
+    button = graph.index["button"]
+    count = [0, 0]
 
+    for _ in range(repeat):
+        # pulses travelling along edges
+        q = deque([(offsets[button], LOW)])
 
-def solve(input: str, repeat: int = 1000) -> int:
-    modules = parse(input)
+        while q:
+            e, pulse = q.popleft()
+            dest = targets[e]
 
-    count: defaultdict[Pulse, int] = defaultdict(int)
+            count[pulse] += 1
 
-    for _ in range(repeat):
-        q: Queue[tuple[Module, Module, Pulse]] = Queue()
-        q.put((Broadcaster(""), modules["broadcaster"], Pulse.Low))
+            kind = kinds[dest]
+            if kind == FLIP_FLOP:
+                if pulse == HIGH:
+                    continue
 
-        while not q.empty():
-            source, dest, pulse = q.get()
+                on[dest] ^= 1
+                out_pulse = HIGH if on[dest] else LOW
+            elif kind == CONJUNCTION:
+                high_inputs[dest] += pulse - memory[e]
+                memory[e] = pulse
 
-            count[pulse] += 1
+                out_pulse = LOW if high_inputs[dest] == inputs_count[dest] else HIGH
+            else:
+                out_pulse = pulse
 
-            for next_dest, next_pulse in dest.process_input(source, pulse):
-                q.put((dest, next_dest, next_pulse))
+            q.extend((f, out_pulse) for f in range(offsets[dest], offsets[dest + 1]))
 
-    return count[Pulse.Low] * count[Pulse.High]
+    return count[LOW] * count[HIGH]
 
 
 if __name__ == "__main__":
@@ -1,66 +1,33 @@
-from enum import Enum
+from aoc.grid import Grid
+from aoc.instrument import phase
 
+GARDEN_PLOT = ord(".")
 
-class Direction(Enum):
-    RIGHT = (0, 1)
-    DOWN = (1, 0)
-    LEFT = (0, -1)
-    UP = (-1, 0)
 
-
-class Tile(Enum):
-    ROCK = "#"
-    GARDEN_PLOT = "."
-
-
-type Position = tuple[int, int]
-type Grid = list[list[Tile]]
-
-
-def parse(input: str) -> tuple[Grid, Position]:
-    grid: list[list[Tile]] = []
-    starting_pos = -1, -1
-    for i, line in enumerate(input.splitlines()):
-        grid.append([])
-        for j, char in enumerate(line):
-            if char == "S":
-                starting_pos = i, j
-                char = "."
-
-            grid[i].append(Tile(char))
+@phase("parse")
+def parse(input: str) -> tuple[Grid, int]:
+    # rocks around the garden, to stay in it without bounds checks
+    grid = Grid.parse(input.replace("S", "."), pad="#")
+    starting_pos = grid.index(*divmod(input.replace("\n", "").index("S"), grid.width))
 
     return grid, starting_pos
 
 
-def get_neighbors(pos: Position, grid: Grid) -> list[Position]:
-    def is_in_grid(pos: Position, grid: Grid) -> bool:
-        i, j = pos
-        lines_count, cols_count = len(grid), len(grid[0])
-
-        return 0 <= i < lines_count and 0 <= j < cols_count
-
-    result = []
-    i, j = pos
-
-    for dir in Direction:
-        di, dj = dir.value
-
-        new_i, new_j = i + di, j + dj
-        new_pos = new_i, new_j
-
-        if is_in_grid(new_pos, grid) and grid[new_i][new_j] == Tile.GARDEN_PLOT:
-            result.append(new_pos)
-
-    return result
+def get_neighbors(pos: int, grid: Grid) -> list[int]:
+    return [
+        pos + offset
+        for offset in grid.offsets
+        if grid.data[pos + offset] == GARDEN_PLOT
+    ]
 
 
-def solve(input: str, steps = 64) -> int:
+def solve(input: str, steps=64) -> int:
     grid, starting_pos = parse(input)
 
     positions = {starting_pos}
 
     for _ in range(steps):
-        new_positions: set[Position] = set()
+        new_positions: set[int] = set()
 
         for pos in positions:
             new_positions.update(get_neighbors(pos, grid))
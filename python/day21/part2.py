@@ -1,67 +1,45 @@
-from enum import Enum
+from aoc.grid import Grid
+from aoc.instrument import phase
 
+GARDEN_PLOT = ord(".")
 
-class Direction(Enum):
-    RIGHT = (0, 1)
-    DOWN = (1, 0)
-    LEFT = (0, -1)
-    UP = (-1, 0)
-
-
-class Tile(Enum):
-    ROCK = "#"
-    GARDEN_PLOT = "."
-
+# tiles of the infinite garden around the starting one that the walk can reach
+REACHED_TILES = 2
 
 type Position = tuple[int, int]
-type Grid = list[list[Tile]]
-
-
-def parse(input: str) -> tuple[Grid, Position]:
-    grid: list[list[Tile]] = []
-    starting_pos = -1, -1
-    for i, line in enumerate(input.splitlines()):
-        grid.append([])
-        for j, char in enumerate(line):
-            if char == "S":
-                starting_pos = i, j
-                char = "."
-
-            grid[i].append(Tile(char))
 
-    return grid, starting_pos
-
-
-def get_tile(pos: Position, grid: Grid) -> Tile:
-    i, j = pos
-    lines_count, cols_count = len(grid), len(grid[0])
 
-    return grid[i % lines_count][j % cols_count]
+@phase("parse")
+def parse(input: str) -> tuple[Grid, int]:
+    """the garden and its neighboring tiles, as one grid surrounded by rocks"""
+    lines = input.replace("S", ".").splitlines()
+    repeat = 2 * REACHED_TILES + 1
+    tiled = "\n".join(line * repeat for _ in range(repeat) for line in lines)
 
+    grid = Grid.parse(tiled, pad="#")
 
-def get_neighbors(pos: Position, grid: Grid) -> list[Position]:
-    result = []
-    i, j = pos
+    i, j = divmod(input.replace("\n", "").index("S"), len(lines[0]))
+    shift = REACHED_TILES * len(lines)
+    starting_pos = grid.index(i + shift, j + shift)
 
-    for dir in Direction:
-        di, dj = dir.value
-
-        new_i, new_j = i + di, j + dj
-        new_pos = new_i, new_j
+    return grid, starting_pos
 
-        if get_tile(new_pos, grid) == Tile.GARDEN_PLOT:
-            result.append(new_pos)
 
-    return result
+def get_neighbors(pos: int, grid: Grid) -> list[int]:
+    return [
+        pos + offset
+        for offset in grid.offsets
+        if grid.data[pos + offset] == GARDEN_PLOT
+    ]
 
 
 def positions_after_steps(
-    starting_positions: list[Position], steps: int, grid: Grid
-) -> set[Position]:
+    starting_positions: list[int], steps: int, grid: Grid
+) -> set[int]:
     positions = set(starting_positions)
 
     for _ in range(steps):
-        new_positions: set[Position] = set()
+        new_positions: set[int] = set()
 
         for pos in positions:
             new_positions.update(get_neighbors(pos, grid))
@@ -76,14 +54,16 @@ def solve(input: str, steps=26501365) -> int:
 
     positions = positions_after_steps([starting_pos], 2 * 131 + 65, grid)
 
+    # the starting tile is (0, 0) but it's in the middle of the grid
+    shift = REACHED_TILES * 131
+    tiles_counts: dict[Position, int] = {}
+    for pos in positions:
+        i, j = grid.position(pos)
+        tile = (i - shift) // 131, (j - shift) // 131
+        tiles_counts[tile] = tiles_counts.get(tile, 0) + 1
+
     def filter(I, J):
-        return len(
-            set(
-                (i, j)
-                for i, j in positions
-                if (I * 131 <= i < (I + 1) * 131 and J * 131 <= j < (J + 1) * 131)
-            )
-        )
+        return tiles_counts.get((I, J), 0)
 
     assert (steps - 65) % 131 == 0
 
@@ -0,0 +1,32 @@
+from collections import Counter
+
+from day22.part2 import count_unsupported_bricks, get_support_data_after_fall, parse
+
+
+def solve(input: str) -> tuple[int, int]:
+    """bricks only fall once, for both parts"""
+    bricks = parse(input)
+    bricks, bricks_supported_by = get_support_data_after_fall(bricks)
+
+    supports_count = Counter(
+        brick for supported in bricks_supported_by.values() for brick in supported
+    )
+    safe_count = sum(
+        all(supports_count[b] != 1 for b in bricks_supported_by[brick])
+        for brick in bricks
+    )
+
+    falling_count = sum(
+        count_unsupported_bricks(removed_brick, bricks_supported_by)
+        for removed_brick in bricks
+    )
+
+    return safe_count, falling_count
+
+
+if __name__ == "__main__":
+    with open("./inputs/day22.txt", encoding="utf-8") as file:
+        input = file.read()
+
+    answers = solve(input)
+    print(f"{answers = }")
@@ -4,6 +4,9 @@ from typing import NamedTuple, override
 from itertools import product
 from functools import total_ordering
 
+from aoc.cache import memoize
+from aoc.instrument import phase
+
 
 class Vec2(NamedTuple):
     x: int = 0
@@ -61,6 +64,7 @@ class Brick(NamedTuple):
 FLOOR = Brick(Vec3(), Vec3())
 
 
+@phase("parse")
 def parse(input: str) -> list[Brick]:
     bricks = []
 
@@ -95,6 +99,8 @@ def get_max_with_args(table: dict[Brick, int]) -> tuple[int | None, list[Brick]]
 AfterFallData = tuple[list[Brick], dict[Brick, list[Brick]], dict[Brick, list[Brick]]]
 
 
+@phase("fall")
+@memoize
 def get_support_data_after_fall(bricks: list[Brick]) -> AfterFallData:
     bricks = sorted(bricks, key=lambda b: b.start.z)
     max_heights: dict[Vec2, tuple[int, Brick]] = defaultdict(lambda: (0, FLOOR))
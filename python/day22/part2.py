@@ -5,6 +5,9 @@ from itertools import product
 from functools import total_ordering
 from queue import Queue
 
+from aoc.cache import memoize
+from aoc.instrument import phase
+
 
 class Vec2(NamedTuple):
     x: int = 0
@@ -62,6 +65,7 @@ class Brick(NamedTuple):
 FLOOR = Brick(Vec3(), Vec3())
 
 
+@phase("parse")
 def parse(input: str) -> list[Brick]:
     bricks = []
 
@@ -96,6 +100,8 @@ def get_max_with_args(table: dict[Brick, int]) -> tuple[int | None, list[Brick]]
 AfterFallData = tuple[list[Brick], dict[Brick, list[Brick]]]
 
 
+@phase("fall")
+@memoize
 def get_support_data_after_fall(bricks: list[Brick]) -> AfterFallData:
     bricks = sorted(bricks, key=lambda b: b.start.z)
     max_heights: dict[Vec2, tuple[int, Brick]] = defaultdict(lambda: (0, FLOOR))
@@ -122,13 +128,15 @@ def get_support_data_after_fall(bricks: list[Brick]) -> AfterFallData:
     return bricks, bricks_supported_by
 
 
-def count_unsupported_bricks(removed_brick, bricks_supported_by):
-    supports_count = defaultdict(int)
+def count_unsupported_bricks(
+    removed_brick: Brick, bricks_supported_by: dict[Brick, list[Brick]]
+) -> int:
+    supports_count: defaultdict[Brick, int] = defaultdict(int)
     for u, neighbors in bricks_supported_by.items():
         for v in neighbors:
             supports_count[v] += 1
 
-    q = Queue()
+    q: Queue[Brick] = Queue()
     for u in bricks_supported_by[removed_brick]:
         q.put_nowait(u)
 
@@ -1,62 +1,40 @@
-from enum import Enum
+from aoc.geometry import DOWN, LEFT, RIGHT, UP
+from aoc.grid import Grid
+from aoc.instrument import phase
 
-
-class Direction(Enum):
-    LEFT = (0, 1)
-    DOWN = (1, 0)
-    RIGHT = (0, -1)
-    UP = (-1, 0)
-
-
-Tile = str
-Grid = list[list[Tile]]
-Node = tuple[int, int]
+# flat index in the padded grid
+Node = int
 Path = list[Node]
 
+FOREST = ord("#")
+# the only direction a slope can be left by
+SLOPES = {ord(">"): RIGHT, ord("v"): DOWN, ord("<"): LEFT, ord("^"): UP}
 
-def is_in_grid(i: int, j: int, grid: Grid) -> bool:
-    lines_count, cols_count = len(grid), len(grid[0])
-
-    return 0 <= i < lines_count and 0 <= j < cols_count
 
+def tile_possible_offsets(tile: int, grid: Grid) -> tuple[int, ...]:
+    if tile in SLOPES:
+        return (grid.offsets[SLOPES[tile]],)
 
-def tile_possible_directions(tile: Tile) -> list[Direction]:
-    if tile in "^>v<":
-        match tile:
-            case ">":
-                return [Direction.LEFT]
-            case "v":
-                return [Direction.DOWN]
-            case "<":
-                return [Direction.RIGHT]
-            case "^":
-                return [Direction.UP]
-
-    return list(Direction)
+    return grid.offsets
 
 
 def get_neighbors(u: Node, grid: Grid) -> list[Node]:
-    result = []
-    i, j = u
-
-    for dir in tile_possible_directions(grid[i][j]):
-        di, dj = dir.value
-
-        next_i = i + di
-        next_j = j + dj
-
-        if is_in_grid(next_i, next_j, grid) and grid[next_i][next_j] != "#":
-            result.append((next_i, next_j))
+    data = grid.data
 
-    return result
+    return [
+        u + offset
+        for offset in tile_possible_offsets(data[u], grid)
+        if data[u + offset] != FOREST
+    ]
 
 
+@phase("parse")
 def parse(input: str) -> tuple[Grid, Node, Node]:
-    grid = [list(line) for line in input.splitlines()]
+    # surrounded by forest, the start and end tiles can't be left by the border
+    grid = Grid.parse(input, pad="#")
 
-    lines_count = len(grid)
-    start = (0, grid[0].index("."))
-    end = (lines_count - 1, grid[-1].index("."))
+    start = grid.index(0, grid.row_bytes(0).index(b"."))
+    end = grid.index(grid.height - 1, grid.row_bytes(grid.height - 1).index(b"."))
 
     return grid, start, end
 
@@ -67,7 +45,7 @@ def get_all_simple_paths(start: Node, end: Node, grid: Grid) -> list[Path]:
     path = [start]
     visited = {start}
 
-    def explore(u: tuple[int, int]):
+    def explore(u: Node):
         if u == end:
             paths.append(path.copy())
             return
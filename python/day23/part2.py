@@ -1,62 +1,40 @@
-from enum import Enum
-from itertools import product
+from aoc.cache import memoize
+from aoc.graph import Graph
+from aoc.grid import Grid
+from aoc.instrument import phase
 
-
-class Direction(Enum):
-    LEFT = (0, 1)
-    DOWN = (1, 0)
-    RIGHT = (0, -1)
-    UP = (-1, 0)
-
-
-Tile = str
-Grid = list[list[Tile]]
-Node = tuple[int, int]
+# flat index in the padded grid
+Node = int
 Path = list[Node]
 
-
-def is_in_grid(i: int, j: int, grid: Grid) -> bool:
-    lines_count, cols_count = len(grid), len(grid[0])
-
-    return 0 <= i < lines_count and 0 <= j < cols_count
+FOREST = ord("#")
 
 
 def get_neighbors(u: Node, grid: Grid) -> list[Node]:
-    result = []
-    i, j = u
-
-    for dir in Direction:
-        di, dj = dir.value
-
-        next_i = i + di
-        next_j = j + dj
+    data = grid.data
 
-        if is_in_grid(next_i, next_j, grid) and grid[next_i][next_j] != "#":
-            result.append((next_i, next_j))
-
-    return result
+    return [u + offset for offset in grid.offsets if data[u + offset] != FOREST]
 
 
+@phase("parse")
 def parse(input: str) -> tuple[Grid, Node, Node]:
-    grid = [list(line) for line in input.splitlines()]
+    # surrounded by forest, the start and end tiles can't be left by the border
+    grid = Grid.parse(input, pad="#")
 
-    lines_count = len(grid)
-    start = (0, grid[0].index("."))
-    end = (lines_count - 1, grid[-1].index("."))
+    start = grid.index(0, grid.row_bytes(0).index(b"."))
+    end = grid.index(grid.height - 1, grid.row_bytes(grid.height - 1).index(b"."))
 
     return grid, start, end
 
 
-def get_simplified_graph(grid: Grid) -> dict[Node, dict[Node, int]]:
-    lines_count, cols_count = len(grid), len(grid[0])
-
+@phase("simplify")
+@memoize
+def get_simplified_graph(grid: Grid) -> Graph[Node]:
     neighbors_of: dict[Node, dict[Node, int]] = {}
-    for i, j in product(range(lines_count), range(cols_count)):
-        if grid[i][j] == "#":
+    for u in grid.indices():
+        if grid.data[u] == FOREST:
             continue
 
-        u = i, j
-
         neighbors_of[u] = {}
 
         for v in get_neighbors(u, grid):
@@ -75,37 +53,39 @@ def get_simplified_graph(grid: Grid) -> dict[Node, dict[Node, int]]:
         del neighbors_of[v1][u]
         del neighbors_of[v2][u]
 
-    return neighbors_of
+    return Graph.from_weighted_adjacency(neighbors_of)
 
 
-def get_longuest_simple_path_length(
-    start: Node, end: Node, neighbors_of: dict[Node, dict[Node, int]]
-) -> int:
+def get_longuest_simple_path_length(start: int, end: int, graph: Graph[Node]) -> int:
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    assert weights is not None
+
     max_length = -1
 
-    length = 0
-    visited = {start}
+    # a path reaching the junction before a dead end of an end must go there,
+    # or it can't reach the end anymore
+    if graph.degree(end) == 1:
+        e = offsets[end]
+        end, last_length = targets[e], weights[e]
+    else:
+        last_length = 0
 
-    def explore(u: tuple[int, int]):
-        nonlocal length, max_length
+    # the few dozen junctions fit a bitmask
+    def explore(u: int, visited: int, length: int):
+        nonlocal max_length
 
         if u == end:
-            max_length = max(max_length, length)
+            max_length = max(max_length, length + last_length)
             return
 
-        for v in neighbors_of[u]:
-            if v in visited:
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            if visited >> v & 1:
                 continue
 
-            visited.add(v)
-            length += neighbors_of[u][v]
-
-            explore(v)
-
-            length -= neighbors_of[u][v]
-            visited.remove(v)
+            explore(v, visited | 1 << v, length + weights[e])
 
-    explore(start)
+    explore(start, 1 << start, 0)
 
     return max_length
 
@@ -113,9 +93,9 @@ def get_longuest_simple_path_length(
 def solve(input: str) -> int:
     grid, start, end = parse(input)
 
-    neighbors_of = get_simplified_graph(grid)
+    graph = get_simplified_graph(grid)
 
-    return get_longuest_simple_path_length(start, end, neighbors_of)
+    return get_longuest_simple_path_length(graph.index[start], graph.index[end], graph)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,20 @@
+from __future__ import annotations
 from itertools import combinations
 
-import numpy as np
-from numpy.typing import NDArray
-from numpy.linalg import LinAlgError
+from aoc.instrument import phase
+from aoc.lazy import lazy_import
 
+# like `typing.TYPE_CHECKING`, without paying for importing `typing`
+TYPE_CHECKING = False
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+else:
+    np = lazy_import("numpy")
+
+
+@phase("parse")
 def parse(input: str) -> tuple[list[NDArray], list[NDArray]]:
     positions = []
     velocities = []
@@ -30,7 +40,7 @@ def solve(input: str, min: int = int(2e14), max: int = int(4e14)) -> int:
 
         try:
             t_a, t_b = np.linalg.solve(M, b - a)
-        except LinAlgError:
+        except np.linalg.LinAlgError:
             continue
 
         if t_a < 0 or t_b < 0:
@@ -1,10 +1,19 @@
+from __future__ import annotations
 from itertools import combinations
 
-import numpy as np
-from numpy.typing import NDArray
-from numpy.linalg import LinAlgError
+from aoc.instrument import phase
+from aoc.lazy import lazy_import
 
+TYPE_CHECKING = False
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+else:
+    np = lazy_import("numpy")
+
+
+@phase("parse")
 def parse(input: str) -> tuple[list[NDArray], list[NDArray]]:
     positions = []
     velocities = []
@@ -46,7 +55,7 @@ def solve(input: str) -> int:
 
         try:
             X = np.linalg.solve(M, Y)
-        except LinAlgError:
+        except np.linalg.LinAlgError:
             continue
 
         # p, v_p = X[:3], X[3:]
@@ -1,30 +1,84 @@
-import networkx as nx
+from array import array
+from collections import deque
 
+from aoc.graph import Graph
+from aoc.instrument import phase
 
-def parse(input: str):
-    G = nx.Graph()
+CUT_SIZE = 3
+
+
+@phase("parse")
+def parse(input: str) -> Graph[str]:
+    edges: list[tuple[str, str]] = []
 
     for line in input.splitlines():
         left, _, right = line.partition(": ")
         source = left
         dests = [node for node in right.split()]
 
-        for dest in dests:
-            G.add_edge(source, dest)
+        edges.extend((source, dest) for dest in dests)
+
+    return Graph.from_edges(edges, undirected=True)
+
+
+def get_source_side(
+    graph: Graph[str], reverse: array[int], source: int, sink: int, cut_size: int
+) -> bytearray | None:
+    """nodes on the source side of a minimum cut between `source` and `sink`,
+    if it has `cut_size` edges
+
+    finds edge-disjoint paths with BFS (Edmonds-Karp with unit capacities), the
+    nodes still reachable once there are no more are the source side
+    """
+    offsets, targets = graph.offsets, graph.targets
+
+    # each direction of an edge carries 1, pushing flow back cancels it
+    flow = array("b", bytes(graph.edges_count))
+
+    for paths_count in range(cut_size + 1):
+        # edge each node was reached by
+        parents = array("l", [-1]) * len(graph)
+        reached = bytearray(len(graph))
+        reached[source] = 1
+        q = deque([source])
+
+        while q and not reached[sink]:
+            u = q.popleft()
+
+            for e in range(offsets[u], offsets[u + 1]):
+                v = targets[e]
+                if not reached[v] and flow[e] < 1:
+                    reached[v] = 1
+                    parents[v] = e
+                    q.append(v)
+
+        if not reached[sink]:
+            return reached if paths_count == cut_size else None
+
+        v = sink
+        while v != source:
+            e = parents[v]
+            flow[e] += 1
+            flow[reverse[e]] -= 1
+            v = targets[reverse[e]]
 
-    return G
+    return None
 
 
 def solve(input: str) -> int:
-    G = parse(input)
+    graph = parse(input)
+    reverse = graph.reverse_edges()
 
-    # https://en.wikipedia.org/wiki/Stoer%E2%80%93Wagner_algorithm
-    cut_value, partition = nx.stoer_wagner(G)
+    source = 0
+    # the farthest nodes are the likeliest to be on the other side of the cut
+    for sink in reversed(list(graph.bfs(source))):
+        source_side = get_source_side(graph, reverse, source, sink, CUT_SIZE)
 
-    assert cut_value == 3
-    nodes_a, nodes_b = partition
+        if source_side is not None:
+            size = sum(source_side)
+            return size * (len(graph) - size)
 
-    return len(nodes_a) * len(nodes_b)
+    raise RuntimeError
 
 
 if __name__ == "__main__":
@@ -0,0 +1,54 @@
+import pytest
+
+from day01 import part1, part2
+
+INPUT_1 = b"""1abc2
+pqr3stu8vwx
+a1b2c3d4e5f
+treb7uchet
+"""
+
+
+@pytest.mark.parametrize("solve", [part1.solve, part1.solve_numpy])
+def test_part1(solve):
+    assert solve(INPUT_1) == 142
+    assert solve(INPUT_1.rstrip(b"\n")) == 142
+
+
+def test_part1_superscripts_arent_digits():
+    assert (
+        part1.solve(b"1\xb2\xb3\xb92\n") == part1.solve_numpy(b"1\xb2\xb3\xb92\n") == 12
+    )
+
+
+@pytest.mark.parametrize(
+    "input", [b"a1b2\nxyz\nc3d\n", b"a1b2\n\nc3d\n", b"a1b2\n\xb2\n", b"a1b2\nc3d\nxyz"]
+)
+@pytest.mark.parametrize("solve", [part1.solve, part1.solve_numpy])
+def test_part1_line_without_digit(solve, input):
+    with pytest.raises(ValueError, match="no digit in line"):
+        solve(input)
+
+
+INPUT_2 = b"""two1nine
+eightwothree
+abcone2threexyz
+xtwone3four
+4nineeightseven2
+zoneight234
+7pqrstsixteen
+"""
+
+
+@pytest.mark.parametrize("solve", [part2.solve, part2.solve_numpy])
+def test_part2(solve):
+    assert solve(INPUT_2) == 281
+    # overlapping words
+    assert solve(b"oneight\n") == 18
+
+
+@pytest.mark.parametrize("input", [b"one\nxyz\ntwo\n", b"one\n\ntwo\n", b"one\nxyz"])
+@pytest.mark.parametrize("solve", [part2.solve, part2.solve_numpy])
+def test_part2_line_without_digit(solve, input):
+    with pytest.raises(ValueError, match="no digit or digit word in line"):
+        solve(input)
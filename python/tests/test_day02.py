@@ -0,0 +1,51 @@
+import pytest
+
+from day02 import both, part1, part2
+
+GAMES = b"""Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
+Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue
+Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red
+Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red
+Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green
+"""
+
+BAG: part1.Bag = {"red": 12, "green": 13, "blue": 14}
+
+
+@pytest.mark.parametrize("newline", [b"", b"\n", b"\r\n"])
+def test_parse_game_newlines(newline):
+    game = part1.parse_game(
+        b"Game 12: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green" + newline
+    )
+
+    assert game.id == 12
+    assert list(game.counts) == [4, 0, 3, 1, 2, 6, 0, 2, 0]
+
+
+@pytest.mark.parametrize(
+    "line, offset",
+    [
+        (b"Game 1: 3 red \n", 13),
+        (b"Game 1: 3 red \r\n", 13),
+        (b"Game 1: 3 red\r", 13),
+        (b"Game 1: 3 red\n\n", 13),
+        (b"Game 1: 3 red\t", 13),
+        (b"Game 1: 3  red", 10),
+        (b"Game 1: 3 gren", 13),
+        (b"Game 1: 3 red,", 14),
+        (b"Game 1:3 red", 7),
+        (b"Gam", 3),
+        (b"", 0),
+    ],
+)
+def test_parse_game_malformed(line, offset):
+    with pytest.raises(ValueError, match=f"at offset {offset}:"):
+        part1.parse_game(line)
+
+
+def test_solve_crlf():
+    crlf = GAMES.replace(b"\n", b"\r\n")
+
+    assert part1.solve(GAMES, BAG) == part1.solve(crlf, BAG) == 8
+    assert part2.solve(GAMES) == part2.solve(crlf) == 2286
+    assert both.solve(crlf, BAG) == (8, 2286)
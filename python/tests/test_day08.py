@@ -0,0 +1,34 @@
+import pytest
+
+from day08 import part1, part2
+
+INPUT_1 = """LLR
+
+AAA = (BBB, BBB)
+BBB = (AAA, ZZZ)
+ZZZ = (ZZZ, ZZZ)
+"""
+
+INPUT_2 = """LR
+
+11A = (11B, XXX)
+11B = (XXX, 11Z)
+11Z = (11B, XXX)
+22A = (22B, XXX)
+22B = (22C, 22C)
+22C = (22Z, 22Z)
+22Z = (22B, 22B)
+XXX = (XXX, XXX)
+"""
+
+
+@pytest.mark.parametrize("newline", ["", "\n"])
+def test_solve_trailing_newline(newline):
+    assert part1.solve(INPUT_1.rstrip("\n") + newline) == 6
+    assert part2.solve(INPUT_2.rstrip("\n") + newline) == 6
+
+
+@pytest.mark.parametrize("parse", [part1.parse, part2.parse])
+def test_parse_malformed_node(parse):
+    with pytest.raises(ValueError, match="malformed node line 'BBB = AAA, ZZZ'"):
+        parse(INPUT_1.replace("BBB = (AAA, ZZZ)", "BBB = AAA, ZZZ"))
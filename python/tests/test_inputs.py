@@ -0,0 +1,122 @@
+import mmap
+
+import pytest
+
+from aoc.inputs import (
+    MappedInput,
+    chunk_bounds,
+    iter_lines,
+    line_offsets,
+    strip_newlines,
+    to_bytes,
+)
+
+
+@pytest.fixture
+def write_input(tmp_path):
+    def write(data: bytes):
+        path = tmp_path / "input.txt"
+        path.write_bytes(data)
+        return path
+
+    return write
+
+
+def test_mapped_input(write_input):
+    with MappedInput(write_input(b"ab\ncde\n\nf")) as input:
+        assert isinstance(input.data, mmap.mmap)
+        assert len(input) == 9
+        assert [bytes(input.line(k)) for k in range(4)] == [b"ab", b"cde", b"", b"f"]
+
+    assert input.data.closed
+
+
+def test_mapped_input_empty(write_input):
+    with MappedInput(write_input(b"")) as input:
+        assert input.data == b""
+        assert list(input.line_offsets) == [0]
+
+
+@pytest.mark.parametrize(
+    "data, offsets",
+    [
+        (b"", [0]),
+        (b"ab\ncde\n", [0, 3, 7]),
+        (b"ab\ncde", [0, 3, 7]),
+        (b"ab\n\n", [0, 3, 4]),
+        (b"ab\r\ncde\r\n", [0, 4, 9]),
+    ],
+)
+def test_line_offsets(data, offsets):
+    assert list(line_offsets(data)) == offsets
+
+
+@pytest.mark.parametrize(
+    "data", [b"ab\r\ncd\r\n", "ab\r\ncd\r\n", bytearray(b"ab\r\ncd\r\n")]
+)
+def test_to_bytes_crlf(data):
+    assert to_bytes(data) == b"ab\ncd\n"
+
+
+def test_to_bytes_lf_isnt_copied():
+    data = b"ab\ncd\n"
+
+    assert to_bytes(data) is data
+
+
+def test_to_bytes_bytearray():
+    data = to_bytes(bytearray(b"ab\ncd"))
+
+    assert type(data) is bytes
+    assert all(type(line) is bytes for line in iter_lines(data))
+
+
+@pytest.mark.parametrize(
+    "data, lines",
+    [
+        (b"", []),
+        (b"ab\ncd\n", [b"ab", b"cd"]),
+        (b"ab\ncd", [b"ab", b"cd"]),
+        (b"ab\n\ncd\n", [b"ab", b"", b"cd"]),
+    ],
+)
+def test_iter_lines(data, lines):
+    assert list(iter_lines(data)) == lines
+
+
+def test_strip_newlines():
+    assert list(strip_newlines([b"ab\r\n", b"cd\n", b"ef"])) == [b"ab", b"cd", b"ef"]
+
+
+def check_chunks(data, bounds):
+    # contiguous, non-empty and cut after newlines
+    assert all(start < end for start, end in bounds)
+    assert [end for _, end in bounds[:-1]] == [start for start, _ in bounds[1:]]
+    assert all(data[end - 1 : end] == b"\n" for _, end in bounds[:-1])
+    assert b"".join(data[start:end] for start, end in bounds) == data
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 8])
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"ab\ncd\nef\ngh\n",
+        b"ab\ncd\nef\ngh",
+        b"ab\r\ncd\r\nef\r\ngh\r\n",
+        b"abcdefgh\n",
+    ],
+)
+def test_chunk_bounds(data, count):
+    bounds = chunk_bounds(data, count)
+
+    check_chunks(data, bounds)
+    assert len(bounds) <= count
+
+
+def test_chunk_bounds_more_chunks_than_lines():
+    data = b"ab\ncd\n"
+    bounds = chunk_bounds(data, 16)
+
+    check_chunks(data, bounds)
+    assert bounds == [(0, 3), (3, 6)]
@@ -0,0 +1,121 @@
+import pytest
+
+from aoc.intervals import Interval, IntervalSet
+
+EMPTY = IntervalSet()
+
+
+def test_from_intervals_merges():
+    intervals = IntervalSet.from_intervals([(5, 8), (0, 2), (2, 3), (7, 10), (4, 4)])
+
+    # touching intervals merge, empty ones vanish
+    assert list(intervals) == [Interval(0, 3), Interval(5, 10)]
+    assert intervals.size == 8
+    assert IntervalSet.of(3, 3) == EMPTY
+
+
+def test_contains():
+    intervals = IntervalSet.from_intervals([(0, 3), (5, 10)])
+
+    assert [value in intervals for value in range(-1, 11)] == [
+        False,
+        *[True] * 3,
+        *[False] * 2,
+        *[True] * 5,
+        False,
+    ]
+
+
+@pytest.mark.parametrize(
+    "a, b, union",
+    [
+        ([(0, 3)], [(5, 8)], [(0, 3), (5, 8)]),
+        ([(0, 3)], [(3, 8)], [(0, 8)]),
+        ([(0, 5)], [(2, 8)], [(0, 8)]),
+        ([(0, 10)], [(2, 3), (5, 6)], [(0, 10)]),
+        ([(0, 3)], [], [(0, 3)]),
+        ([], [], []),
+    ],
+)
+def test_union(a, b, union):
+    a, b = IntervalSet.from_intervals(a), IntervalSet.from_intervals(b)
+    union = IntervalSet.from_intervals(union)
+
+    assert a | b == b | a == union
+
+
+@pytest.mark.parametrize(
+    "a, b, intersection",
+    [
+        ([(0, 3)], [(5, 8)], []),
+        ([(0, 3)], [(3, 8)], []),
+        ([(0, 5)], [(2, 8)], [(2, 5)]),
+        ([(0, 10)], [(2, 3), (5, 6)], [(2, 3), (5, 6)]),
+        ([(0, 3), (4, 8)], [(2, 5)], [(2, 3), (4, 5)]),
+        ([(0, 3)], [], []),
+    ],
+)
+def test_intersection(a, b, intersection):
+    a, b = IntervalSet.from_intervals(a), IntervalSet.from_intervals(b)
+    intersection = IntervalSet.from_intervals(intersection)
+
+    assert a & b == b & a == intersection
+
+
+@pytest.mark.parametrize(
+    "a, b, difference",
+    [
+        ([(0, 3)], [(5, 8)], [(0, 3)]),
+        ([(0, 3)], [(3, 8)], [(0, 3)]),
+        ([(0, 5)], [(2, 8)], [(0, 2)]),
+        ([(0, 10)], [(2, 3), (5, 6)], [(0, 2), (3, 5), (6, 10)]),
+        ([(2, 3)], [(0, 10)], []),
+        ([(0, 3)], [], [(0, 3)]),
+        ([], [(0, 3)], []),
+    ],
+)
+def test_difference(a, b, difference):
+    a, b = IntervalSet.from_intervals(a), IntervalSet.from_intervals(b)
+
+    assert a - b == IntervalSet.from_intervals(difference)
+
+
+@pytest.mark.parametrize(
+    "start, end, clipped",
+    [
+        (-5, 20, [(0, 3), (5, 10)]),
+        (1, 7, [(1, 3), (5, 7)]),
+        (3, 5, []),
+        (0, 3, [(0, 3)]),
+        (2, 2, []),
+        (7, 1, []),
+    ],
+)
+def test_clip(start, end, clipped):
+    intervals = IntervalSet.from_intervals([(0, 3), (5, 10)])
+
+    assert intervals.clip(start, end) == IntervalSet.from_intervals(clipped)
+
+
+@pytest.mark.parametrize(
+    "value, below, above",
+    [
+        (-1, [], [(0, 3), (5, 10)]),
+        (0, [], [(0, 3), (5, 10)]),
+        (2, [(0, 2)], [(2, 3), (5, 10)]),
+        (3, [(0, 3)], [(5, 10)]),
+        (4, [(0, 3)], [(5, 10)]),
+        (10, [(0, 3), (5, 10)], []),
+    ],
+)
+def test_split(value, below, above):
+    intervals = IntervalSet.from_intervals([(0, 3), (5, 10)])
+
+    assert intervals.split(value) == (
+        IntervalSet.from_intervals(below),
+        IntervalSet.from_intervals(above),
+    )
+
+
+def test_split_empty():
+    assert EMPTY.split(3) == (EMPTY, EMPTY)
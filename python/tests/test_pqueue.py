@@ -0,0 +1,119 @@
+import pytest
+
+from aoc.pqueue import QUEUES, BucketQueue, IndexedHeap
+
+
+def pop_all(queue):
+    popped = []
+    while queue:
+        popped.append(queue.pop())
+
+    return popped
+
+
+@pytest.mark.parametrize("queue_type", QUEUES.values(), ids=QUEUES.keys())
+def test_pop_order(queue_type):
+    queue = queue_type()
+    for node, priority in [("a", 5), ("b", 1), ("c", 3), ("d", 1), ("e", 8)]:
+        queue.push(node, priority)
+
+    assert len(queue) == 5
+    assert "c" in queue
+
+    popped = pop_all(queue)
+
+    assert [priority for _, priority in popped] == [1, 1, 3, 5, 8]
+    assert {node for node, _ in popped[:2]} == {"b", "d"}
+    assert [node for node, _ in popped[2:]] == ["c", "a", "e"]
+    assert "c" not in queue
+
+
+@pytest.mark.parametrize("queue_type", QUEUES.values(), ids=QUEUES.keys())
+def test_push_changes_priority(queue_type):
+    queue = queue_type()
+    queue.push("a", 5)
+    queue.push("b", 3)
+    queue.push("a", 1)
+    queue.push("b", 7)
+
+    assert len(queue) == 2
+    assert pop_all(queue) == [("a", 1), ("b", 7)]
+
+
+@pytest.mark.parametrize("queue_type", QUEUES.values(), ids=QUEUES.keys())
+def test_remove(queue_type):
+    queue = queue_type()
+    for node, priority in [("a", 2), ("b", 1), ("c", 3)]:
+        queue.push(node, priority)
+
+    queue.remove("b")
+
+    assert "b" not in queue
+    assert pop_all(queue) == [("a", 2), ("c", 3)]
+
+
+@pytest.mark.parametrize("queue_type", QUEUES.values(), ids=QUEUES.keys())
+def test_pop_empty(queue_type):
+    queue = queue_type()
+    queue.push("a", 1)
+    queue.pop()
+
+    with pytest.raises(KeyError):
+        queue.pop()
+
+
+def test_indexed_heap_decrease_key():
+    heap = IndexedHeap()
+    for node in range(20):
+        heap.push(node, 100 + node)
+
+    heap.push(15, 3)
+    heap.push(7, 4)
+    heap.push(2, 200)
+
+    assert heap.priority(15) == 3
+    assert heap.pop() == (15, 3)
+    assert heap.pop() == (7, 4)
+
+    popped = pop_all(heap)
+
+    assert popped[-1] == (2, 200)
+    assert [priority for _, priority in popped] == sorted(
+        priority for _, priority in popped
+    )
+
+
+def test_indexed_heap_remove():
+    heap = IndexedHeap()
+    for node in range(20):
+        heap.push(node, (node * 7) % 20)
+
+    # the root, a leaf and inner nodes, whose hole the last entry fills
+    for node in [0, 19, 6, 13]:
+        heap.remove(node)
+        assert node not in heap
+
+    with pytest.raises(KeyError):
+        heap.remove(0)
+
+    popped = pop_all(heap)
+
+    assert len(popped) == 16
+    assert [priority for _, priority in popped] == sorted(
+        (node * 7) % 20 for node in range(20) if node not in {0, 19, 6, 13}
+    )
+
+
+def test_bucket_queue_below_cursor():
+    queue = BucketQueue()
+    queue.push("a", 2)
+    queue.push("b", 4)
+
+    assert queue.pop() == ("a", 2)
+
+    # the popped priority itself is still allowed
+    queue.push("c", 2)
+    with pytest.raises(ValueError, match="priority 1 is below the last popped one"):
+        queue.push("d", 1)
+
+    assert pop_all(queue) == [("c", 2), ("b", 4)]
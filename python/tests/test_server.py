@@ -0,0 +1,73 @@
+import http.client
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from aoc.registry import Solution
+from aoc.server import Client, SolveServer, init_worker
+
+DAY01 = "1abc2\npqr3stu8vwx\na1b2c3d4e5f\ntreb7uchet\n"
+DAY08 = "LLR\n\nAAA = (BBB, BBB)\nBBB = (AAA, ZZZ)\nZZZ = (ZZZ, ZZZ)\n"
+
+
+@pytest.fixture(scope="module")
+def port():
+    with ProcessPoolExecutor(1, initializer=init_worker) as executor:
+        # forks the worker before the server thread starts, as `serve` does
+        executor.submit(int).result()
+
+        # port 0 lets the OS pick a free one
+        with SolveServer(("127.0.0.1", 0), executor) as server:
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+
+            yield server.server_port
+
+            server.shutdown()
+            thread.join()
+
+
+def request(port, method, path, body=None):
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    try:
+        connection.request(method, path, body)
+        response = connection.getresponse()
+
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_solve(port, newline):
+    with Client("127.0.0.1", port) as client:
+        # a buffer day, then a day solving the decoded text
+        result = client.solve(Solution(1, 1), DAY01.replace("\n", newline))
+        assert (result.solution, result.answer) == (Solution(1, 1), 142)
+        assert result.time_ns > 0
+
+        result = client.solve(Solution(8, 1), DAY08.replace("\n", newline))
+        assert result.answer == 6
+
+        assert "day01/part1" in client.solutions()
+
+
+@pytest.mark.parametrize(
+    "method, path, error",
+    [
+        ("POST", "/solve/99/1", "no solution day99/part1"),
+        ("POST", "/solve/1", "unknown path /solve/1"),
+        ("GET", "/solve/1/1", "unknown path /solve/1/1"),
+    ],
+)
+def test_unknown_path(port, method, path, error):
+    assert request(port, method, path, b"") == (404, {"error": error})
+
+
+def test_bad_input(port):
+    status, body = request(port, "POST", "/solve/8/1", b"LLR\n\nAAA = BBB\n")
+
+    assert status == 422
+    assert body == {"error": "ValueError: malformed node line 'AAA = BBB'"}